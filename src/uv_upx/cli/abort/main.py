@@ -0,0 +1,26 @@
+import pathlib  # noqa: TC003
+from typing import Annotated
+
+import typer
+
+from uv_upx.services.normalize_paths import normalize_and_check_path_to_project_root
+
+
+def abort(
+    *,
+    project_root_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--project",
+            "-p",
+            help="Path to project root directory. Use current working directory if not specified.",
+        ),
+    ] = None,
+) -> None:
+    """Roll back the run, killed in the middle. By its journal in the .uv-upx directory.
+
+    Original pyproject.toml files, uv.lock and the environment are restored.
+    """
+    from uv_upx.services.updater import abort_updater  # noqa: PLC0415
+
+    abort_updater(normalize_and_check_path_to_project_root(project_root_path))
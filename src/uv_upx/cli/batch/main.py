@@ -0,0 +1,155 @@
+import pathlib  # noqa: TC003
+from typing import Annotated
+
+import typer
+
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+
+def batch(  # noqa: PLR0913
+    *,
+    roots: Annotated[
+        list[pathlib.Path],
+        typer.Argument(
+            help="Directories to search for projects. Recursively. "
+            "Each directory with both pyproject.toml and uv.lock is a separate project.",
+        ),
+    ],
+    #
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show changes as unified diffs in the logs of projects. Nothing is written",
+        ),
+    ] = False,
+    #
+    preserve_original_package_names: Annotated[
+        bool,
+        typer.Option("--preserve-original-package-names", help="Preserve original package names in pyproject.toml"),
+    ] = False,
+    #
+    no_sync: Annotated[
+        bool,
+        typer.Option("--no-sync", help="Do not run uv-sync."),
+    ] = False,
+    venv_snapshot: Annotated[
+        bool,
+        typer.Option(
+            "--venv-snapshot",
+            help="Snapshot the environment with hardlinks before syncing. "
+            "On rollback, swap it back instead of re-syncing. For big environments.",
+        ),
+    ] = False,
+    #
+    profile: Annotated[
+        UpgradeProfile | None,
+        typer.Option(
+            "--profile",
+            help="Which profile to use when upgrading dependencies. (Experimental feature)",
+        ),
+    ] = None,
+    #
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of projects to update at the same time. Use 0 for all available CPUs.",
+            min=0,
+        ),
+    ] = 0,
+    #
+    uv_cache_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--uv-cache-dir",
+            help="Cache directory of uv, shared by all projects. The default cache of uv is used, if not specified.",
+        ),
+    ] = None,
+    #
+    packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--package",
+            help="Upgrade only this package. Can be repeated. Globs are supported, like 'my-company-*'.",
+        ),
+    ] = None,
+    exclude_packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude-package",
+            help="Don't upgrade this package. Can be repeated. Globs are supported.",
+        ),
+    ] = None,
+    #
+    bisect: Annotated[
+        bool,
+        typer.Option(
+            "--bisect",
+            help="If upgraded dependencies fail to lock or sync, find failing packages by bisecting. "
+            "Keep all compatible upgrades.",
+        ),
+    ] = False,
+    #
+    lock_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--lock-timeout",
+            help="Seconds for each 'uv lock'. If it takes longer, it is stopped and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+    sync_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--sync-timeout",
+            help="Seconds for each 'uv sync'. If it takes longer, it is stopped and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+    max_duration: Annotated[
+        float | None,
+        typer.Option(
+            "--max-duration",
+            help="Seconds for each project. uv commands are stopped to fit in, and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+) -> None:
+    """Update all uv projects in the directories. Exit with code 1, if any of them failed.
+
+    Each project is updated in a separate process. Its output is written into `.uv-upx/batch.log` of the project.
+    """
+    from uv_upx.services.batch import BatchOptions, discover_projects, render_batch_report, run_batch  # noqa: PLC0415
+    from uv_upx.services.package_filter import PackageFilter  # noqa: PLC0415
+
+    results = run_batch(
+        discover_projects(roots),
+        options=BatchOptions(
+            dry_run=dry_run,
+            no_sync=no_sync,
+            venv_snapshot=venv_snapshot,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            profile=profile or UpgradeProfile.get_default(),
+            #
+            package_filter=PackageFilter.from_patterns(include=packages, exclude=exclude_packages),
+            #
+            bisect=bisect,
+            #
+            uv_cache_dir=uv_cache_dir.resolve() if uv_cache_dir is not None else None,
+            #
+            lock_timeout_seconds=lock_timeout,
+            sync_timeout_seconds=sync_timeout,
+            max_duration_seconds=max_duration,
+        ),
+        #
+        jobs=jobs,
+    )
+
+    print("\n".join(render_batch_report(results)))
+
+    if any(result.is_failed for result in results):
+        raise typer.Exit(code=1)
@@ -0,0 +1,134 @@
+import logging
+import pathlib  # noqa: TC003
+from typing import Annotated, Final
+
+import typer
+
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.normalize_paths import normalize_and_check_path_to_project_root
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+EXIT_CODE_I_OUTDATED: Final[int] = 1
+EXIT_CODE_I_CHECK_FAILED: Final[int] = 2
+
+
+def check(  # noqa: PLR0913
+    *,
+    project_root_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--project",
+            "-p",
+            help="Path to project root directory. Use current working directory if not specified.",
+        ),
+    ] = None,
+    #
+    preserve_original_package_names: Annotated[
+        bool,
+        typer.Option("--preserve-original-package-names", help="Preserve original package names in pyproject.toml"),
+    ] = False,
+    #
+    profile: Annotated[
+        UpgradeProfile | None,
+        typer.Option(
+            "--profile",
+            help="Which profile to use when upgrading dependencies. (Experimental feature)",
+        ),
+    ] = None,
+    #
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of workers for loading workspace members. Use 0 for all available CPUs.",
+            min=0,
+        ),
+    ] = 1,
+    executor: Annotated[
+        ExecutorKind | None,
+        typer.Option(
+            "--executor",
+            help="Which workers to use with --jobs. Threads for I/O-bound, processes for CPU-bound parsing.",
+        ),
+    ] = None,
+    #
+    use_discovery_cache: Annotated[
+        bool,
+        typer.Option(
+            "--discovery-cache",
+            help="Cache resolved workspace members in the .uv-upx directory. "
+            "Invalidated when directories, traversed by the workspace globs, change.",
+        ),
+    ] = False,
+    #
+    packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--package",
+            help="Check only this package. Can be repeated. Globs are supported, like 'my-company-*'.",
+        ),
+    ] = None,
+    exclude_packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude-package",
+            help="Don't check this package. Can be repeated. Globs are supported.",
+        ),
+    ] = None,
+    #
+    lock_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--lock-timeout",
+            help="Seconds for 'uv lock'. If it takes longer, it is stopped and the check fails.",
+            min=0,
+        ),
+    ] = None,
+    max_duration: Annotated[
+        float | None,
+        typer.Option(
+            "--max-duration",
+            help="Seconds for the whole check. uv commands are stopped to fit in.",
+            min=0,
+        ),
+    ] = None,
+) -> None:
+    """Check if top-level dependencies can be upgraded. Exit with code 1, if so.
+
+    Exit with code 2, if the check itself failed. Like a timeout, a failed `uv lock` or an invalid pyproject.toml.
+
+    Nothing is written and the environment is not synced. For CI gates.
+    """
+    from uv_upx.services.outdated_check import render_check_report, run_check  # noqa: PLC0415
+    from uv_upx.services.package_filter import PackageFilter  # noqa: PLC0415
+    from uv_upx.services.time_limits import apply_time_limits  # noqa: PLC0415
+
+    project_root_path = normalize_and_check_path_to_project_root(project_root_path)
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        with apply_time_limits(lock_timeout_seconds=lock_timeout, max_duration_seconds=max_duration):
+            changes = run_check(
+                project_root_path=project_root_path,
+                #
+                preserve_original_package_names=preserve_original_package_names,
+                #
+                profile=profile or UpgradeProfile.get_default(),
+                #
+                jobs=jobs,
+                executor_kind=executor or ExecutorKind.get_default(),
+                #
+                use_discovery_cache=use_discovery_cache,
+                #
+                package_filter=PackageFilter.from_patterns(include=packages, exclude=exclude_packages),
+            )
+    except Exception as e:  # noqa: BLE001
+        # Note: Not the same code as for outdated dependencies. So, CI gates can tell them apart.
+        logger.error(f"Check failed: '{type(e)}:{e}'")  # noqa: TRY400
+        raise typer.Exit(code=EXIT_CODE_I_CHECK_FAILED) from None
+
+    if changes:
+        print("\n".join(render_check_report(changes, project_root_path=project_root_path)))
+        raise typer.Exit(code=EXIT_CODE_I_OUTDATED)
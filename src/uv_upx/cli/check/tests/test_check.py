@@ -0,0 +1,37 @@
+from typing import TYPE_CHECKING
+
+from typer.testing import CliRunner
+
+import uv_upx.services.outdated_check
+from uv_upx.cli.check.main import EXIT_CODE_I_CHECK_FAILED, EXIT_CODE_I_OUTDATED
+from uv_upx.cli.main import app
+from uv_upx.services.run_uv_related import UvCommandTimeoutError
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+    from uv_upx.services.dependency_up import ChangesList
+
+
+def fail_on_timeout(**_kwargs: object) -> ChangesList:
+    msg = "'uv lock' didn't finish in 1s. It is stopped."
+    raise UvCommandTimeoutError(msg)
+
+
+def test_check_i_failure_has_its_own_exit_code(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(uv_upx.services.outdated_check, "run_check", fail_on_timeout)
+
+    result = CliRunner().invoke(app, ["check", "--project", str(tmp_path)])
+
+    assert result.exit_code == EXIT_CODE_I_CHECK_FAILED != EXIT_CODE_I_OUTDATED
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_check_i_without_uv_lock(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "foo"\n', encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["check", "--project", str(tmp_path)])
+
+    assert result.exit_code == EXIT_CODE_I_CHECK_FAILED
@@ -3,14 +3,14 @@ from typing import Annotated
 
 import typer
 
-from uv_upx.services.collect_top_level_dependencies.collect_top_level_dependencies import collect_top_level_dependencies
+from uv_upx.services.concurrency import ExecutorKind
 from uv_upx.services.normalize_paths import normalize_and_check_path_to_project_root
 
 app = typer.Typer()
 
 
 @app.command()
-def collect_top_level_dependencies_from_project(
+def collect_top_level_dependencies_from_project(  # noqa: PLR0913
     *,
     project_root_path: Annotated[
         pathlib.Path | None,
@@ -32,12 +32,51 @@ def collect_top_level_dependencies_from_project(
         bool,
         typer.Option("--preserve-original-package-names", help="Preserve original package names in pyproject.toml"),
     ] = False,
+    #
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of workers for loading workspace members. Use 0 for all available CPUs.",
+            min=0,
+        ),
+    ] = 1,
+    executor: Annotated[
+        ExecutorKind | None,
+        typer.Option(
+            "--executor",
+            help="Which workers to use with --jobs. Threads for I/O-bound, processes for CPU-bound parsing.",
+        ),
+    ] = None,
+    #
+    use_discovery_cache: Annotated[
+        bool,
+        typer.Option(
+            "--discovery-cache",
+            help="Cache resolved workspace members in the .uv-upx directory. "
+            "Invalidated when directories, traversed by the workspace globs, change.",
+        ),
+    ] = False,
 ) -> None:
     """Collect top-level dependencies from the project."""
+    from uv_upx.services.collect_top_level_dependencies.collect_top_level_dependencies import (  # noqa: PLC0415
+        collect_top_level_dependencies,
+    )
+    from uv_upx.services.workspace_snapshot import build_workspace_snapshot  # noqa: PLC0415
+
+    workspace_snapshot = build_workspace_snapshot(
+        normalize_and_check_path_to_project_root(project_root_path),
+        #
+        preserve_original_package_names=preserve_original_package_names,
+        #
+        jobs=jobs,
+        executor_kind=executor or ExecutorKind.get_default(),
+        #
+        use_discovery_cache=use_discovery_cache,
+    )
     collect_top_level_dependencies(
-        project_root_path=normalize_and_check_path_to_project_root(project_root_path),
+        workspace_snapshot=workspace_snapshot,
         #
         only_special_cases=only_special_cases,
-        #
-        preserve_original_package_names=preserve_original_package_names,
     )
@@ -1,6 +1,10 @@
 import typer
 
+from uv_upx.cli.abort.main import abort
+from uv_upx.cli.batch.main import batch
+from uv_upx.cli.check.main import check
 from uv_upx.cli.helpers.main import app as app_helpers
+from uv_upx.cli.resume.main import resume
 from uv_upx.cli.upgrade.main import app as app_upgrade
 
 app = typer.Typer(
@@ -10,3 +14,7 @@ app = typer.Typer(
 
 app.add_typer(app_upgrade, name="upgrade")
 app.add_typer(app_helpers, name="helpers")
+app.command(name="check")(check)
+app.command(name="batch")(batch)
+app.command(name="resume")(resume)
+app.command(name="abort")(abort)
@@ -0,0 +1,31 @@
+import pathlib  # noqa: TC003
+from typing import Annotated
+
+import typer
+
+from uv_upx.services.normalize_paths import normalize_and_check_path_to_project_root
+
+
+def resume(
+    *,
+    project_root_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--project",
+            "-p",
+            help="Path to project root directory. Use current working directory if not specified.",
+        ),
+    ] = None,
+) -> None:
+    """Finish the run, killed in the middle. By its journal in the .uv-upx directory.
+
+    If changes were written into pyproject.toml files, lock and sync them. Otherwise, roll back.
+    Exit with code 1, if the run was rolled back.
+    """
+    from uv_upx.services.update_outcome import UpdateOutcome  # noqa: PLC0415
+    from uv_upx.services.updater import resume_updater  # noqa: PLC0415
+
+    outcome = resume_updater(normalize_and_check_path_to_project_root(project_root_path))
+
+    if outcome is UpdateOutcome.ROLLED_BACK:
+        raise typer.Exit(code=1)
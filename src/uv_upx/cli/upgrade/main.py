@@ -1,11 +1,14 @@
-import importlib
+import importlib.metadata
 import pathlib  # noqa: TC003
 from typing import Annotated
 
 import typer
 
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.lock_diff_format import LockDiffFormat  # noqa: TC001
 from uv_upx.services.normalize_paths import normalize_and_check_path_to_project_root
-from uv_upx.services.updater import run_updater
+from uv_upx.services.output_format import OutputFormat
+from uv_upx.services.timings_format import TimingsFormat
 from uv_upx.services.upgrade_profile import UpgradeProfile
 
 app = typer.Typer(
@@ -37,7 +40,13 @@ def run(  # noqa: PLR0913
         ),
     ] = None,
     #
-    dry_run: Annotated[bool, typer.Option("--dry-run", help="Show changes without writing file")] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show changes as unified diffs. Works in a scratch copy of the workspace, nothing is written",
+        ),
+    ] = False,
     #
     verbose: Annotated[bool, typer.Option("--verbose", help="Show more output")] = False,
     #
@@ -55,6 +64,14 @@ def run(  # noqa: PLR0913
             "But, recommended to run with sync, for better chances for revealing problems.",
         ),
     ] = False,
+    venv_snapshot: Annotated[
+        bool,
+        typer.Option(
+            "--venv-snapshot",
+            help="Snapshot the environment with hardlinks before syncing. "
+            "On rollback, swap it back instead of re-syncing. For big environments.",
+        ),
+    ] = False,
     #
     profile: Annotated[
         UpgradeProfile | None,
@@ -72,6 +89,123 @@ def run(  # noqa: PLR0913
         ),
     ] = False,
     #
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of workers for loading workspace members. Use 0 for all available CPUs.",
+            min=0,
+        ),
+    ] = 1,
+    executor: Annotated[
+        ExecutorKind | None,
+        typer.Option(
+            "--executor",
+            help="Which workers to use with --jobs. Threads for I/O-bound, processes for CPU-bound parsing.",
+        ),
+    ] = None,
+    #
+    use_discovery_cache: Annotated[
+        bool,
+        typer.Option(
+            "--discovery-cache",
+            help="Cache resolved workspace members in the .uv-upx directory. "
+            "Invalidated when directories, traversed by the workspace globs, change.",
+        ),
+    ] = False,
+    #
+    packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--package",
+            help="Upgrade only this package. Can be repeated. Globs are supported, like 'my-company-*'.",
+        ),
+    ] = None,
+    exclude_packages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude-package",
+            help="Don't upgrade this package. Can be repeated. Globs are supported.",
+        ),
+    ] = None,
+    #
+    bisect: Annotated[
+        bool,
+        typer.Option(
+            "--bisect",
+            help="If upgraded dependencies fail to lock or sync, find failing packages by bisecting. "
+            "Keep all compatible upgrades.",
+        ),
+    ] = False,
+    #
+    lock_diff_format: Annotated[
+        LockDiffFormat | None,
+        typer.Option(
+            "--lock-diff",
+            help="Show changes of uv.lock, transitive packages included: added, removed, upgraded and downgraded. "
+            "Shown in the human format for --dry-run by default.",
+        ),
+    ] = None,
+    #
+    output_format: Annotated[
+        OutputFormat | None,
+        typer.Option(
+            "--output-format",
+            help="How to report changes into stdout. "
+            "ndjson: a record per change, as soon as it is computed, and a summary record at the end. "
+            "json: a single document at the end. text: only logs.",
+        ),
+    ] = None,
+    #
+    lock_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--lock-timeout",
+            help="Seconds for each 'uv lock'. If it takes longer, it is stopped and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+    sync_timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--sync-timeout",
+            help="Seconds for each 'uv sync'. Like a stuck sdist build. "
+            "If it takes longer, it is stopped and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+    max_duration: Annotated[
+        float | None,
+        typer.Option(
+            "--max-duration",
+            help="Seconds for the whole run. uv commands are stopped to fit in, and changes are rolled back.",
+            min=0,
+        ),
+    ] = None,
+    #
+    timings: Annotated[
+        bool,
+        typer.Option(
+            "--timings",
+            help="Show how long each phase took. Discovery, parsing, uv commands, rollback.",
+        ),
+    ] = False,
+    timings_file: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--timings-file",
+            help="Write phase durations and file, dependency and change counts into the file.",
+        ),
+    ] = None,
+    timings_format: Annotated[
+        TimingsFormat | None,
+        typer.Option(
+            "--timings-format",
+            help="Format of --timings-file.",
+        ),
+    ] = None,
+    #
     version: Annotated[  # noqa: ARG001  # pyright: ignore[reportUnusedParameter]
         bool | None,
         typer.Option(
@@ -83,17 +217,67 @@ def run(  # noqa: PLR0913
     ] = None,
 ) -> None:
     """Update pyproject.toml dependencies to latest compatible versions."""
-    run_updater(
-        project_root_path=normalize_and_check_path_to_project_root(project_root_path),
-        #
-        dry_run=dry_run,
-        verbose=verbose,
-        #
-        preserve_original_package_names=preserve_original_package_names,
-        #
-        no_sync=no_sync,
-        #
-        interactive=interactive,
-        #
-        profile=profile or UpgradeProfile.get_default(),
-    )
+    output_format = output_format or OutputFormat.get_default()
+    if interactive and output_format is not OutputFormat.TEXT:
+        # Note: Prompts are written into stdout. So, they would break the machine-readable output.
+        msg = "Can't be used with the machine-readable --output-format."
+        raise typer.BadParameter(msg, param_hint="--interactive")
+
+    from uv_upx.services.changes_report import record_changes  # noqa: PLC0415
+    from uv_upx.services.package_filter import PackageFilter  # noqa: PLC0415
+    from uv_upx.services.time_limits import apply_time_limits  # noqa: PLC0415
+    from uv_upx.services.timings import record_timings, report_timings  # noqa: PLC0415
+    from uv_upx.services.update_outcome import UpdateOutcome  # noqa: PLC0415
+    from uv_upx.services.updater import run_updater  # noqa: PLC0415
+
+    with (
+        record_changes(output_format=output_format) as changes_reporter,
+        record_timings(enabled=timings or (timings_file is not None)) as timings_recorder,
+        apply_time_limits(
+            lock_timeout_seconds=lock_timeout,
+            sync_timeout_seconds=sync_timeout,
+            #
+            max_duration_seconds=max_duration,
+        ),
+    ):
+        outcome = run_updater(
+            project_root_path=normalize_and_check_path_to_project_root(project_root_path),
+            #
+            dry_run=dry_run,
+            verbose=verbose,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            no_sync=no_sync,
+            venv_snapshot=venv_snapshot,
+            #
+            interactive=interactive,
+            #
+            profile=profile or UpgradeProfile.get_default(),
+            #
+            jobs=jobs,
+            executor_kind=executor or ExecutorKind.get_default(),
+            #
+            use_discovery_cache=use_discovery_cache,
+            #
+            package_filter=PackageFilter.from_patterns(include=packages, exclude=exclude_packages),
+            #
+            bisect=bisect,
+            #
+            lock_diff_format=lock_diff_format,
+        )
+
+    if changes_reporter is not None:
+        changes_reporter.finish(outcome=outcome)
+
+    if timings_recorder is not None:
+        report_timings(
+            timings_recorder.report,
+            show=timings,
+            #
+            path=timings_file,
+            timings_format=timings_format or TimingsFormat.get_default(),
+        )
+
+    if outcome is UpdateOutcome.DRY_RUN_FAILED:
+        raise typer.Exit(code=1)
@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from typer.testing import CliRunner
+
+from uv_upx.cli.main import app
+
+if TYPE_CHECKING:
+    import pathlib
+
+EXIT_CODE_I_USAGE_ERROR = 2
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_run_i_interactive_with_machine_readable_output(tmp_path: pathlib.Path, output_format: str) -> None:
+    result = CliRunner().invoke(
+        app,
+        ["upgrade", "run", "--project", str(tmp_path), "--interactive", "--output-format", output_format],
+    )
+
+    assert result.exit_code == EXIT_CODE_I_USAGE_ERROR
+    assert "--interactive" in result.stderr
+    assert not result.stdout
@@ -1,13 +1,30 @@
+import sys
+from typing import TYPE_CHECKING, Final
+
 from uv_upx.cli.main import app as app_full
 from uv_upx.cli.upgrade.main import app as app_upgrade
 from uv_upx.logging_custom import init_logging
+from uv_upx.services.termination import TerminatedError, handle_termination
+
+if TYPE_CHECKING:
+    import typer
+
+EXIT_CODE_I_TERMINATED: Final[int] = 143
+"""128 + SIGTERM. As shells report it."""
 
 
 def main() -> None:
-    init_logging()
-    app_full()
+    run_app(app_full)
 
 
 def main_short() -> None:
+    run_app(app_upgrade)
+
+
+def run_app(app: typer.Typer) -> None:
     init_logging()
-    app_upgrade()
+    try:
+        with handle_termination():
+            app()
+    except TerminatedError:
+        sys.exit(EXIT_CODE_I_TERMINATED)
@@ -0,0 +1,11 @@
+from .discover_projects import discover_projects
+from .models import BatchOptions, BatchProjectResult
+from .run_batch import render_batch_report, run_batch
+
+__all__ = [
+    "BatchOptions",
+    "BatchProjectResult",
+    "discover_projects",
+    "render_batch_report",
+    "run_batch",
+]
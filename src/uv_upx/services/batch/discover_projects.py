@@ -0,0 +1,42 @@
+import os
+import pathlib
+from typing import TYPE_CHECKING
+
+from uv_upx.services.normalize_paths import (
+    NAME_OF_PYPROJECT_FILE,
+    NAME_OF_UV_LOCK_FILE,
+    is_skipped_directory,
+    normalize_and_check_path_to_project_root,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def discover_projects(roots: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    """Find all directories with both `pyproject.toml` and `uv.lock`. Recursively.
+
+    Each of them is a separate project. Including nested ones, like independent roots in a monorepo.
+
+    Raises:
+        NotADirectoryError: if a root is not a directory.
+    """
+    projects: set[pathlib.Path] = set()
+    for root in roots:
+        root_path = normalize_and_check_path_to_project_root(root).resolve()
+        for directory, directory_names, file_names in os.walk(root_path):
+            directory_names[:] = [name for name in directory_names if not is_skipped_directory(name)]
+            if NAME_OF_PYPROJECT_FILE in file_names and NAME_OF_UV_LOCK_FILE in file_names:
+                projects.add(pathlib.Path(directory))
+
+    return sorted(projects)
+
+
+def get_project_size(project_root_path: pathlib.Path) -> int:
+    """Size of `uv.lock` in bytes. Bigger lock, more packages to resolve and sync. So, longer run."""
+    return (project_root_path / NAME_OF_UV_LOCK_FILE).stat().st_size
+
+
+def sort_projects_largest_first(project_root_paths: Iterable[pathlib.Path]) -> list[pathlib.Path]:
+    """Start the longest runs first. So, the pool isn't left waiting for a single big project at the end."""
+    return sorted(project_root_paths, key=lambda path: (-get_project_size(path), path))
@@ -0,0 +1,53 @@
+import pathlib
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.package_filter import PackageFilter
+from uv_upx.services.update_outcome import UpdateOutcome
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+
+class BatchOptions(BaseModel):
+    """Options of `run_updater`, the same for each project. Sent to worker processes."""
+
+    dry_run: bool = False
+    no_sync: bool = False
+    venv_snapshot: bool = False
+
+    preserve_original_package_names: bool = False
+
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT
+
+    package_filter: PackageFilter | None = None
+
+    bisect: bool = False
+
+    uv_cache_dir: pathlib.Path | None = None
+    """Shared by all projects. If None, the default cache of uv is used. It is shared too."""
+
+    lock_timeout_seconds: float | None = None
+    sync_timeout_seconds: float | None = None
+
+    max_duration_seconds: float | None = None
+    """For each project."""
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+
+class BatchProjectResult(BaseModel):
+    project_root_path: pathlib.Path
+
+    outcome: UpdateOutcome | None = None
+    """None, if the run failed before updating. See the error."""
+
+    error: str | None = None
+
+    duration_seconds: float
+
+    log_path: pathlib.Path
+
+    @property
+    def is_failed(self) -> bool:
+        return self.outcome in {None, UpdateOutcome.ROLLED_BACK, UpdateOutcome.DRY_RUN_FAILED}
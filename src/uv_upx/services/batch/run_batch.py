@@ -0,0 +1,197 @@
+import contextlib
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.logging_custom import init_logging
+from uv_upx.services.batch.discover_projects import sort_projects_largest_first
+from uv_upx.services.batch.models import BatchOptions, BatchProjectResult
+from uv_upx.services.concurrency import resolve_jobs
+from uv_upx.services.normalize_paths import get_path_to_app_state_dir
+from uv_upx.services.termination import handle_termination
+from uv_upx.services.time_limits import apply_time_limits
+from uv_upx.services.updater import run_updater
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator, Sequence
+
+    from uv_upx.services.update_outcome import UpdateOutcome
+
+NAME_OF_BATCH_LOG_FILE: Final[str] = "batch.log"
+
+FILE_DESCRIPTORS_I_OUTPUT: Final[tuple[int, ...]] = (1, 2)
+"""stdout and stderr."""
+
+
+def run_batch(
+    project_root_paths: Sequence[pathlib.Path],
+    *,
+    options: BatchOptions,
+    #
+    jobs: int = 0,
+) -> list[BatchProjectResult]:
+    """Update each project in a separate worker process. The biggest projects are started first.
+
+    Each project is updated as `uv-upx upgrade run` does. With its own rollback on failure.
+
+    Returns:
+        Results in the order of the given projects.
+    """
+    logger = logging.getLogger(__name__)
+
+    if not project_root_paths:
+        return []
+
+    workers = min(resolve_jobs(jobs), len(project_root_paths))
+    logger.info(f"Updating {len(project_root_paths)} projects with {workers} workers.")
+
+    results: dict[pathlib.Path, BatchProjectResult] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor, stop_workers_on_interruption(executor):
+        futures = [
+            executor.submit(run_project, project_root_path, options=options)
+            for project_root_path in sort_projects_largest_first(project_root_paths)
+        ]
+        for index, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[result.project_root_path] = result
+            message = (
+                f"[{index}/{len(futures)}] {result.project_root_path}: "
+                f"{get_outcome_title(result)} in {result.duration_seconds:.1f}s"
+            )
+            if result.error is not None:
+                message += f". {result.error}"
+            logger.info(message)
+
+    return [results[project_root_path] for project_root_path in project_root_paths]
+
+
+@contextlib.contextmanager
+def stop_workers_on_interruption(executor: ProcessPoolExecutor) -> Iterator[None]:
+    """On Ctrl-C or SIGTERM, don't start new projects. Ask workers to roll back running ones.
+
+    Then the executor waits for them. So, no project is left half-updated.
+    """
+    try:
+        yield
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for worker in multiprocessing.active_children():
+            # Note: SIGTERM. Workers raise TerminatedError and roll back.
+            worker.terminate()
+        raise
+
+
+def run_project(
+    project_root_path: pathlib.Path,
+    *,
+    options: BatchOptions,
+) -> BatchProjectResult:
+    """Update a single project. Runs in a worker process.
+
+    All output of the run, uv commands included, goes into the log file of the project.
+    """
+    if options.uv_cache_dir is not None:
+        os.environ["UV_CACHE_DIR"] = str(options.uv_cache_dir)
+
+    log_path = get_path_to_app_state_dir(project_root_path) / NAME_OF_BATCH_LOG_FILE
+
+    outcome: UpdateOutcome | None = None
+    error: str | None = None
+
+    started_at = time.perf_counter()
+    with (
+        redirect_output(log_path),
+        handle_termination(),
+        apply_time_limits(
+            lock_timeout_seconds=options.lock_timeout_seconds,
+            sync_timeout_seconds=options.sync_timeout_seconds,
+            #
+            max_duration_seconds=options.max_duration_seconds,
+        ),
+    ):
+        init_logging()
+        try:
+            outcome = run_updater(
+                project_root_path=project_root_path,
+                #
+                dry_run=options.dry_run,
+                #
+                preserve_original_package_names=options.preserve_original_package_names,
+                #
+                no_sync=options.no_sync,
+                venv_snapshot=options.venv_snapshot,
+                #
+                profile=options.profile,
+                #
+                package_filter=options.package_filter,
+                #
+                bisect=options.bisect,
+            )
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logging.getLogger(__name__).exception("Failed to update the project.")
+
+    return BatchProjectResult(
+        project_root_path=project_root_path,
+        outcome=outcome,
+        error=error,
+        duration_seconds=time.perf_counter() - started_at,
+        log_path=log_path,
+    )
+
+
+@contextlib.contextmanager
+def redirect_output(path: pathlib.Path) -> Iterator[None]:
+    """Write stdout and stderr of the process into the file.
+
+    File descriptors are redirected. So, output of subprocesses is included.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    saved_fds = [os.dup(fd) for fd in FILE_DESCRIPTORS_I_OUTPUT]
+    try:
+        with path.open("w", encoding="utf-8") as file:
+            for fd in FILE_DESCRIPTORS_I_OUTPUT:
+                os.dup2(file.fileno(), fd)
+            try:
+                yield
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+    finally:
+        for fd, saved_fd in zip(FILE_DESCRIPTORS_I_OUTPUT, saved_fds, strict=True):
+            os.dup2(saved_fd, fd)
+            os.close(saved_fd)
+
+
+def get_outcome_title(result: BatchProjectResult) -> str:
+    return "failed" if result.outcome is None else result.outcome.value
+
+
+def render_batch_report(
+    results: Sequence[BatchProjectResult],
+) -> list[str]:
+    """Aggregated table. A row per project. Logs are referenced for failed ones."""
+    path_width = max((len(str(result.project_root_path)) for result in results), default=0)
+    path_width = max(path_width, len("Project"))
+
+    lines: list[str] = [f"{'Project':<{path_width}}  {'Outcome':<12}  {'Duration':>9}"]
+    counts: dict[str, int] = {}
+    for result in results:
+        title = get_outcome_title(result)
+        counts[title] = counts.get(title, 0) + 1
+
+        line = f"{result.project_root_path!s:<{path_width}}  {title:<12}  {result.duration_seconds:8.1f}s"
+        if result.is_failed:
+            line += f"  See {result.log_path.as_uri()}"
+        lines.append(line)
+
+    summary = ", ".join(f"{count} {title}" for title, count in sorted(counts.items()))
+    lines.append(f"{len(results)} projects: {summary or 'nothing to do'}.")
+    return lines
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uv_upx.services.batch import BatchProjectResult, discover_projects, render_batch_report
+from uv_upx.services.batch.discover_projects import sort_projects_largest_first
+from uv_upx.services.batch.run_batch import redirect_output
+from uv_upx.services.update_outcome import UpdateOutcome
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def make_project(
+    path: pathlib.Path,
+    *,
+    uv_lock: str = "version = 1\n",
+) -> pathlib.Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").write_text('[project]\nname = "x"\n', encoding="utf-8")
+    (path / "uv.lock").write_text(uv_lock, encoding="utf-8")
+    return path
+
+
+def test_discover_projects(tmp_path: pathlib.Path) -> None:
+    repo_a = make_project(tmp_path / "repo-a")
+    # Note: Independent roots in a monorepo. Nested too.
+    service_1 = make_project(tmp_path / "monorepo" / "services" / "one")
+    service_2 = make_project(service_1 / "tools")
+    # Note: Workspace members have no uv.lock.
+    (repo_a / "packages" / "member").mkdir(parents=True)
+    (repo_a / "packages" / "member" / "pyproject.toml").write_text("", encoding="utf-8")
+    # Note: Hidden and well-known directories are skipped.
+    make_project(repo_a / ".venv" / "lib" / "vendored")
+    make_project(tmp_path / "node_modules" / "something")
+
+    projects = discover_projects([tmp_path, tmp_path / "repo-a"])
+
+    assert projects == sorted(path.resolve() for path in (repo_a, service_1, service_2))
+
+
+def test_discover_projects_not_a_directory(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(NotADirectoryError):
+        discover_projects([tmp_path / "missing"])
+
+
+def test_sort_projects_largest_first(tmp_path: pathlib.Path) -> None:
+    small = make_project(tmp_path / "small")
+    big = make_project(tmp_path / "big", uv_lock="version = 1\n" + "# padding\n" * 100)
+    medium = make_project(tmp_path / "medium", uv_lock="version = 1\n" + "# padding\n" * 10)
+
+    assert sort_projects_largest_first([small, big, medium]) == [big, medium, small]
+
+
+def test_redirect_output(tmp_path: pathlib.Path) -> None:
+    log_path = tmp_path / "batch.log"
+
+    # Note: pytest replaces sys.stdout and sys.stderr. So, write into the file descriptors directly.
+    with redirect_output(log_path):
+        os.write(1, b"into stdout\n")
+        os.write(2, b"into stderr\n")
+        subprocess.run([sys.executable, "-c", "print('from subprocess')"], check=True)
+
+    assert log_path.read_text(encoding="utf-8").splitlines() == [
+        "into stdout",
+        "into stderr",
+        "from subprocess",
+    ]
+
+
+def test_render_batch_report(tmp_path: pathlib.Path) -> None:
+    results = [
+        BatchProjectResult(
+            project_root_path=tmp_path / "a",
+            outcome=UpdateOutcome.UPDATED,
+            duration_seconds=12.34,
+            log_path=tmp_path / "a" / "batch.log",
+        ),
+        BatchProjectResult(
+            project_root_path=tmp_path / "b",
+            outcome=None,
+            error="FileNotFoundError: uv.lock",
+            duration_seconds=0.5,
+            log_path=tmp_path / "b" / "batch.log",
+        ),
+        BatchProjectResult(
+            project_root_path=tmp_path / "c",
+            outcome=UpdateOutcome.NO_CHANGES,
+            duration_seconds=1,
+            log_path=tmp_path / "c" / "batch.log",
+        ),
+    ]
+
+    lines = render_batch_report(results)
+
+    assert lines[0].split() == ["Project", "Outcome", "Duration"]
+    assert lines[1].split() == [str(tmp_path / "a"), "updated", "12.3s"]
+    assert lines[2].split() == [str(tmp_path / "b"), "failed", "0.5s", "See", (tmp_path / "b" / "batch.log").as_uri()]
+    assert lines[-1] == "3 projects: 1 failed, 1 no_changes, 1 updated."
@@ -0,0 +1,8 @@
+from .bisect_changes import BisectResult, bisect_changes
+from .run_bisect import run_bisect
+
+__all__ = [
+    "BisectResult",
+    "bisect_changes",
+    "run_bisect",
+]
@@ -0,0 +1,94 @@
+import dataclasses
+from typing import TYPE_CHECKING
+
+from uv_upx.services.fingerprints import is_sync_needed, save_sync_state
+from uv_upx.services.parse_v2.save_py_project import save_py_project
+from uv_upx.services.run_uv_related import UvSyncMode, run_uv_lock, run_uv_sync
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+
+if TYPE_CHECKING:
+    from uv_upx.services.dependency_up import ChangesList, DependencyLocation
+    from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed
+    from uv_upx.services.updater.rollback_updater import RollbackData
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
+
+
+def apply_changes(
+    *,
+    rollback_data: RollbackData,
+    changes: ChangesList,
+    #
+    preserve_original_package_names: bool = False,
+    #
+    no_sync: bool = False,
+) -> None:
+    """Apply only these changes to the original state. Lock and sync.
+
+    Files are restored first. Then only packages of the changes are upgraded in the original uv.lock.
+
+    Raises:
+        UnresolvedDependencyError: if the lock or the sync fails.
+    """
+    for file in rollback_data.get_files():
+        file.restore()
+
+    project_root_path = rollback_data.uv_lock.path.parent
+    workspace_snapshot = build_workspace_snapshot(
+        project_root_path,
+        #
+        preserve_original_package_names=preserve_original_package_names,
+    )
+    apply_changes_to_py_projects(
+        workspace_snapshot=workspace_snapshot,
+        changes=changes,
+    )
+
+    run_uv_lock(
+        workdir=project_root_path,
+        upgrade_packages=sorted({change.to_item.package_name for change in changes}),
+    )
+
+    if no_sync or not is_sync_needed(project_root_path):
+        return
+
+    # Note: Imported here. The updater package imports bisecting.
+    from uv_upx.services.updater.journal import snapshot_environment_before_sync  # noqa: PLC0415
+
+    snapshot_environment_before_sync(project_root_path)
+    run_uv_sync(
+        workdir=project_root_path,
+        uv_sync_mode=UvSyncMode.FROZEN,
+    )
+    save_sync_state(project_root_path)
+
+
+def apply_changes_to_py_projects(
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    changes: ChangesList,
+) -> None:
+    """Write changes into pyproject.toml files. Dependencies are found by the location and the original spec."""
+    to_items_by_location: dict[DependencyLocation, dict[DependencyParsed, DependencyParsed]] = {}
+    for change in changes:
+        if change.location is not None:
+            to_items_by_location.setdefault(change.location, {})[change.from_item] = change.to_item
+
+    for py_project in workspace_snapshot.collected_top_level_dependencies.parsed_pyprojects:
+        is_have_changes_for_file = False
+
+        for group in py_project.dependency_groups_parsed:
+            to_items = to_items_by_location.get(group.get_location(py_project.path))
+            if not to_items:
+                continue
+
+            for index, dependency in enumerate(group.parsed_dependencies):
+                to_item = to_items.get(dependency.parsed)
+                if to_item is None:
+                    continue
+
+                group.parsed_dependencies[index] = dataclasses.replace(dependency, parsed=to_item)
+                group.dependencies[dependency.index_in_group] = to_item.get_full_spec()
+                is_have_changes_for_file = True
+
+        if is_have_changes_for_file:
+            save_py_project(py_project)
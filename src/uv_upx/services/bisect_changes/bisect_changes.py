@@ -0,0 +1,102 @@
+import dataclasses
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.dependency_up.models.changes_list import ChangesList
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from uv_upx.services.package_name import PackageName
+
+type IsSuccessful = bool
+
+type TryChanges = Callable[[ChangesList], IsSuccessful]
+"""Apply the changes (and only them). Lock and sync. Tell if it worked."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BisectResult:
+    accepted: ChangesList
+    """Changes, which work together."""
+
+    rejected: ChangesList
+    """Changes, which fail with the accepted ones."""
+
+    trials_count: int
+
+
+def bisect_changes(
+    changes: ChangesList,
+    *,
+    try_changes: TryChanges,
+    #
+    is_known_failing: bool = True,
+) -> BisectResult:
+    """Find the biggest set of changes, which work together.
+
+    Changes of the same package are kept together. Because uv upgrades a package as a whole.
+
+    The set is split in halves. A working half is accepted as is.
+    A failing half is split further, with the accepted changes applied.
+    So, it takes about `k * log2(n)` trials for `k` failing packages of `n`.
+
+    Args:
+        changes: Candidate changes.
+        try_changes: Applies a subset of changes. Called for each trial.
+        is_known_failing: All changes together are known to fail. So, the first trial is skipped.
+    """
+    logger = logging.getLogger(__name__)
+
+    units = group_changes_by_package(changes)
+    trials_count = 0
+
+    def is_working(candidate_units: list[ChangesList]) -> IsSuccessful:
+        nonlocal trials_count
+        trials_count += 1
+        flat = [change for unit in candidate_units for change in unit]
+        names = ", ".join(unit[0].to_item.package_name for unit in candidate_units)
+        logger.info(f"Bisect trial {trials_count}: {names}")
+        return try_changes(flat)
+
+    def search(
+        accepted: list[ChangesList],
+        candidates: list[ChangesList],
+        *,
+        is_failing: bool = False,
+    ) -> list[ChangesList]:
+        """Return the working part of the candidates. With the accepted ones applied."""
+        if not candidates:
+            return []
+        if not is_failing and is_working([*accepted, *candidates]):
+            return candidates
+        if len(candidates) == 1:
+            return []
+
+        middle = len(candidates) // 2
+        left, right = candidates[:middle], candidates[middle:]
+        working_left = search(accepted, left)
+        # Note: If the whole left half works, the right one with it is the same failing set. No need to try it again.
+        working_right = search(
+            [*accepted, *working_left],
+            right,
+            is_failing=len(working_left) == len(left),
+        )
+        return [*working_left, *working_right]
+
+    accepted_units = search([], units, is_failing=is_known_failing)
+
+    accepted_ids = {id(unit) for unit in accepted_units}
+    return BisectResult(
+        accepted=[change for unit in accepted_units for change in unit],
+        rejected=[change for unit in units if id(unit) not in accepted_ids for change in unit],
+        trials_count=trials_count,
+    )
+
+
+def group_changes_by_package(changes: ChangesList) -> list[ChangesList]:
+    """Group changes by package name. In order of the first appearance."""
+    groups: dict[PackageName, ChangesList] = {}
+    for change in changes:
+        groups.setdefault(change.to_item.package_name, []).append(change)
+    return list(groups.values())
@@ -0,0 +1,74 @@
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.bisect_changes.apply_changes import apply_changes
+from uv_upx.services.bisect_changes.bisect_changes import BisectResult, IsSuccessful, bisect_changes
+from uv_upx.services.changes_report import ChangeStatus, report_change
+from uv_upx.services.run_uv_related import UnresolvedDependencyError
+from uv_upx.services.timings import timed
+
+if TYPE_CHECKING:
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.updater.rollback_updater import RollbackData
+
+
+@timed("run_bisect")
+def run_bisect(
+    *,
+    rollback_data: RollbackData,
+    changes: ChangesList,
+    #
+    preserve_original_package_names: bool = False,
+    #
+    no_sync: bool = False,
+) -> BisectResult:
+    """Find and apply the biggest set of changes, which can be locked and synced together.
+
+    Should be called after the whole set failed.
+    """
+    logger = logging.getLogger(__name__)
+
+    last_applied: ChangesList | None = None
+
+    def try_changes(changes_subset: ChangesList) -> IsSuccessful:
+        nonlocal last_applied
+        last_applied = None
+        try:
+            apply_changes(
+                rollback_data=rollback_data,
+                changes=changes_subset,
+                #
+                preserve_original_package_names=preserve_original_package_names,
+                #
+                no_sync=no_sync,
+            )
+        except UnresolvedDependencyError as e:
+            logger.info(f"Bisect trial failed: {e}")
+            return False
+
+        last_applied = changes_subset
+        return True
+
+    result = bisect_changes(changes, try_changes=try_changes)
+    logger.info(f"Bisect finished after {result.trials_count} trials.")
+
+    for change in result.rejected:
+        logger.warning(f"Rejected: {change} in {change.location}")
+        report_change(
+            change,
+            status=ChangeStatus.FAILED,
+            project_root_path=rollback_data.uv_lock.path.parent,
+        )
+
+    if result.accepted and result.accepted != last_applied:
+        # Note: The last trial can be another subset. So, apply the result once more.
+        apply_changes(
+            rollback_data=rollback_data,
+            changes=result.accepted,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            no_sync=no_sync,
+        )
+
+    return result
@@ -0,0 +1,95 @@
+import math
+from typing import TYPE_CHECKING
+
+from uv_upx.services.bisect_changes import bisect_changes
+from uv_upx.services.bisect_changes.apply_changes import apply_changes_to_py_projects
+from uv_upx.services.dependencies_from_project import DependenciesRegistry, Version
+from uv_upx.services.dependency_up.models.changes_list import ChangesItem
+from uv_upx.services.dependency_up.parse_dependency import parse_dependency
+from uv_upx.services.outdated_check import find_available_changes
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.bisect_changes.bisect_changes import TryChanges
+    from uv_upx.services.dependency_up import ChangesList
+
+
+def make_change(package_name: str) -> ChangesItem:
+    return ChangesItem(
+        from_item=parse_dependency(f"{package_name}>=1.0.0"),
+        to_item=parse_dependency(f"{package_name}>=2.0.0"),
+    )
+
+
+def make_try_changes(
+    failing_package_names: set[str],
+    trials: list[list[str]],
+) -> TryChanges:
+    def try_changes(changes: ChangesList) -> bool:
+        names = [change.to_item.package_name for change in changes]
+        trials.append(names)
+        return not failing_package_names.intersection(names)
+
+    return try_changes
+
+
+def test_bisect_changes_i_single_failing_package() -> None:
+    changes = [make_change(f"package-{index}") for index in range(16)]
+    trials: list[list[str]] = []
+
+    result = bisect_changes(changes, try_changes=make_try_changes({"package-11"}, trials))
+
+    assert [change.to_item.package_name for change in result.rejected] == ["package-11"]
+    assert result.accepted == [change for change in changes if change.to_item.package_name != "package-11"]
+    # Note: O(log n). Not a trial per package.
+    assert result.trials_count == len(trials) <= 2 * math.log2(len(changes))
+
+
+def test_bisect_changes_i_failing_pair_and_same_package_kept_together() -> None:
+    changes = [make_change("a"), make_change("b"), make_change("c"), make_change("a"), make_change("d")]
+    trials: list[list[str]] = []
+
+    result = bisect_changes(changes, try_changes=make_try_changes({"b", "d"}, trials))
+
+    assert [change.to_item.package_name for change in result.accepted] == ["a", "a", "c"]
+    assert [change.to_item.package_name for change in result.rejected] == ["b", "d"]
+    assert all(trial.count("a") in {0, 2} for trial in trials)
+
+
+def test_bisect_changes_i_all_working_when_not_known_failing() -> None:
+    changes = [make_change("a"), make_change("b")]
+    trials: list[list[str]] = []
+
+    result = bisect_changes(changes, try_changes=make_try_changes(set(), trials), is_known_failing=False)
+
+    assert result.accepted == changes
+    assert not result.rejected
+    assert result.trials_count == 1
+
+
+def test_apply_changes_to_py_projects_i_only_given_changes(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text(
+        '[project]\nname = "root"\nversion = "0.1.0"\ndependencies = [\n    "foo>=1.0.0",\n    "bar>=1.0.0",\n]\n',
+        encoding="utf-8",
+    )
+    workspace_snapshot = build_workspace_snapshot(tmp_path)
+    changes = find_available_changes(
+        workspace_snapshot=workspace_snapshot,
+        dependencies_registry=DependenciesRegistry(
+            root={PackageName("foo"): Version("1.1.0"), PackageName("bar"): Version("1.2.0")},
+        ),
+    )
+    assert [change.to_item.package_name for change in changes] == ["foo", "bar"]
+
+    apply_changes_to_py_projects(
+        workspace_snapshot=build_workspace_snapshot(tmp_path),
+        changes=[change for change in changes if change.to_item.package_name == "bar"],
+    )
+
+    assert path.read_text(encoding="utf-8") == (
+        '[project]\nname = "root"\nversion = "0.1.0"\ndependencies = [\n    "foo>=1.0.0",\n    "bar>=1.2.0",\n]\n'
+    )
@@ -0,0 +1,14 @@
+from .models import ChangeRecord, ChangeStatus, LockDiffRecord, SummaryRecord
+from .reporter import ChangesReporter, is_reporting_changes, record_changes, report_change, report_lock_diff
+
+__all__ = [
+    "ChangeRecord",
+    "ChangeStatus",
+    "ChangesReporter",
+    "LockDiffRecord",
+    "SummaryRecord",
+    "is_reporting_changes",
+    "record_changes",
+    "report_change",
+    "report_lock_diff",
+]
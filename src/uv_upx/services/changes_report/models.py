@@ -0,0 +1,52 @@
+import enum
+from typing import Literal
+
+from pydantic import BaseModel
+
+from uv_upx.services.lock_diff import LockDiffEntry, LockDiffKind
+from uv_upx.services.update_outcome import UpdateOutcome
+
+
+@enum.unique
+class ChangeStatus(enum.StrEnum):
+    ACCEPTED = "accepted"
+    """Written into pyproject.toml."""
+
+    REJECTED = "rejected"
+    """Rejected in the interactive mode."""
+
+    FAILED = "failed"
+    """Rejected by bisecting. Failed to lock or sync with other changes."""
+
+
+class ChangeRecord(BaseModel):
+    type: Literal["change"] = "change"
+
+    path: str
+    """Path to pyproject.toml. Relative to the project root."""
+
+    section: str | None
+    group: str | None
+
+    package: str
+    from_spec: str
+    to_spec: str
+
+    status: ChangeStatus
+
+
+class LockDiffRecord(BaseModel):
+    """Changes of uv.lock. Only with `--lock-diff`."""
+
+    type: Literal["lock_diff"] = "lock_diff"
+
+    counts: dict[LockDiffKind, int]
+    entries: list[LockDiffEntry]
+
+
+class SummaryRecord(BaseModel):
+    type: Literal["summary"] = "summary"
+
+    outcome: UpdateOutcome
+
+    counts: dict[ChangeStatus, int]
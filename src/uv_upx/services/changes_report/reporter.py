@@ -0,0 +1,142 @@
+import contextlib
+import contextvars
+import json
+import sys
+from typing import TYPE_CHECKING, TextIO
+
+from uv_upx.services.changes_report.models import ChangeRecord, ChangeStatus, LockDiffRecord, SummaryRecord
+from uv_upx.services.output_format import OutputFormat
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+    from uv_upx.services.dependency_up.models.changes_list import ChangesItem
+    from uv_upx.services.lock_diff import LockDiff
+    from uv_upx.services.update_outcome import UpdateOutcome
+
+
+class ChangesReporter:
+    def __init__(
+        self,
+        *,
+        output_format: OutputFormat,
+        #
+        stream: TextIO | None = None,
+    ) -> None:
+        self.output_format = output_format
+        self.stream = stream or sys.stdout
+
+        self.records: list[ChangeRecord] = []
+        self.indexes_i_by_change: dict[tuple[str, str | None, str | None, str, str, str], int] = {}
+        self.lock_diff_record: LockDiffRecord | None = None
+
+    def report_change(
+        self,
+        change: ChangesItem,
+        *,
+        status: ChangeStatus,
+        project_root_path: pathlib.Path,
+    ) -> None:
+        location = change.location
+        record = ChangeRecord(
+            path=location.path.relative_to(project_root_path).as_posix() if location is not None else "",
+            section=location.section if location is not None else None,
+            group=location.group_name if location is not None else None,
+            #
+            package=change.to_item.package_name,
+            from_spec=change.from_item.get_full_spec(),
+            to_spec=change.to_item.get_full_spec(),
+            #
+            status=status,
+        )
+        # Note: A change can be reported again. Like accepted, then failed by bisecting. The last status wins.
+        key = (record.path, record.section, record.group, record.package, record.from_spec, record.to_spec)
+        index = self.indexes_i_by_change.get(key)
+        if index is None:
+            self.indexes_i_by_change[key] = len(self.records)
+            self.records.append(record)
+        else:
+            self.records[index] = record
+
+        if self.output_format is OutputFormat.NDJSON:
+            self.write_line(record.model_dump_json())
+
+    def report_lock_diff(self, lock_diff: LockDiff) -> None:
+        record = LockDiffRecord(counts=lock_diff.get_counts(), entries=lock_diff.entries)
+        self.lock_diff_record = record
+
+        if self.output_format is OutputFormat.NDJSON:
+            self.write_line(record.model_dump_json())
+
+    def finish(self, *, outcome: UpdateOutcome) -> SummaryRecord:
+        counts = dict.fromkeys(ChangeStatus, 0)
+        for record in self.records:
+            counts[record.status] += 1
+        summary = SummaryRecord(outcome=outcome, counts=counts)
+
+        match self.output_format:
+            case OutputFormat.NDJSON:
+                self.write_line(summary.model_dump_json())
+            case OutputFormat.JSON:
+                document = {
+                    "changes": [record.model_dump(mode="json") for record in self.records],
+                    "summary": summary.model_dump(mode="json"),
+                }
+                if self.lock_diff_record is not None:
+                    document["lock_diff"] = self.lock_diff_record.model_dump(mode="json")
+                self.write_line(json.dumps(document, indent=2))
+            case OutputFormat.TEXT:
+                pass
+
+        return summary
+
+    def write_line(self, line: str) -> None:
+        # Note: Flush each record. So, consumers get it without waiting for the end of the run.
+        self.stream.write(f"{line}\n")
+        self.stream.flush()
+
+
+CURRENT_CHANGES_REPORTER: contextvars.ContextVar[ChangesReporter | None] = contextvars.ContextVar(
+    "CURRENT_CHANGES_REPORTER",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def record_changes(*, output_format: OutputFormat) -> Iterator[ChangesReporter | None]:
+    """Report all changes inside. Yield None for the text format. Logs are enough for it."""
+    if output_format is OutputFormat.TEXT:
+        yield None
+        return
+
+    reporter = ChangesReporter(output_format=output_format)
+    token = CURRENT_CHANGES_REPORTER.set(reporter)
+    try:
+        yield reporter
+    finally:
+        CURRENT_CHANGES_REPORTER.reset(token)
+
+
+def is_reporting_changes() -> bool:
+    """Tell if changes are reported into stdout. So, nothing else should be printed there."""
+    return CURRENT_CHANGES_REPORTER.get() is not None
+
+
+def report_change(
+    change: ChangesItem,
+    *,
+    status: ChangeStatus,
+    project_root_path: pathlib.Path,
+) -> None:
+    """Report the change to the active reporter. Does nothing if there is no active reporter."""
+    reporter = CURRENT_CHANGES_REPORTER.get()
+    if reporter is not None:
+        reporter.report_change(change, status=status, project_root_path=project_root_path)
+
+
+def report_lock_diff(lock_diff: LockDiff) -> None:
+    """Report changes of uv.lock to the active reporter. Does nothing if there is no active reporter."""
+    reporter = CURRENT_CHANGES_REPORTER.get()
+    if reporter is not None:
+        reporter.report_lock_diff(lock_diff)
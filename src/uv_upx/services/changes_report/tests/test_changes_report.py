@@ -0,0 +1,147 @@
+import io
+import json
+import pathlib
+
+from uv_upx.services.changes_report import (
+    ChangesReporter,
+    ChangeStatus,
+    is_reporting_changes,
+    record_changes,
+    report_change,
+    report_lock_diff,
+)
+from uv_upx.services.dependency_up import DependencyLocation
+from uv_upx.services.dependency_up.models.changes_list import ChangesItem
+from uv_upx.services.dependency_up.parse_dependency import parse_dependency
+from uv_upx.services.lock_diff import LockDiff, LockDiffEntry, LockDiffKind
+from uv_upx.services.output_format import OutputFormat
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.update_outcome import UpdateOutcome
+
+PROJECT_ROOT_PATH = pathlib.Path("/project")
+
+CHANGE = ChangesItem(
+    from_item=parse_dependency("foo[bar]>=1.0"),
+    to_item=parse_dependency("foo[bar]>=1.2.0"),
+    location=DependencyLocation(
+        path=PROJECT_ROOT_PATH / "packages" / "a" / "pyproject.toml",
+        section="dependency-groups",
+        group_name="dev",
+    ),
+)
+
+CHANGE_I_OTHER = ChangesItem(
+    from_item=parse_dependency("bar>=1.0"),
+    to_item=parse_dependency("bar>=2.0"),
+    location=CHANGE.location,
+)
+
+LOCK_DIFF = LockDiff(
+    entries=[
+        LockDiffEntry(
+            name=PackageName("foo"),
+            kind=LockDiffKind.UPGRADED,
+            versions_before=("1.0",),
+            versions_after=("1.2.0",),
+        ),
+    ],
+)
+
+
+def test_changes_reporter_i_ndjson_is_streamed() -> None:
+    stream = io.StringIO()
+    reporter = ChangesReporter(output_format=OutputFormat.NDJSON, stream=stream)
+
+    reporter.report_change(CHANGE, status=ChangeStatus.ACCEPTED, project_root_path=PROJECT_ROOT_PATH)
+    assert json.loads(stream.getvalue()) == {
+        "type": "change",
+        "path": "packages/a/pyproject.toml",
+        "section": "dependency-groups",
+        "group": "dev",
+        "package": "foo",
+        "from_spec": "foo[bar]>=1.0",
+        "to_spec": "foo[bar]>=1.2.0",
+        "status": "accepted",
+    }
+
+    reporter.report_change(CHANGE_I_OTHER, status=ChangeStatus.REJECTED, project_root_path=PROJECT_ROOT_PATH)
+    reporter.finish(outcome=UpdateOutcome.UPDATED)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["type"] for record in records] == ["change", "change", "summary"]
+    assert records[-1] == {
+        "type": "summary",
+        "outcome": "updated",
+        "counts": {"accepted": 1, "rejected": 1, "failed": 0},
+    }
+
+
+def test_changes_reporter_i_json_is_written_at_the_end() -> None:
+    stream = io.StringIO()
+    reporter = ChangesReporter(output_format=OutputFormat.JSON, stream=stream)
+
+    reporter.report_change(CHANGE, status=ChangeStatus.FAILED, project_root_path=PROJECT_ROOT_PATH)
+    assert not stream.getvalue()
+
+    reporter.finish(outcome=UpdateOutcome.ROLLED_BACK)
+    document = json.loads(stream.getvalue())
+    assert [record["status"] for record in document["changes"]] == ["failed"]
+    assert document["summary"]["outcome"] == "rolled_back"
+
+
+def test_changes_reporter_i_last_status_of_a_change_wins() -> None:
+    stream = io.StringIO()
+    reporter = ChangesReporter(output_format=OutputFormat.JSON, stream=stream)
+
+    # Note: Like with bisecting. The change is written first, then it fails with others.
+    reporter.report_change(CHANGE, status=ChangeStatus.ACCEPTED, project_root_path=PROJECT_ROOT_PATH)
+    reporter.report_change(CHANGE, status=ChangeStatus.FAILED, project_root_path=PROJECT_ROOT_PATH)
+    summary = reporter.finish(outcome=UpdateOutcome.UPDATED)
+
+    assert summary.counts == {ChangeStatus.ACCEPTED: 0, ChangeStatus.REJECTED: 0, ChangeStatus.FAILED: 1}
+    document = json.loads(stream.getvalue())
+    assert [record["status"] for record in document["changes"]] == ["failed"]
+
+
+def test_record_changes_i_text_format_reports_nothing() -> None:
+    with record_changes(output_format=OutputFormat.TEXT) as reporter:
+        assert reporter is None
+        assert not is_reporting_changes()
+        report_change(CHANGE, status=ChangeStatus.ACCEPTED, project_root_path=PROJECT_ROOT_PATH)
+
+
+def test_record_changes_i_active_reporter() -> None:
+    with record_changes(output_format=OutputFormat.JSON) as reporter:
+        assert reporter is not None
+        assert is_reporting_changes()
+        report_change(CHANGE, status=ChangeStatus.ACCEPTED, project_root_path=PROJECT_ROOT_PATH)
+
+    assert not is_reporting_changes()
+    assert len(reporter.records) == 1
+
+
+def test_changes_reporter_i_lock_diff_is_a_record() -> None:
+    stream = io.StringIO()
+    reporter = ChangesReporter(output_format=OutputFormat.NDJSON, stream=stream)
+
+    reporter.report_lock_diff(LOCK_DIFF)
+    reporter.finish(outcome=UpdateOutcome.UPDATED)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["type"] for record in records] == ["lock_diff", "summary"]
+    assert records[0]["counts"]["upgraded"] == 1
+    assert records[0]["entries"] == [
+        {"name": "foo", "kind": "upgraded", "versions_before": ["1.0"], "versions_after": ["1.2.0"]},
+    ]
+
+
+def test_changes_reporter_i_lock_diff_in_json_document() -> None:
+    stream = io.StringIO()
+    with record_changes(output_format=OutputFormat.JSON) as reporter:
+        assert reporter is not None
+        reporter.stream = stream
+        report_lock_diff(LOCK_DIFF)
+        reporter.finish(outcome=UpdateOutcome.UPDATED)
+
+    document = json.loads(stream.getvalue())
+    assert [entry["name"] for entry in document["lock_diff"]["entries"]] == ["foo"]
@@ -1,9 +1,13 @@
+import dataclasses
 import enum
+import pathlib  # noqa: TC003
 
 from pydantic import BaseModel, ConfigDict
 
+from uv_upx.services.dependency_up.models.changes_list import DependencyLocation
 from uv_upx.services.dependency_up.models.dependencies_list import TomlBasedDependenciesList
 from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed
+from uv_upx.services.toml import TextSpan, TomlKeyPath
 
 
 class DependencySection(enum.StrEnum):
@@ -23,11 +27,29 @@ class DependencyGroup(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def get_key_path(self) -> TomlKeyPath:
+        """Path of the dependencies array in the TOML document."""
+        key_path: TomlKeyPath = tuple(self.section.split("."))
+        if self.group_name is not None:
+            key_path = (*key_path, self.group_name)
+        return key_path
 
-class DependencyItemParsed(BaseModel):
+    def get_location(self, path: pathlib.Path) -> DependencyLocation:
+        return DependencyLocation(
+            path=path,
+            section=self.section,
+            group_name=self.group_name,
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DependencyItemParsed:
     parsed: DependencyParsed
     index_in_group: int
 
+    literal_span: TextSpan | None = None
+    """Position of the original string literal in the file. None if unknown."""
+
 
 class DependencyGroupParsed(DependencyGroup):
     parsed_dependencies: list[DependencyItemParsed]
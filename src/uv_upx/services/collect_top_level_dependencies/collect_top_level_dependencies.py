@@ -1,46 +1,30 @@
 import logging
 from typing import TYPE_CHECKING, Final
 
-from uv_upx.services.collect_dependencies.collect_groups_from_py_project import collect_from_py_project
-from uv_upx.services.dependency_up.constants.operators import VERSION_OPERATORS_I_PUT_IF_DIFFERENT
-from uv_upx.services.dependency_up.parse_dependency import parse_dependency
-from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.dependency_up.constants.operators import VERSION_OPERATORS_I_HANDLED
 
 if TYPE_CHECKING:
-    import pathlib
     from collections.abc import Iterable
 
-    from uv_upx.services.dependency_up.models.dependencies_list import TomlBasedDependenciesList
+    from uv_upx.services.collect_dependencies.models import DependencyItemParsed
     from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
 
 TAB_CHARS: Final[str] = "  "
 
 
 def filter_dependencies(
-    dependencies: TomlBasedDependenciesList,
+    dependencies: Iterable[DependencyItemParsed],
     *,
     only_special_cases: bool = False,
-    #
-    preserve_original_package_names: bool = False,
 ) -> Iterable[DependencyParsed]:
-    for dep in dependencies:  # pyright: ignore[reportUnknownVariableType]
-        if not isinstance(dep, str):
-            continue
-
-        dependency_parsed = parse_dependency(
-            dep,
-            preserve_original_package_names=preserve_original_package_names,
-        )
+    for dep in dependencies:
+        dependency_parsed = dep.parsed
         if only_special_cases and (
             (dependency_parsed.marker is not None)  # Have marker. It is an unusual case.
             or (len(dependency_parsed.version_constraints) > 1)  # Have more than one version constraint. It's complex.
             or (len(dependency_parsed.version_constraints) == 0)  # No version constraints. It's strange.
-            or (
-                any(
-                    vc.operator not in VERSION_OPERATORS_I_PUT_IF_DIFFERENT
-                    for vc in dependency_parsed.version_constraints
-                )
-            )
+            or (any(vc.operator not in VERSION_OPERATORS_I_HANDLED for vc in dependency_parsed.version_constraints))
         ):
             yield dependency_parsed
 
@@ -49,27 +33,23 @@ def filter_dependencies(
 
 def collect_top_level_dependencies(
     *,
-    project_root_path: pathlib.Path,
+    workspace_snapshot: WorkspaceSnapshot,
     only_special_cases: bool = False,
-    preserve_original_package_names: bool = False,
 ) -> None:
     logger = logging.getLogger(__name__)
 
     logger.info("Collecting top level dependencies...")
 
-    py_projects = get_all_pyprojects_by_project_root_path(project_root_path)
-
-    for py_project in py_projects.items:
+    for py_project in workspace_snapshot.collected_top_level_dependencies.parsed_pyprojects:
         is_py_project_info_shown = False
 
         # Iterates dependencies; prints project, group, and dependency info
-        for group in collect_from_py_project(py_project.data):
+        for group in py_project.dependency_groups_parsed:
             is_group_title_shown = False
 
             for dep in filter_dependencies(
-                group.dependencies,
+                group.parsed_dependencies,
                 only_special_cases=only_special_cases,
-                preserve_original_package_names=preserve_original_package_names,
             ):
                 if not is_py_project_info_shown:
                     print(py_project.path.as_uri())
@@ -0,0 +1,8 @@
+from .executor_kind import ExecutorKind
+from .map_ordered import map_ordered, resolve_jobs
+
+__all__ = [
+    "ExecutorKind",
+    "map_ordered",
+    "resolve_jobs",
+]
@@ -0,0 +1,14 @@
+import enum
+
+
+@enum.unique
+class ExecutorKind(enum.StrEnum):
+    THREAD = "thread"
+    """Threads. Good for I/O. And for parsing on free-threaded Python."""
+
+    PROCESS = "process"
+    """Processes. Good for CPU-bound parsing. Results are pickled back."""
+
+    @staticmethod
+    def get_default() -> ExecutorKind:
+        return ExecutorKind.THREAD
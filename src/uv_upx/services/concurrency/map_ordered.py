@@ -0,0 +1,46 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from uv_upx.services.concurrency.executor_kind import ExecutorKind
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Get the number of workers. Zero or less means "all available CPUs"."""
+    if jobs > 0:
+        return jobs
+    return os.process_cpu_count() or 1
+
+
+def map_ordered[T, R](
+    func: Callable[[T], R],
+    items: Sequence[T],
+    *,
+    jobs: int = 1,
+    executor_kind: ExecutorKind = ExecutorKind.THREAD,
+) -> list[R]:
+    """Apply the function to each item. Possibly concurrently.
+
+    Results keep the order of the items. So, the output is deterministic.
+
+    For processes, the function and the results must be picklable.
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    executor: Executor
+    chunksize = 1
+    match executor_kind:
+        case ExecutorKind.THREAD:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        case ExecutorKind.PROCESS:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # Note: Less round-trips between processes for many small items.
+            chunksize = max(1, len(items) // (workers * 4))
+
+    with executor:
+        return list(executor.map(func, items, chunksize=chunksize))
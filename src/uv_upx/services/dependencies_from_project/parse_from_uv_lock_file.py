@@ -1,22 +1,19 @@
 from uv_upx.services.dependencies_from_project.models import DependenciesRegistry, Version
+from uv_upx.services.dependencies_from_project.uv_lock_reader import iter_uv_lock_packages
 from uv_upx.services.package_name import PackageName
-from uv_upx.services.toml import toml_parse
 
 
 def parse_from_uv_lock_file(
     content: str,
 ) -> DependenciesRegistry:
-    data = toml_parse(content)
-
+    # Note: Read-only access. So, a format-preserving parser is not needed here.
     dependencies = DependenciesRegistry()
-    for package in data.get("package", []):  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-        version = package.get("version")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-
+    for name, version in iter_uv_lock_packages(content):
         if version is None:
             # Just in case. Possible problem with "[tool.hatch.version]"
             # https://github.com/zundertj/uv-bump/issues/5
             continue
 
-        dependencies[PackageName(package["name"])] = Version(version)  # pyright: ignore[reportUnknownArgumentType] # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        dependencies[PackageName(name)] = Version(version)
 
     return dependencies
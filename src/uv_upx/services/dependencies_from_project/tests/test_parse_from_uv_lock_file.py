@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uv_upx.services.dependencies_from_project import DependenciesRegistry
+from uv_upx.services.dependencies_from_project.models import Version
+from uv_upx.services.dependencies_from_project.parse_from_uv_lock_file import parse_from_uv_lock_file
+from uv_upx.services.dependencies_from_project.uv_lock_reader import (
+    iter_uv_lock_packages,
+    iter_uv_lock_packages_i_full_parse,
+)
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.toml import toml_parse
+from uv_upx.tests.synthetic import make_uv_lock_content
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def parse_from_uv_lock_file_i_tomlkit(content: str) -> DependenciesRegistry:
+    """Previous implementation. Kept for comparison."""
+    data = toml_parse(content)
+
+    dependencies = DependenciesRegistry()
+    for package in data.get("package", []):  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        version = package.get("version")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if version is None:
+            continue
+        dependencies[PackageName(package["name"])] = Version(version)  # pyright: ignore[reportUnknownArgumentType]
+    return dependencies
+
+
+@pytest.fixture
+def lock_file_contents() -> str:
+    return """version = 1
+revision = 3
+requires-python = ">=3.14"
+
+[[package]]
+name = "Bla_Bla"
+version = "0.2.1"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "dynamic-member"
+source = { editable = "packages/dynamic-member" }
+
+[package.metadata]
+requires-dist = [{ name = "foo", specifier = ">=1.0" }]
+
+[[package]]
+name = "foo"
+version = "1.21.0"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+
+def test_parse_from_uv_lock_file(lock_file_contents: str) -> None:
+    result = parse_from_uv_lock_file(lock_file_contents)
+    assert result == DependenciesRegistry(
+        {
+            PackageName("bla-bla"): Version("0.2.1"),
+            PackageName("foo"): Version("1.21.0"),
+        },
+    )
+
+
+def test_iter_uv_lock_packages_i_fallback_on_unexpected_layout() -> None:
+    content = """
+[[package]]
+version = "1.0.0"
+name = "reordered"
+"""
+    assert list(iter_uv_lock_packages(content)) == [("reordered", "1.0.0")]
+
+
+def test_iter_uv_lock_packages_i_fallback_on_version_after_other_keys() -> None:
+    # Note: Same number of headers and tables. But `version` is not right after `name`.
+    content = """
+[[package]]
+name = "dynamic"
+source = { editable = "." }
+
+[[package]]
+name = "reordered"
+source = { registry = "https://pypi.org/simple" }
+version = "1.0.0"
+
+[package.metadata]
+requires-dist = [{ name = "foo", specifier = ">=1" }]
+"""
+    assert list(iter_uv_lock_packages(content)) == [("dynamic", None), ("reordered", "1.0.0")]
+
+
+def test_iter_uv_lock_packages_i_same_as_full_parse() -> None:
+    content = make_uv_lock_content(200)
+    assert list(iter_uv_lock_packages(content)) == iter_uv_lock_packages_i_full_parse(content)
+
+
+def test_parse_from_uv_lock_file_i_same_as_tomlkit() -> None:
+    content = make_uv_lock_content(200)
+    assert parse_from_uv_lock_file(content) == parse_from_uv_lock_file_i_tomlkit(content)
+
+
+@pytest.mark.benchmark(group="parse_from_uv_lock_file")
+@pytest.mark.parametrize(
+    "parser",
+    [
+        pytest.param(parse_from_uv_lock_file, id="scanner"),
+        pytest.param(parse_from_uv_lock_file_i_tomlkit, id="tomlkit"),
+    ],
+)
+def test_benchmark_parse_from_uv_lock_file(
+    benchmark: BenchmarkFixture,
+    parser: Callable[[str], DependenciesRegistry],
+) -> None:
+    # Note: Keep it small. The tomlkit-based parser is too slow for big locks.
+    packages_count = 300
+    content = make_uv_lock_content(packages_count)
+    result = benchmark.pedantic(parser, args=(content,), rounds=3, iterations=1)
+    assert len(result.root) == packages_count
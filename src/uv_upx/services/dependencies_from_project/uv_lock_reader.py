@@ -0,0 +1,75 @@
+import re
+import tomllib
+from re import Pattern
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type UvLockPackageEntry = tuple[str, str | None]
+"""Package name (as written in uv.lock) and its version.
+
+Version can be None. For example, for dynamic versions of workspace members.
+"""
+
+MARKER_I_PACKAGE_TABLE: Final[str] = "[[package]]"
+
+# uv writes `name` and `version` as the first keys of each `[[package]]` table.
+#   So, there is no need to parse the whole document. Wheels, sdists and metadata are skipped.
+PATTERN_I_PACKAGE_HEADER: Final[Pattern[str]] = re.compile(
+    r"""^\[\[package\]\]\r?\n
+name\ =\ "(?P<name>[^"\\]+)"\r?\n
+(?:version\ =\ "(?P<version>[^"\\]+)"\r?\n)?
+""",
+    re.MULTILINE | re.VERBOSE,
+)
+
+PATTERN_I_PACKAGE_TABLE: Final[Pattern[str]] = re.compile(r"^\[\[package\]\]\s*$", re.MULTILINE)
+
+PATTERN_I_TABLE_HEADER: Final[Pattern[str]] = re.compile(r"^\[", re.MULTILINE)
+
+PATTERN_I_VERSION_KEY: Final[Pattern[str]] = re.compile(r"^version\s*=", re.MULTILINE)
+
+
+def iter_uv_lock_packages(
+    content: str,
+) -> Iterable[UvLockPackageEntry]:
+    """Read name and version of each package from uv.lock content.
+
+    Read-only. Use the streaming scanner of `[[package]]` headers.
+    Fall back to the full (but still non-preserving) parser if the layout is unexpected.
+    """
+    if MARKER_I_PACKAGE_TABLE not in content:
+        return ()
+
+    entries: list[UvLockPackageEntry] = []
+    for match in PATTERN_I_PACKAGE_HEADER.finditer(content):
+        if match["version"] is None and has_version_key_in_table(content, start=match.end()):
+            # `version` is not right after `name`. Don't read it as a missing version.
+            return iter_uv_lock_packages_i_full_parse(content)
+        entries.append((match["name"], match["version"]))
+
+    if len(entries) != len(PATTERN_I_PACKAGE_TABLE.findall(content)):
+        # Some tables were not recognized by the scanner. Don't guess.
+        return iter_uv_lock_packages_i_full_parse(content)
+
+    return entries
+
+
+def has_version_key_in_table(
+    content: str,
+    *,
+    start: int,
+) -> bool:
+    """Check the rest of the table for the `version` key. Up to the next table header."""
+    next_header = PATTERN_I_TABLE_HEADER.search(content, start)
+    end = next_header.start() if next_header is not None else len(content)
+    return PATTERN_I_VERSION_KEY.search(content, start, end) is not None
+
+
+def iter_uv_lock_packages_i_full_parse(
+    content: str,
+) -> list[UvLockPackageEntry]:
+    data = tomllib.loads(content)
+    packages: list[dict[str, Any]] = data.get("package", [])
+    return [(package["name"], package.get("version")) for package in packages]
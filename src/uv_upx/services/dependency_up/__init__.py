@@ -1,7 +1,8 @@
-from uv_upx.services.dependency_up.models.changes_list import ChangesList
+from uv_upx.services.dependency_up.models.changes_list import ChangesList, DependencyLocation
 from uv_upx.services.dependency_up.models.included_dependency_group import IncludedDependencyGroup
 
 __all__ = [
     "ChangesList",
+    "DependencyLocation",
     "IncludedDependencyGroup",
 ]
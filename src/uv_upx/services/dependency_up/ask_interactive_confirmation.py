@@ -1,8 +1,6 @@
 from html import escape
 from typing import TYPE_CHECKING
 
-from prompt_toolkit import HTML, choice, print_formatted_text
-
 if TYPE_CHECKING:
     import pathlib
 
@@ -16,8 +14,8 @@ You will be prompted for each proposed change.
 
 Note: These changes related to updating dependencies in pyproject.toml files.
 It is implying how dependencies will be updated.
-But, if you reject ">=X.Y.Z" change, it will not updated in pyproject.toml,
-but it may still be updated in the lock file (e.g., uv.lock).
+Only packages with accepted changes are upgraded in the lock file (e.g., uv.lock).
+Rejected ones keep their locked versions. Unless an accepted upgrade requires a newer version.
 """
     print(message)
 
@@ -28,6 +26,9 @@ def ask_interactive_confirmation(
     path: pathlib.Path,
 ) -> bool:
     """Ask the user for confirmation in interactive mode."""
+    # Note: prompt_toolkit is heavy. Import it only in interactive mode.
+    from prompt_toolkit import HTML, choice, print_formatted_text  # noqa: PLC0415
+
     print("=" * 40)
     print(f"In file: {path.as_uri()}")
     folder_name = path.parent.name
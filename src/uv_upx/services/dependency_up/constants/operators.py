@@ -8,10 +8,16 @@ VERSION_OPERATOR_I_GREATER_OR_EQUAL: Final[VERSION_OPERATOR] = ">="
 
 VERSION_OPERATOR_I_EQUAL: Final[VERSION_OPERATOR] = "=="
 
+VERSION_OPERATOR_I_COMPATIBLE: Final[VERSION_OPERATOR] = "~="
+
 VERSION_OPERATORS_I_PUT_IF_DIFFERENT: Final[set[VERSION_OPERATOR]] = {
     VERSION_OPERATOR_I_GREATER_OR_EQUAL,
 }
 
+VERSION_OPERATORS_I_BUMP_KEEPING_PRECISION: Final[set[VERSION_OPERATOR]] = {
+    VERSION_OPERATOR_I_COMPATIBLE,
+}
+
 VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE: Final[set[VERSION_OPERATOR]] = {
     VERSION_OPERATOR_I_EQUAL,
 }
@@ -21,20 +27,21 @@ VERSION_OPERATORS_I_EXPLICIT_IGNORE: Final[set[VERSION_OPERATOR]] = {
     VERSION_OPERATOR_I_EQUAL,
     "===",
     #
-    # Upper bounds
+    # Upper bounds. uv keeps the locked version below them. So, nothing to bump.
     "<",
     "<=",
     #
-    # May needed advanced logic here
-    "~=",
-    #
     # Need to calculate a previous version. Skip for now.
     ">",
     #
-    # Special case
+    # Special case. Excluded version stays excluded.
     "!=",
 }
 
+VERSION_OPERATORS_I_HANDLED: Final[set[VERSION_OPERATOR]] = (
+    VERSION_OPERATORS_I_PUT_IF_DIFFERENT | VERSION_OPERATORS_I_BUMP_KEEPING_PRECISION
+)
+
 VERSION_OPERATORS_I_ALL: Final[set[VERSION_OPERATOR]] = (
-    VERSION_OPERATORS_I_PUT_IF_DIFFERENT | VERSION_OPERATORS_I_EXPLICIT_IGNORE
+    VERSION_OPERATORS_I_HANDLED | VERSION_OPERATORS_I_EXPLICIT_IGNORE
 )
@@ -1,53 +1,61 @@
-import copy
+import dataclasses
 import logging
 from typing import TYPE_CHECKING
 
-from uv_upx.services.collect_dependencies.models import DependencyItemParsed
+from uv_upx.services.changes_report import ChangeStatus, report_change
 from uv_upx.services.dependency_up.ask_interactive_confirmation import (
     ask_interactive_confirmation,
     show_interactive_information,
 )
 from uv_upx.services.dependency_up.update_dependency import update_dependency_v2
-from uv_upx.services.toml import toml_save
+from uv_upx.services.parse_v2.save_py_project import save_py_project
 from uv_upx.services.upgrade_profile import UpgradeProfile
 
 if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+    from uv_upx.services.collect_dependencies.models import DependencyGroupParsed, DependencyItemParsed
     from uv_upx.services.dependencies_from_project import DependenciesRegistry
     from uv_upx.services.dependency_up import ChangesList
-    from uv_upx.services.parse_v2.collect_dependencies import CollectedTopLevelDependencies, PyProjectWrapperExtra
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.parse_v2.collect_dependencies import PyProjectWrapperExtra
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
 
 
-def handle_py_project_v2(
+def handle_py_project_v2(  # noqa: PLR0913
     *,
     dependencies_registry: DependenciesRegistry,
     py_project: PyProjectWrapperExtra,
+    project_root_path: pathlib.Path,
     #
     verbose: bool,
     #
     profile: UpgradeProfile,
     #
     interactive: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
 ) -> ChangesList:
     """Handle a single pyproject.toml file."""
     logger = logging.getLogger(__name__)
 
-    data = py_project.data
-
     changes: ChangesList = []
 
     # TODO: Optimize.
 
     for group in py_project.dependency_groups_parsed:
-        for index, dependency in enumerate(group.parsed_dependencies):
+        location = group.get_location(py_project.path)
+        for index, dependency in iter_dependencies_to_handle(group, package_filter=package_filter):
             dependency_parsed = dependency.parsed
 
-            dependency_candidate = copy.deepcopy(dependency_parsed)
-
             change_or_none = update_dependency_v2(
                 dependencies_registry=dependencies_registry,
-                parsed=dependency_candidate,
+                parsed=dependency_parsed,
                 #
                 profile=profile,
+                #
+                location=location,
             )
             if change_or_none is not None:
                 apply_change = True
@@ -58,12 +66,17 @@ def handle_py_project_v2(
                         path=py_project.path,
                     )
 
+                report_change(
+                    change_or_none,
+                    status=ChangeStatus.ACCEPTED if apply_change else ChangeStatus.REJECTED,
+                    project_root_path=project_root_path,
+                )
+
                 if apply_change:
+                    dependency_candidate = change_or_none.to_item
                     changes.append(change_or_none)
-                    group.parsed_dependencies[index] = DependencyItemParsed(
-                        index_in_group=dependency.index_in_group,
-                        parsed=dependency_candidate,
-                    )
+                    # Note: Keep the literal span. So, only this literal is replaced on save.
+                    group.parsed_dependencies[index] = dataclasses.replace(dependency, parsed=dependency_candidate)
 
                     group.dependencies[dependency.index_in_group] = dependency_candidate.get_full_spec()
 
@@ -74,8 +87,8 @@ def handle_py_project_v2(
 
     if changes or (profile is UpgradeProfile.WITH_PINNED):
         # Note: "(profile is UpgradeProfile.WITH_PINNED)" require some way to write back changes.
-        toml_save(py_project.path, data)
-        logger.info(f"Saved changes to {py_project.path.as_uri()}")
+        if save_py_project(py_project):
+            logger.info(f"Saved changes to {py_project.path.as_uri()}")
 
         for change in changes:
             logger.info(f"  {change}")
@@ -83,16 +96,29 @@ def handle_py_project_v2(
     return changes
 
 
-def handle_py_projects_v2(
+def iter_dependencies_to_handle(
+    group: DependencyGroupParsed,
+    *,
+    package_filter: PackageFilter | None = None,
+) -> Iterable[tuple[int, DependencyItemParsed]]:
+    """Dependencies of the group with their indexes. Only selected by the filter, if set."""
+    for index, dependency in enumerate(group.parsed_dependencies):
+        if package_filter is None or package_filter.matches(dependency.parsed.package_name):
+            yield index, dependency
+
+
+def handle_py_projects_v2(  # noqa: PLR0913
     *,
     dependencies_registry: DependenciesRegistry,
-    collected_top_level_dependencies: CollectedTopLevelDependencies,
+    workspace_snapshot: WorkspaceSnapshot,
     #
     verbose: bool,
     #
     profile: UpgradeProfile,
     #
     interactive: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
 ) -> ChangesList:
     """Handle multiple pyproject.toml files."""
     changes: ChangesList = []
@@ -100,16 +126,19 @@ def handle_py_projects_v2(
     if interactive:
         show_interactive_information()
 
-    for py_project in collected_top_level_dependencies.parsed_pyprojects:
+    for py_project in workspace_snapshot.collected_top_level_dependencies.parsed_pyprojects:
         changes_local = handle_py_project_v2(
             dependencies_registry=dependencies_registry,
             py_project=py_project,
+            project_root_path=workspace_snapshot.project_root_path,
             #
             verbose=verbose,
             #
             profile=profile,
             #
             interactive=interactive,
+            #
+            package_filter=package_filter,
         )
         changes.extend(changes_local)
 
@@ -1,12 +1,34 @@
-from pydantic import BaseModel
+import dataclasses
+import pathlib
 
 from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed
 
 
-class ChangesItem(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class DependencyLocation:
+    """Where the dependency is declared."""
+
+    path: pathlib.Path
+    """Path to pyproject.toml."""
+
+    section: str
+    """Like `project.dependencies` or `dependency-groups`."""
+
+    group_name: str | None = None
+
+    def __str__(self) -> str:
+        group = f"[{self.group_name}]" if self.group_name is not None else ""
+        return f"{self.path.as_uri()} {self.section}{group}"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ChangesItem:
     from_item: DependencyParsed
     to_item: DependencyParsed
 
+    location: DependencyLocation | None = None
+    """None if unknown."""
+
     def __str__(self) -> str:
         return (
             f"{self.from_item.get_name_with_extras()}: "
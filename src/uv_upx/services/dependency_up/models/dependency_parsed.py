@@ -1,14 +1,8 @@
-from typing import Annotated
-
-from pydantic import AfterValidator, BaseModel, Field
+import dataclasses
 
 from uv_upx.services.dependency_up.constants.operators import VERSION_OPERATOR, VERSION_OPERATORS_I_ALL
 from uv_upx.services.package_name import PackageName
 
-# TODO: (?) Use this?
-#   from packaging.specifiers import SpecifierSet
-#   from packaging.version import Version
-
 
 def validate_version_value(value: str) -> str:
     if not value.strip():
@@ -29,9 +23,15 @@ def validate_operator(value: str) -> VERSION_OPERATOR:
     return value
 
 
-class VersionConstraint(BaseModel):
-    operator: Annotated[VERSION_OPERATOR, AfterValidator(validate_operator)]
-    version: Annotated[str, AfterValidator(validate_version_value)]
+@dataclasses.dataclass(frozen=True, slots=True)
+class VersionConstraint:
+    """Single version constraint. Like `>=1.2.3`.
+
+    Not validated on construction. Use `validate_operator` and `validate_version_value` for untrusted input.
+    """
+
+    operator: VERSION_OPERATOR
+    version: str
 
     def __str__(self) -> str:
         return f"{self.operator}{self.version}"
@@ -46,25 +46,32 @@ Like:
 """
 
 
-class DependencyParsed(BaseModel):
-    # https://peps.python.org/pep-0508/
-
-    original_name: str | None = None
-    """Original dependency name (e.g., reQuests).
+@dataclasses.dataclass(frozen=True, slots=True)
+class DependencyParsed:
+    """Parsed dependency string.
 
-    None if not preserved.
+    Immutable. Parsed results are shared between all usages of the same string.
+    Use `dataclasses.replace(...)` to get a changed version.
     """
 
+    # https://peps.python.org/pep-0508/
+
     package_name: PackageName
     """Normalized package name (e.g., requests).
 
     Needed for better search.
     """
 
-    extras: list[str] = Field(default_factory=list)
+    original_name: str | None = None
+    """Original dependency name (e.g., reQuests).
+
+    None if not preserved.
+    """
+
+    extras: tuple[str, ...] = ()
     """Extras (e.g., [dev])"""
 
-    version_constraints: list[VersionConstraint] = Field(default_factory=list)
+    version_constraints: tuple[VersionConstraint, ...] = ()
     """Version constraints (e.g., `>=1.2.3`, `==4.5.6`)"""
 
     marker: str | None = None
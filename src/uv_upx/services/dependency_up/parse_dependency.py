@@ -1,11 +1,21 @@
+import functools
 import re
 from re import Pattern
 from typing import Final
 
 from uv_upx.services.dependency_up.constants.operators import VERSION_OPERATORS_I_ALL
-from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed, DependencyString, VersionConstraint
+from uv_upx.services.dependency_up.models.dependency_parsed import (
+    DependencyParsed,
+    DependencyString,
+    VersionConstraint,
+    validate_operator,
+    validate_version_value,
+)
 from uv_upx.services.package_name import PackageName
 
+PARSE_DEPENDENCY_CACHE_MAX_SIZE: Final[int] = 4096
+"""Max number of distinct dependency strings to keep parsed."""
+
 VERSION_OPERATORS_AS_OR: Final[str] = "|".join(sorted(VERSION_OPERATORS_I_ALL, key=lambda x: len(x), reverse=True))
 
 # https://peps.python.org/pep-0440/#version-specifiers
@@ -46,6 +56,36 @@ def parse_dependency(
     #
     *,
     preserve_original_package_names: bool = False,
+) -> DependencyParsed:
+    """Parse the dependency string.
+
+    Results are cached. So, identical strings are parsed once per process.
+    Results are immutable. So, they can be shared safely.
+    """
+    return parse_dependency_i_cached(dependency_string, preserve_original_package_names)
+
+
+@functools.lru_cache(maxsize=PARSE_DEPENDENCY_CACHE_MAX_SIZE)
+def parse_dependency_i_cached(
+    dependency_string: DependencyString,
+    preserve_original_package_names: bool,  # noqa: FBT001
+) -> DependencyParsed:
+    return parse_dependency_i_uncached(
+        dependency_string,
+        preserve_original_package_names=preserve_original_package_names,
+    )
+
+
+def get_parse_dependency_cache_info() -> functools._CacheInfo:  # pyright: ignore[reportPrivateUsage]
+    """Get stats of the parse cache. Hits, misses, size."""
+    return parse_dependency_i_cached.cache_info()
+
+
+def parse_dependency_i_uncached(
+    dependency_string: DependencyString,
+    #
+    *,
+    preserve_original_package_names: bool = False,
 ) -> DependencyParsed:  # sourcery skip: low-code-quality
     dependency_string = dependency_string.strip()
 
@@ -58,7 +98,7 @@ def parse_dependency(
     name = match.group("name")
 
     extras_raw = match.group("extras") or ""
-    extras = [item_ for item in extras_raw.split(",") if (item_ := item.strip())]
+    extras = tuple(item_ for item in extras_raw.split(",") if (item_ := item.strip()))
 
     version_constraints_raw = match.group("version_constraints") or ""
     version_constraints = parse_version_constraints(version_constraints_raw)
@@ -77,12 +117,12 @@ def parse_dependency(
 
 def parse_version_constraints(
     version_part: str,
-) -> list[VersionConstraint]:
+) -> tuple[VersionConstraint, ...]:
     # parse version constraints (comma separated)
     version_constraints: list[VersionConstraint] = []
 
     if not version_part:
-        return version_constraints
+        return ()
 
     # do not attempt to parse direct URL / VCS refs (start with '@')
     if version_part.startswith("@"):
@@ -97,17 +137,11 @@ def parse_version_constraints(
             msg = f"Invalid version constraint: '{raw_part}'"
             raise ValueError(msg)
 
-        operator = match_vc.group("operator")
-        version = match_vc.group("version")
-
-        if operator not in VERSION_OPERATORS_I_ALL:
-            msg = f"Invalid version operator: '{operator}'"
-            raise ValueError(msg)
-
+        # Note: Validate here. Models are not validated on construction.
         version_constraint = VersionConstraint(
-            operator=operator,
-            version=version,
+            operator=validate_operator(match_vc.group("operator")),
+            version=validate_version_value(match_vc.group("version")),
         )
         version_constraints.append(version_constraint)
 
-    return version_constraints
+    return tuple(version_constraints)
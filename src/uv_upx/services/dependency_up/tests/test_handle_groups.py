@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+import uv_upx.services.parse_v2.save_py_project as save_py_project_module
+from uv_upx.services.dependencies_from_project import DependenciesRegistry, Version
+from uv_upx.services.dependency_up.handle_groups import handle_py_project_v2
+from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.parse_v2.collect_dependencies import collect_top_level_dependencies
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+PY_PROJECT = """[project]
+name = "root"
+version = "0.1.0"
+dependencies = [
+    # Better classes and data validation
+    "pydantic>=2.12.5",   # aligned comment
+    'tomlkit >= 0.13.3',  # keep the style of untouched items
+]
+
+[dependency-groups]
+dev = [ "pytest>=9.0.2" ]
+"""
+
+DEPENDENCIES_REGISTRY = DependenciesRegistry(
+    root={
+        PackageName("pydantic"): Version("2.13.0"),
+        PackageName("tomlkit"): Version("0.13.3"),
+        PackageName("pytest"): Version("9.1.0"),
+    },
+)
+
+
+def fail_on_full_serialization(*_args: object) -> str:
+    msg = "The document was re-serialized. Only changed literals must be replaced."
+    raise AssertionError(msg)
+
+
+def test_handle_py_project_v2_i_only_changed_literals_are_written(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(PY_PROJECT.encode())
+    monkeypatch.setattr(save_py_project_module, "toml_dumps", fail_on_full_serialization)
+    collected = collect_top_level_dependencies(
+        py_projects=get_all_pyprojects_by_project_root_path(tmp_path),
+    )
+
+    changes = handle_py_project_v2(
+        dependencies_registry=DEPENDENCIES_REGISTRY,
+        py_project=collected.parsed_pyprojects[0],
+        project_root_path=tmp_path,
+        #
+        verbose=False,
+        #
+        profile=UpgradeProfile.DEFAULT,
+    )
+
+    assert [str(change) for change in changes] == [
+        "pydantic: >=2.12.5 -> >=2.13.0",
+        "pytest: >=9.0.2 -> >=9.1.0",
+    ]
+    assert path.read_bytes() == (
+        PY_PROJECT.replace('"pydantic>=2.12.5"', '"pydantic>=2.13.0"')
+        .replace('"pytest>=9.0.2"', '"pytest>=9.1.0"')
+        .encode()
+    )
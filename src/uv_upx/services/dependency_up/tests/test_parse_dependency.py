@@ -1,7 +1,9 @@
+import dataclasses
+
 import pytest
 
 from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed, VersionConstraint
-from uv_upx.services.dependency_up.parse_dependency import parse_dependency
+from uv_upx.services.dependency_up.parse_dependency import get_parse_dependency_cache_info, parse_dependency
 from uv_upx.services.package_name import PackageName
 
 
@@ -19,31 +21,31 @@ from uv_upx.services.package_name import PackageName
             "foo>=32.0",
             DependencyParsed(
                 package_name=PackageName("foo"),
-                version_constraints=[
+                version_constraints=(
                     VersionConstraint(
                         operator=">=",
                         version="32.0",
                     ),
-                ],
+                ),
             ),
         ),
         (  # Simple version constraint
             "foo<=32.0",
             DependencyParsed(
                 package_name=PackageName("foo"),
-                version_constraints=[
+                version_constraints=(
                     VersionConstraint(
                         operator="<=",
                         version="32.0",
                     ),
-                ],
+                ),
             ),
         ),
         (  # Multiple version constraints
             "foo[bla,xyz]>=32.0,!=33,<34;python_version<'3.11'",
             DependencyParsed(
                 package_name=PackageName("foo"),
-                version_constraints=[
+                version_constraints=(
                     VersionConstraint(
                         operator=">=",
                         version="32.0",
@@ -56,8 +58,8 @@ from uv_upx.services.package_name import PackageName
                         operator="<",
                         version="34",
                     ),
-                ],
-                extras=["bla", "xyz"],
+                ),
+                extras=("bla", "xyz"),
                 marker="python_version<'3.11'",
             ),
         ),
@@ -65,7 +67,7 @@ from uv_upx.services.package_name import PackageName
             'foo[bla,xyz] >=32.0, !=33, <34 ;python_version<"3.11"',
             DependencyParsed(
                 package_name=PackageName("foo"),
-                version_constraints=[
+                version_constraints=(
                     VersionConstraint(
                         operator=">=",
                         version="32.0",
@@ -78,8 +80,8 @@ from uv_upx.services.package_name import PackageName
                         operator="<",
                         version="34",
                     ),
-                ],
-                extras=["bla", "xyz"],
+                ),
+                extras=("bla", "xyz"),
                 marker='python_version<"3.11"',
             ),
         ),
@@ -91,3 +93,41 @@ def test_parse_dependency(
 ) -> None:
     result = parse_dependency(dependency_string)
     assert result == expected
+
+
+def test_parse_dependency_is_cached() -> None:
+    dependency_string = "cached-foo[bar]>=1.2.3"
+
+    result_first = parse_dependency(dependency_string)
+    hits_before = get_parse_dependency_cache_info().hits
+    result_second = parse_dependency(dependency_string)
+
+    assert result_second is result_first
+    assert get_parse_dependency_cache_info().hits == hits_before + 1
+
+    # Note: The flag is a part of the key.
+    assert parse_dependency(dependency_string, preserve_original_package_names=True) is not result_first
+
+
+def test_parse_dependency_result_is_immutable() -> None:
+    result = parse_dependency("immutable-foo>=1.0")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.package_name = PackageName("bar")  # pyright: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.version_constraints[0].version = "2.0"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@pytest.mark.parametrize(
+    "dependency_string",
+    [
+        "foo>=",
+        "foo>=abc",
+    ],
+)
+def test_parse_dependency_invalid(
+    dependency_string: str,
+) -> None:
+    with pytest.raises(ValueError, match=r"Invalid|Version value"):
+        parse_dependency(dependency_string)
@@ -41,6 +41,38 @@ from uv_upx.services.dependency_up.update_dependency import handle_version_const
             "33.1",
             "<32.0",
         ),
+        (  # Same version by PEP 440. Don't rewrite.
+            VersionConstraint(
+                operator=">=",
+                version="2.0",
+            ),
+            "2.0.0",
+            ">=2.0",
+        ),
+        (  # Older version. Like a pre-release. Don't downgrade.
+            VersionConstraint(
+                operator=">=",
+                version="1.10",
+            ),
+            "1.10rc1",
+            ">=1.10",
+        ),
+        (  # Compatible release. Keep the precision.
+            VersionConstraint(
+                operator="~=",
+                version="1.4",
+            ),
+            "1.7.2",
+            "~=1.7",
+        ),
+        (  # Compatible release. Nothing to bump.
+            VersionConstraint(
+                operator="~=",
+                version="1.4.2",
+            ),
+            "1.4.2",
+            "~=1.4.2",
+        ),
     ],
 )
 def test_handle_version_constraint(
@@ -48,8 +80,8 @@ def test_handle_version_constraint(
     version_new: str,
     expected: str,
 ) -> None:
-    handle_version_constraint(
+    result = handle_version_constraint(
         version_constraint=version_constraint,
         version_new=Version(version_new),
     )
-    assert str(version_constraint) == expected
+    assert str(result) == expected
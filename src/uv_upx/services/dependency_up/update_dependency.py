@@ -1,16 +1,18 @@
-import copy
+import dataclasses
 import logging
 from typing import TYPE_CHECKING, Any
 
 from uv_upx.services.dependency_up.constants.operators import (
     VERSION_OPERATOR_I_GREATER_OR_EQUAL,
+    VERSION_OPERATORS_I_BUMP_KEEPING_PRECISION,
     VERSION_OPERATORS_I_EXPLICIT_IGNORE,
     VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE,
     VERSION_OPERATORS_I_PUT_IF_DIFFERENT,
 )
-from uv_upx.services.dependency_up.models.changes_list import ChangesItem
+from uv_upx.services.dependency_up.models.changes_list import ChangesItem, DependencyLocation
 from uv_upx.services.dependency_up.models.dependency_parsed import DependencyParsed, VersionConstraint
 from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.versions import bump_compatible_release, is_newer_version, is_same_version
 
 if TYPE_CHECKING:
     from uv_upx.services.dependencies_from_project import DependenciesRegistry, Version
@@ -22,6 +24,8 @@ def update_dependency_v2(
     parsed: DependencyParsed,
     #
     profile: UpgradeProfile,
+    #
+    location: DependencyLocation | None = None,
 ) -> ChangesItem | None:
     """Updates the dependency version based on registry lookup."""
     try:
@@ -33,36 +37,27 @@ def update_dependency_v2(
         logger.error(msg)  # noqa: TRY400
         return None
 
-    parsed_original = copy.deepcopy(parsed)
-
-    is_has_changes = False
-    for version_constraint in parsed.version_constraints:
-        is_has_changes_local = handle_version_constraint(
+    version_constraints = tuple(
+        handle_version_constraint(
             version_constraint=version_constraint,
             version_new=version_new,
             #
             profile=profile,
         )
-        if is_has_changes_local:
-            is_has_changes = True
-
-    if not parsed.version_constraints:
-        parsed.version_constraints.append(
-            VersionConstraint(operator=VERSION_OPERATOR_I_GREATER_OR_EQUAL, version=version_new),
-        )
-        is_has_changes = True
+        for version_constraint in parsed.version_constraints
+    )
+    if not version_constraints:
+        version_constraints = (VersionConstraint(operator=VERSION_OPERATOR_I_GREATER_OR_EQUAL, version=version_new),)
 
-    if is_has_changes:
+    if version_constraints != parsed.version_constraints:
         return ChangesItem(
-            from_item=parsed_original,
-            to_item=parsed,
+            from_item=parsed,
+            to_item=dataclasses.replace(parsed, version_constraints=version_constraints),
+            location=location,
         )
     return None
 
 
-type IsHasChanges = bool
-
-
 def handle_version_constraint(
     *,
     version_constraint: VersionConstraint,
@@ -72,30 +67,32 @@ def handle_version_constraint(
     #
     verbose: bool = False,
     dependency: Any | None = None,  # noqa: ANN401
-) -> IsHasChanges:
+) -> VersionConstraint:
     """Handle a single version constraint.
 
-    Change it in-place. Because, for now, it is simpler than rebuilding the whole object.
+    Constraints are immutable. So, return a changed copy. Or the same constraint, if nothing to change.
     """
     logger = logging.getLogger(__name__)
 
-    is_has_changes = False
     if version_constraint.operator in VERSION_OPERATORS_I_PUT_IF_DIFFERENT:
-        # TODO: (?) Implement better version comparison logic here
-        if version_constraint.version != version_new:
-            version_constraint.version = version_new
-            is_has_changes = True
+        # Note: Compare by PEP 440. So, `>=2.0` with `2.0.0` is not rewritten.
+        if is_newer_version(version_new, than=version_constraint.version):
+            return dataclasses.replace(version_constraint, version=version_new)
+
+    elif version_constraint.operator in VERSION_OPERATORS_I_BUMP_KEEPING_PRECISION:
+        version_bumped = bump_compatible_release(version_constraint.version, version_new)
+        if version_bumped is not None:
+            return dataclasses.replace(version_constraint, version=version_bumped)
 
     elif (profile is UpgradeProfile.WITH_PINNED) and (
         version_constraint.operator in VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE
     ):
         # sourcery skip: hoist-similar-statement-from-if, hoist-statement-from-if
-        if version_constraint.version != version_new:
-            version_constraint.version = version_new
-            is_has_changes = True
+        if not is_same_version(version_constraint.version, version_new):
+            return dataclasses.replace(version_constraint, version=version_new)
         # else:
         #     # Note: Workaround. Because we need to roll back the operator change.
-        #     is_has_changes = True
+        #     return a copy
 
     elif version_constraint.operator in VERSION_OPERATORS_I_EXPLICIT_IGNORE:
         if verbose and dependency:
@@ -105,4 +102,4 @@ def handle_version_constraint(
         msg = f"Operator {version_constraint.operator} is not supported yet. Skip. Dependency: {dependency}"
         logger.warning(msg)
 
-    return is_has_changes
+    return version_constraint
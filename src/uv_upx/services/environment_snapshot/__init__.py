@@ -0,0 +1,6 @@
+from .environment_snapshot import EnvironmentSnapshot, take_environment_snapshot
+
+__all__ = [
+    "EnvironmentSnapshot",
+    "take_environment_snapshot",
+]
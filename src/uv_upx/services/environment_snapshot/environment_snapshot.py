@@ -0,0 +1,89 @@
+import logging
+import os
+import pathlib
+import shutil
+from typing import Final
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.fingerprints import get_environment_path
+from uv_upx.services.normalize_paths import get_path_to_app_state_dir
+from uv_upx.services.timings import timed
+
+NAME_OF_ENVIRONMENT_SNAPSHOT_DIR: Final[str] = "environment_snapshot"
+NAME_OF_DISCARDED_ENVIRONMENT_DIR: Final[str] = "environment_discarded"
+
+
+class EnvironmentSnapshot(BaseModel):
+    """Hardlink copy of the project environment. In the `.uv-upx` directory. So, it is ignored by git.
+
+    Hardlinks need the same file system. Like for the default `.venv` in the project root.
+
+    Taking it doesn't copy file contents. uv replaces files of upgraded packages, instead of rewriting them.
+    So, the snapshot keeps the old ones.
+    """
+
+    environment_path: pathlib.Path
+    snapshot_path: pathlib.Path
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+    def restore(self) -> bool:
+        """Put the snapshot in place of the environment. With two renames. Nothing is installed.
+
+        Returns:
+            True if the environment was replaced. False if the snapshot is already gone.
+        """
+        if not self.snapshot_path.is_dir():
+            return False
+
+        discarded_path = self.snapshot_path.with_name(NAME_OF_DISCARDED_ENVIRONMENT_DIR)
+        remove_directory(discarded_path)
+
+        if self.environment_path.exists():
+            self.environment_path.rename(discarded_path)
+        self.snapshot_path.rename(self.environment_path)
+
+        remove_directory(discarded_path)
+        return True
+
+    def discard(self) -> None:
+        remove_directory(self.snapshot_path)
+
+
+@timed("take_environment_snapshot")
+def take_environment_snapshot(project_root_path: pathlib.Path) -> EnvironmentSnapshot | None:
+    """Snapshot the project environment. Or None, if there is nothing to snapshot or it can't be hardlinked.
+
+    A leftover snapshot (like from a killed run) is replaced.
+    """
+    logger = logging.getLogger(__name__)
+
+    environment_path = get_environment_path(project_root_path)
+    if not environment_path.is_dir() or environment_path.is_symlink():
+        logger.info(f"No environment to snapshot at {environment_path}.")
+        return None
+
+    snapshot = EnvironmentSnapshot(
+        environment_path=environment_path,
+        snapshot_path=get_path_to_app_state_dir(project_root_path) / NAME_OF_ENVIRONMENT_SNAPSHOT_DIR,
+    )
+    snapshot.discard()
+
+    try:
+        # Note: Directories are created. Files are hardlinked. Symlinks (like bin/python) are kept as is.
+        shutil.copytree(environment_path, snapshot.snapshot_path, symlinks=True, copy_function=os.link)
+    except OSError as e:
+        logger.warning(f"Failed to snapshot the environment: {e}. Rollback will sync it instead.")
+        snapshot.discard()
+        return None
+
+    logger.info(f"Snapshotted the environment into {snapshot.snapshot_path}.")
+    return snapshot
+
+
+def remove_directory(path: pathlib.Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
@@ -0,0 +1,83 @@
+import pathlib
+import sys
+
+import pytest
+
+from uv_upx.services.environment_snapshot import take_environment_snapshot
+from uv_upx.services.fingerprints import compute_environment_fingerprint
+from uv_upx.services.fingerprints.environment import NAME_OF_ENV_I_PROJECT_ENVIRONMENT
+from uv_upx.services.normalize_paths import NAME_OF_APP_STATE_DIR
+
+
+@pytest.fixture
+def project_root_path(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    monkeypatch.delenv(NAME_OF_ENV_I_PROJECT_ENVIRONMENT, raising=False)
+
+    environment_path = tmp_path / ".venv"
+    site_packages_path = environment_path / "lib" / "python3.14" / "site-packages"
+    (site_packages_path / "foo").mkdir(parents=True)
+    (site_packages_path / "foo-1.0.dist-info").mkdir()
+    (site_packages_path / "foo" / "__init__.py").write_text("VERSION = '1.0'\n", encoding="utf-8")
+    (environment_path / "pyvenv.cfg").write_text("home = /usr/bin\n", encoding="utf-8")
+    if sys.platform != "win32":
+        (environment_path / "bin").mkdir()
+        (environment_path / "bin" / "python").symlink_to(sys.executable)
+    return tmp_path
+
+
+def list_names(path: pathlib.Path) -> list[str]:
+    return sorted(item.name for item in path.iterdir())
+
+
+def upgrade_foo(site_packages_path: pathlib.Path) -> None:
+    """Like uv: files of the old version are removed. New ones are written."""
+    (site_packages_path / "foo" / "__init__.py").unlink()
+    (site_packages_path / "foo-1.0.dist-info").rmdir()
+    (site_packages_path / "foo" / "__init__.py").write_text("VERSION = '2.0'\n", encoding="utf-8")
+    (site_packages_path / "foo-2.0.dist-info").mkdir()
+
+
+def test_restore_environment_snapshot(project_root_path: pathlib.Path) -> None:
+    site_packages_path = project_root_path / ".venv" / "lib" / "python3.14" / "site-packages"
+    fingerprint_before = compute_environment_fingerprint(project_root_path)
+
+    snapshot = take_environment_snapshot(project_root_path)
+    assert snapshot is not None
+    # Note: In the directory, ignored by git. Not next to the environment.
+    assert snapshot.snapshot_path.parent == project_root_path / NAME_OF_APP_STATE_DIR
+    assert list_names(project_root_path) == [NAME_OF_APP_STATE_DIR, ".venv"]
+    # Note: Files are shared. Not copied.
+    snapshot_init_path = snapshot.snapshot_path / "lib" / "python3.14" / "site-packages" / "foo" / "__init__.py"
+    assert snapshot_init_path.stat().st_ino == (site_packages_path / "foo" / "__init__.py").stat().st_ino
+
+    upgrade_foo(site_packages_path)
+    assert compute_environment_fingerprint(project_root_path) != fingerprint_before
+
+    assert snapshot.restore()
+
+    assert (site_packages_path / "foo" / "__init__.py").read_text(encoding="utf-8") == "VERSION = '1.0'\n"
+    assert compute_environment_fingerprint(project_root_path) == fingerprint_before
+    assert list_names(project_root_path) == [NAME_OF_APP_STATE_DIR, ".venv"]
+    assert list_names(project_root_path / NAME_OF_APP_STATE_DIR) == [".gitignore"]
+    if sys.platform != "win32":
+        assert (project_root_path / ".venv" / "bin" / "python").readlink() == pathlib.Path(sys.executable)
+
+    assert not snapshot.restore()
+
+
+def test_discard_environment_snapshot(project_root_path: pathlib.Path) -> None:
+    snapshot = take_environment_snapshot(project_root_path)
+    assert snapshot is not None
+
+    snapshot.discard()
+
+    assert list_names(project_root_path) == [NAME_OF_APP_STATE_DIR, ".venv"]
+    assert list_names(project_root_path / NAME_OF_APP_STATE_DIR) == [".gitignore"]
+    assert (project_root_path / ".venv" / "pyvenv.cfg").is_file()
+    assert not snapshot.restore()
+
+
+def test_take_environment_snapshot_without_environment(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(NAME_OF_ENV_I_PROJECT_ENVIRONMENT, raising=False)
+
+    assert take_environment_snapshot(tmp_path) is None
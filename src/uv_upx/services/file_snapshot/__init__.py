@@ -0,0 +1,8 @@
+from .models import FileSnapshot, calculate_digest
+from .write_atomically import write_bytes_atomically
+
+__all__ = [
+    "FileSnapshot",
+    "calculate_digest",
+    "write_bytes_atomically",
+]
@@ -0,0 +1,69 @@
+import hashlib
+import pathlib
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.file_snapshot.write_atomically import write_bytes_atomically
+
+type ContentDigest = str
+"""Hex digest of the file content."""
+
+
+def calculate_digest(content: bytes) -> ContentDigest:
+    return hashlib.sha256(content).hexdigest()
+
+
+class FileSnapshot(BaseModel):
+    """Raw content of a file at the moment of reading.
+
+    Bytes are kept as is. So, restoring gives exactly the same file. Including line endings.
+    """
+
+    path: pathlib.Path
+    content: bytes
+    digest: ContentDigest
+
+    model_config = ConfigDict(
+        frozen=True,
+        # Note: Any bytes. Not only UTF-8. Like in the journal.
+        ser_json_bytes="base64",
+        val_json_bytes="base64",
+    )
+
+    @classmethod
+    def from_path(
+        cls,
+        path: pathlib.Path,
+    ) -> FileSnapshot:
+        content = path.read_bytes()
+        return cls(
+            path=path,
+            content=content,
+            digest=calculate_digest(content),
+        )
+
+    def get_text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def is_changed_on_disk(self) -> bool:
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            return True
+
+        # Note: Compare sizes first. It is cheaper than hashing.
+        return len(content) != len(self.content) or calculate_digest(content) != self.digest
+
+    def restore(self) -> bool:
+        """Write the original content back. Only if the file was changed.
+
+        Untouched files keep their mtime.
+
+        Returns:
+            True if the file was rewritten.
+        """
+        if not self.is_changed_on_disk():
+            return False
+
+        write_bytes_atomically(self.path, self.content)
+        return True
@@ -0,0 +1,68 @@
+import stat
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uv_upx.services.file_snapshot import FileSnapshot, write_bytes_atomically
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def test_restore_i_unchanged_file_is_not_rewritten(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(b'[project]\r\nname = "foo"\r\n')
+    snapshot = FileSnapshot.from_path(path)
+    mtime_before = path.stat().st_mtime_ns
+
+    assert not snapshot.is_changed_on_disk()
+    assert not snapshot.restore()
+    assert path.stat().st_mtime_ns == mtime_before
+
+
+def test_restore_i_changed_file_is_rewritten(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    original = b'[project]\r\nname = "foo"\r\n'
+    path.write_bytes(original)
+    snapshot = FileSnapshot.from_path(path)
+
+    path.write_text('[project]\nname = "bar"\n', encoding="utf-8")
+    assert snapshot.is_changed_on_disk()
+    assert snapshot.restore()
+    assert path.read_bytes() == original
+
+
+def test_restore_i_removed_file_is_recreated(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "uv.lock"
+    path.write_bytes(b"version = 1\n")
+    snapshot = FileSnapshot.from_path(path)
+
+    path.unlink()
+    assert snapshot.restore()
+    assert path.read_bytes() == b"version = 1\n"
+
+
+def test_restore_i_non_utf8_file_is_kept_in_json(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "uv.lock"
+    original = b"version = 1\n# \xff\xfe\n"
+    path.write_bytes(original)
+    snapshot = FileSnapshot.model_validate_json(FileSnapshot.from_path(path).model_dump_json())
+
+    path.write_bytes(b"version = 2\n")
+    assert snapshot.restore()
+    assert path.read_bytes() == original
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions.")
+def test_write_bytes_atomically_keeps_permissions(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(b"old\n")
+    permissions = 0o640
+    path.chmod(permissions)
+
+    write_bytes_atomically(path, b"new\n")
+
+    assert path.read_bytes() == b"new\n"
+    assert stat.S_IMODE(path.stat().st_mode) == permissions
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pyproject.toml"]
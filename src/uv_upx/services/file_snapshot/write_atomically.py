@@ -0,0 +1,39 @@
+import contextlib
+import os
+import pathlib
+import stat
+import tempfile
+from typing import Final
+
+PERMISSIONS_I_NEW_FILE: Final[int] = 0o666
+
+
+def write_bytes_atomically(path: pathlib.Path, content: bytes) -> None:
+    """Write the file via a temporary file next to it and `os.replace`.
+
+    So, a crash leaves either the old content or the new one. Never a truncated file.
+    Permissions of the existing file are kept.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temp_path = pathlib.Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        temp_path.chmod(get_permissions(path))
+        temp_path.replace(path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            temp_path.unlink()
+        raise
+
+
+def get_permissions(path: pathlib.Path) -> int:
+    """Permissions of the existing file. Or the default ones for a new file. `mkstemp` creates private files."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return PERMISSIONS_I_NEW_FILE & ~umask
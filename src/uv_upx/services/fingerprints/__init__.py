@@ -0,0 +1,12 @@
+from .environment import Fingerprint, compute_environment_fingerprint, get_environment_path
+from .sync_state import SyncState, compute_lock_fingerprint, is_sync_needed, save_sync_state
+
+__all__ = [
+    "Fingerprint",
+    "SyncState",
+    "compute_environment_fingerprint",
+    "compute_lock_fingerprint",
+    "get_environment_path",
+    "is_sync_needed",
+    "save_sync_state",
+]
@@ -0,0 +1,69 @@
+import hashlib
+import os
+import pathlib
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+NAME_OF_DEFAULT_ENVIRONMENT_DIR: Final[str] = ".venv"
+NAME_OF_ENV_I_PROJECT_ENVIRONMENT: Final[str] = "UV_PROJECT_ENVIRONMENT"
+
+NAMES_I_IGNORED_ENTRIES: Final[frozenset[str]] = frozenset({"__pycache__"})
+"""Changed by imports, not by installs."""
+
+FINGERPRINT_I_MISSING: Final[str] = "missing"
+
+type Fingerprint = str
+
+
+def get_environment_path(project_root_path: pathlib.Path) -> pathlib.Path:
+    """Path to the project environment. Same rules as in uv.
+
+    https://docs.astral.sh/uv/concepts/projects/config/#project-environment-path
+    """
+    environment_path = os.environ.get(NAME_OF_ENV_I_PROJECT_ENVIRONMENT)
+    if environment_path:
+        return project_root_path / pathlib.Path(environment_path).expanduser()
+    return project_root_path / NAME_OF_DEFAULT_ENVIRONMENT_DIR
+
+
+def get_site_packages_paths(environment_path: pathlib.Path) -> list[pathlib.Path]:
+    # POSIX: lib/python3.X/site-packages. Windows: Lib/site-packages.
+    return sorted(
+        path
+        for path in [*environment_path.glob("lib/python*/site-packages"), environment_path / "Lib" / "site-packages"]
+        if path.is_dir()
+    )
+
+
+def compute_environment_fingerprint(project_root_path: pathlib.Path) -> Fingerprint:
+    """Fingerprint of the installed packages of the project environment.
+
+    Only top-level entries of site-packages are checked. Without reading files.
+    Each install, upgrade or removal adds or replaces some of them. Like `*.dist-info` directories.
+    """
+    environment_path = get_environment_path(project_root_path)
+    if not environment_path.is_dir():
+        return FINGERPRINT_I_MISSING
+
+    digest = hashlib.sha256()
+    update_digest_by_entries(digest, [environment_path / "pyvenv.cfg"])
+    for site_packages_path in get_site_packages_paths(environment_path):
+        digest.update(f"{site_packages_path.relative_to(environment_path).as_posix()}\n".encode())
+        with os.scandir(site_packages_path) as entries:
+            update_digest_by_entries(
+                digest,
+                sorted(pathlib.Path(entry.path) for entry in entries if entry.name not in NAMES_I_IGNORED_ENTRIES),
+            )
+    return digest.hexdigest()
+
+
+def update_digest_by_entries(digest: hashlib._Hash, paths: Iterable[pathlib.Path]) -> None:  # pyright: ignore[reportPrivateUsage]
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            digest.update(f"{path.name}\t{FINGERPRINT_I_MISSING}\n".encode())
+            continue
+        digest.update(f"{path.name}\t{stat.st_mtime_ns}\t{stat.st_size}\n".encode())
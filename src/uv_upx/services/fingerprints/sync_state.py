@@ -0,0 +1,70 @@
+import logging
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, ValidationError
+
+from uv_upx.services.file_snapshot import calculate_digest
+from uv_upx.services.fingerprints.environment import FINGERPRINT_I_MISSING, Fingerprint, compute_environment_fingerprint
+from uv_upx.services.normalize_paths import NAME_OF_UV_LOCK_FILE, get_path_to_app_state_dir
+
+if TYPE_CHECKING:
+    import pathlib
+
+NAME_OF_SYNC_STATE_FILE: Final[str] = "sync_state.json"
+
+
+class SyncState(BaseModel):
+    """State of the project right after `uv sync`. Same state again means the next sync is a no-op."""
+
+    uv_lock: Fingerprint
+    environment: Fingerprint
+
+
+def compute_lock_fingerprint(project_root_path: pathlib.Path) -> Fingerprint:
+    try:
+        return calculate_digest((project_root_path / NAME_OF_UV_LOCK_FILE).read_bytes())
+    except FileNotFoundError:
+        return FINGERPRINT_I_MISSING
+
+
+def compute_sync_state(project_root_path: pathlib.Path) -> SyncState:
+    return SyncState(
+        uv_lock=compute_lock_fingerprint(project_root_path),
+        environment=compute_environment_fingerprint(project_root_path),
+    )
+
+
+def read_sync_state(project_root_path: pathlib.Path) -> SyncState | None:
+    try:
+        return SyncState.model_validate_json(
+            (get_path_to_app_state_dir(project_root_path) / NAME_OF_SYNC_STATE_FILE).read_bytes(),
+        )
+    except FileNotFoundError, ValidationError:
+        return None
+
+
+def save_sync_state(project_root_path: pathlib.Path) -> None:
+    """Remember the state right after a successful `uv sync`."""
+    sync_state = compute_sync_state(project_root_path)
+    (get_path_to_app_state_dir(project_root_path) / NAME_OF_SYNC_STATE_FILE).write_text(
+        sync_state.model_dump_json(),
+        encoding="utf-8",
+    )
+
+
+def is_sync_needed(project_root_path: pathlib.Path) -> bool:
+    """Check if `uv sync --frozen` can change something.
+
+    It is a no-op, if neither uv.lock nor the environment changed since the last sync by uv-upx.
+    """
+    logger = logging.getLogger(__name__)
+
+    saved_sync_state = read_sync_state(project_root_path)
+    if saved_sync_state is None:
+        return True
+
+    if compute_sync_state(project_root_path) != saved_sync_state:
+        return True
+
+    logger.debug("uv.lock and the environment are the same as after the last sync.")
+    return False
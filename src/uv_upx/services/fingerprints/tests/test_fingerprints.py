@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uv_upx.services.fingerprints import compute_environment_fingerprint, is_sync_needed, save_sync_state
+from uv_upx.services.fingerprints.environment import FINGERPRINT_I_MISSING, NAME_OF_ENV_I_PROJECT_ENVIRONMENT
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def project_root_path(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    monkeypatch.delenv(NAME_OF_ENV_I_PROJECT_ENVIRONMENT, raising=False)
+
+    (tmp_path / "uv.lock").write_text("version = 1\n", encoding="utf-8")
+
+    environment_path = tmp_path / ".venv"
+    site_packages_path = environment_path / "lib" / "python3.14" / "site-packages"
+    site_packages_path.mkdir(parents=True)
+    (environment_path / "pyvenv.cfg").write_text("home = /usr/bin\n", encoding="utf-8")
+    (site_packages_path / "foo-1.0.dist-info").mkdir()
+    return tmp_path
+
+
+def test_environment_fingerprint(project_root_path: pathlib.Path) -> None:
+    site_packages_path = project_root_path / ".venv" / "lib" / "python3.14" / "site-packages"
+
+    fingerprint = compute_environment_fingerprint(project_root_path)
+    assert fingerprint == compute_environment_fingerprint(project_root_path)
+
+    # Imports are not installs.
+    (site_packages_path / "__pycache__").mkdir()
+    assert compute_environment_fingerprint(project_root_path) == fingerprint
+
+    (site_packages_path / "foo-1.0.dist-info").rename(site_packages_path / "foo-2.0.dist-info")
+    assert compute_environment_fingerprint(project_root_path) != fingerprint
+
+
+def test_environment_fingerprint_i_missing(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(NAME_OF_ENV_I_PROJECT_ENVIRONMENT, raising=False)
+    assert compute_environment_fingerprint(tmp_path) == FINGERPRINT_I_MISSING
+
+
+def test_is_sync_needed(project_root_path: pathlib.Path) -> None:
+    assert is_sync_needed(project_root_path)
+
+    save_sync_state(project_root_path)
+    assert not is_sync_needed(project_root_path)
+
+    (project_root_path / "uv.lock").write_text("version = 2\n", encoding="utf-8")
+    assert is_sync_needed(project_root_path)
@@ -0,0 +1,196 @@
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, ValidationError
+
+from uv_upx.services.get_all_pyprojects.get_pyproject_paths_by_globs import (
+    get_pyproject_paths_by_globs,
+    split_glob_pattern,
+)
+from uv_upx.services.normalize_paths import NAME_OF_PYPROJECT_FILE, get_path_to_app_state_dir, is_skipped_directory
+
+if TYPE_CHECKING:
+    import pathlib
+
+NAME_OF_DISCOVERY_CACHE_FILE: Final[str] = "workspace_discovery.json"
+
+MTIME_I_MISSING: Final[int] = -1
+
+SECONDS_I_MTIME_SAFETY_GAP: Final[float] = 2.0
+"""Don't trust directories changed so recently. Some filesystems have coarse timestamps."""
+
+type RelativePath = str
+type MtimeNs = int
+type DirectoryListing = list[str]
+
+
+class DiscoveryCache(BaseModel):
+    members: list[str]
+    exclude: list[str]
+
+    directories: dict[RelativePath, MtimeNs]
+    """Mtimes of directories, which can affect the result of globs."""
+
+    projects_directories: dict[RelativePath, DirectoryListing] = {}
+    """Same, but for directories with pyproject.toml. Listed instead.
+
+    Saving pyproject.toml or uv.lock (like by upgrading) changes the mtime of the directory. But not its listing.
+    """
+
+    paths: list[RelativePath]
+    """Resolved pyproject.toml files of the members."""
+
+
+def get_workspace_member_paths(
+    project_root_path: pathlib.Path,
+    *,
+    members: list[str],
+    exclude: list[str],
+) -> set[pathlib.Path]:
+    # Use glob-based pattern matching to find all pyproject.toml files in the workspace
+    members_paths_set = get_pyproject_paths_by_globs(project_root_path, members)
+    exclude_paths_set = get_pyproject_paths_by_globs(project_root_path, exclude)
+
+    return members_paths_set - exclude_paths_set
+
+
+def get_workspace_member_paths_cached(
+    project_root_path: pathlib.Path,
+    *,
+    members: list[str],
+    exclude: list[str],
+) -> set[pathlib.Path]:
+    """Same as `get_workspace_member_paths`. But reuse the result of the previous run if nothing changed.
+
+    Adding or removing a member changes the mtime of some directory, which globs traverse.
+    So, only `stat` of these directories is needed for a warm run. Without walking the tree.
+    Directories with projects are listed instead. They are written by the tool itself.
+    """
+    logger = logging.getLogger(__name__)
+
+    cache_path = get_path_to_app_state_dir(project_root_path) / NAME_OF_DISCOVERY_CACHE_FILE
+
+    cache = read_discovery_cache(cache_path)
+    if (
+        cache is not None
+        and cache.members == members
+        and cache.exclude == exclude
+        and all(
+            get_mtime_ns(project_root_path / directory) == mtime_ns for directory, mtime_ns in cache.directories.items()
+        )
+        and all(
+            list_directory(project_root_path / directory) == listing
+            for directory, listing in cache.projects_directories.items()
+        )
+    ):
+        logger.debug("Use cached workspace members.")
+        return {project_root_path / path for path in cache.paths}
+
+    directories, projects_directories = collect_directories_state(project_root_path, [*members, *exclude])
+    result = get_workspace_member_paths(project_root_path, members=members, exclude=exclude)
+
+    threshold_ns = time.time_ns() - int(SECONDS_I_MTIME_SAFETY_GAP * 1e9)
+    if any(mtime_ns >= threshold_ns for mtime_ns in directories.values()):
+        # Changed right now. Possibly, still changing. Don't cache.
+        cache_path.unlink(missing_ok=True)
+        return result
+
+    cache = DiscoveryCache(
+        members=members,
+        exclude=exclude,
+        directories=directories,
+        projects_directories=projects_directories,
+        paths=sorted(path.relative_to(project_root_path).as_posix() for path in result),
+    )
+    cache_path.write_text(cache.model_dump_json(), encoding="utf-8")
+
+    return result
+
+
+def read_discovery_cache(cache_path: pathlib.Path) -> DiscoveryCache | None:
+    try:
+        return DiscoveryCache.model_validate_json(cache_path.read_bytes())
+    except FileNotFoundError, ValidationError:
+        return None
+
+
+def get_mtime_ns(path: pathlib.Path) -> MtimeNs:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return MTIME_I_MISSING
+
+
+def list_directory(path: pathlib.Path) -> DirectoryListing | None:
+    """Names of subdirectories, which can hold projects. And pyproject.toml, if it is there.
+
+    Other files (like uv.lock or temporary files of atomic writes) don't affect globs. So, they are not listed.
+    """
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError, NotADirectoryError:
+        return None
+
+    return sorted(
+        entry.name
+        for entry in entries
+        if (entry.is_dir() and not is_skipped_directory(entry.name)) or entry.name == NAME_OF_PYPROJECT_FILE
+    )
+
+
+def collect_directories_state(
+    project_root_path: pathlib.Path,
+    patterns: list[str],
+) -> tuple[dict[RelativePath, MtimeNs], dict[RelativePath, DirectoryListing]]:
+    """Collect mtimes of all directories, which globs can traverse. Superset is fine.
+
+    Directories, which can't hold projects (like `.venv`, `.git` or `node_modules`), are not traversed.
+    Directories with pyproject.toml are listed instead.
+    """
+    directories: dict[RelativePath, MtimeNs] = {}
+    projects_directories: dict[RelativePath, DirectoryListing] = {}
+
+    for pattern in patterns:
+        static_parts, dynamic_parts = split_glob_pattern(pattern)
+        max_depth = None if "**" in dynamic_parts else len(dynamic_parts)
+
+        base_relative = "/".join(part for part in static_parts if part not in {"", "."}) or "."
+        base_path = project_root_path / base_relative
+
+        # Note: Even if the directory doesn't exist. Its creation must invalidate the cache.
+        for directory in [base_path, *walk_directories(base_path, max_depth=max_depth)]:
+            relative_path = directory.relative_to(project_root_path, walk_up=True).as_posix()
+            if (directory / NAME_OF_PYPROJECT_FILE).is_file():
+                projects_directories[relative_path] = list_directory(directory) or []
+            else:
+                directories[relative_path] = get_mtime_ns(directory)
+
+    return directories, projects_directories
+
+
+def walk_directories(
+    path: pathlib.Path,
+    *,
+    max_depth: int | None,
+) -> list[pathlib.Path]:
+    result: list[pathlib.Path] = []
+    if max_depth is not None and max_depth <= 0:
+        return result
+
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError, NotADirectoryError:
+        return result
+
+    for entry in entries:
+        # Note: Follow symlinks only for limited depth. To avoid loops.
+        if is_skipped_directory(entry.name) or not entry.is_dir(follow_symlinks=max_depth is not None):
+            continue
+
+        entry_path = path / entry.name
+        result.append(entry_path)
+        result.extend(walk_directories(entry_path, max_depth=None if max_depth is None else max_depth - 1))
+
+    return result
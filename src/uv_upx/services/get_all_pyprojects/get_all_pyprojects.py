@@ -1,9 +1,14 @@
 from typing import TYPE_CHECKING, Any, cast
 
-from uv_upx.services.get_all_pyprojects.get_pyproject_paths_by_globs import get_pyproject_paths_by_globs
+from uv_upx.services.concurrency import ExecutorKind, map_ordered
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.get_all_pyprojects.discovery_cache import (
+    get_workspace_member_paths,
+    get_workspace_member_paths_cached,
+)
 from uv_upx.services.get_all_pyprojects.models import PyProjectsRegistry, PyProjectWrapper
 from uv_upx.services.normalize_paths import get_and_check_path_to_pyproject
-from uv_upx.services.toml import toml_load
+from uv_upx.services.toml import toml_parse
 
 if TYPE_CHECKING:
     import pathlib
@@ -11,18 +16,28 @@ if TYPE_CHECKING:
 
 def get_all_pyprojects_by_project_root_path(
     project_root_path: pathlib.Path,
+    *,
+    jobs: int = 1,
+    executor_kind: ExecutorKind = ExecutorKind.THREAD,
+    #
+    use_discovery_cache: bool = False,
 ) -> PyProjectsRegistry:
     """Find all pyproject.toml files in the project tree.
 
     Use `workspaces` from uv.
 
     Respect `exclude` patterns.
+
+    Members are loaded concurrently if `jobs` allows it. The order is deterministic: root first, then sorted by path.
+
+    With `use_discovery_cache`, resolved members are cached in the project. Invalidated by mtimes of directories.
     """
     items: list[PyProjectWrapper] = []
 
     root_pyproject_path = get_and_check_path_to_pyproject(project_root_path)
-    root_pyproject_data = toml_load(root_pyproject_path)
-    items.append(PyProjectWrapper(path=root_pyproject_path, data=root_pyproject_data))
+    root_pyproject = load_py_project(root_pyproject_path)
+    root_pyproject_data = root_pyproject.data
+    items.append(root_pyproject)
 
     # Get workspaces_config
     # https://docs.astral.sh/uv/concepts/projects/workspaces/
@@ -32,20 +47,36 @@ def get_all_pyprojects_by_project_root_path(
     # members = ["packages/*"]
     # exclude = ["packages/seeds"]
 
-    # TODO: (?) Improve this place for efficiency
-
     workspaces_config: dict[str, Any] = root_pyproject_data.get("tool", {}).get("uv", {}).get("workspace", {})  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
     members_i_relative_glob_based: list[str] = cast("list[str]", workspaces_config.get("members", []))  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
     exclude_i_relative_glob_based: list[str] = cast("list[str]", workspaces_config.get("exclude", []))  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
 
-    # Use glob-based pattern matching to find all pyproject.toml files in the workspace
-    members_paths_set = get_pyproject_paths_by_globs(project_root_path, members_i_relative_glob_based)
-    exclude_paths_set = get_pyproject_paths_by_globs(project_root_path, exclude_i_relative_glob_based)
+    get_member_paths = get_workspace_member_paths_cached if use_discovery_cache else get_workspace_member_paths
+    result_paths_set = get_member_paths(
+        project_root_path,
+        members=[str(pattern) for pattern in members_i_relative_glob_based],
+        exclude=[str(pattern) for pattern in exclude_i_relative_glob_based],
+    )
 
-    result_paths_set = members_paths_set - exclude_paths_set
-
-    for path in result_paths_set:
-        data = toml_load(path)
-        items.append(PyProjectWrapper(path=path, data=data))
+    items.extend(
+        map_ordered(
+            load_py_project,
+            sorted(result_paths_set),
+            jobs=jobs,
+            executor_kind=executor_kind,
+        ),
+    )
 
     return PyProjectsRegistry(items=items)
+
+
+def load_py_project(
+    path: pathlib.Path,
+) -> PyProjectWrapper:
+    # Note: Read once. Keep raw bytes for rollback and parse from them.
+    snapshot = FileSnapshot.from_path(path)
+    return PyProjectWrapper(
+        path=path,
+        data=toml_parse(snapshot.get_text()),
+        snapshot=snapshot,
+    )
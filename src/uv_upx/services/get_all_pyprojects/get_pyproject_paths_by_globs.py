@@ -1,22 +1,48 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
-from uv_upx.services.normalize_paths import NAME_OF_PYPROJECT_FILE
+from uv_upx.services.normalize_paths import NAME_OF_PYPROJECT_FILE, is_skipped_directory
 
 if TYPE_CHECKING:
     import pathlib
 
+CHARS_I_GLOB_SPECIAL: Final[frozenset[str]] = frozenset("*?[")
+
+
+def split_glob_pattern(pattern: str) -> tuple[list[str], list[str]]:
+    """Split the pattern into the static base and the parts with wildcards."""
+    parts = pattern.replace("\\", "/").split("/")
+
+    static_parts: list[str] = []
+    for part in parts:
+        if CHARS_I_GLOB_SPECIAL.intersection(part):
+            break
+        static_parts.append(part)
+
+    return static_parts, parts[len(static_parts) :]
+
 
 def get_pyproject_paths_by_globs(
     base_path: pathlib.Path,
     patterns: list[str],
 ) -> set[pathlib.Path]:
+    """Resolve globs into pyproject.toml files.
+
+    Wildcards don't match directories, which can't hold projects. Like `.venv` or `node_modules`.
+    Named explicitly, they are matched.
+    """
     paths: set[pathlib.Path] = set()
 
     logger = logging.getLogger(__name__)
 
     for pattern in patterns:
+        static_parts, _ = split_glob_pattern(pattern)
+        static_path = base_path.joinpath(*static_parts)
+
         for path in base_path.glob(pattern):
+            if any(is_skipped_directory(part) for part in path.relative_to(static_path).parts):
+                continue
+
             if path.is_file():
                 if path.name == NAME_OF_PYPROJECT_FILE:
                     paths.add(path)
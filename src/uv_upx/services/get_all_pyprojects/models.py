@@ -3,6 +3,8 @@ import pathlib
 from pydantic import BaseModel, ConfigDict
 from tomlkit import TOMLDocument
 
+from uv_upx.services.file_snapshot import FileSnapshot
+
 type PathToPyprojectToml = pathlib.Path
 """Path to a pyproject.toml file."""
 
@@ -11,6 +13,9 @@ class PyProjectWrapper(BaseModel):
     path: PathToPyprojectToml
     data: TOMLDocument
 
+    snapshot: FileSnapshot
+    """Raw content, as it was read. `data` is parsed from it."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
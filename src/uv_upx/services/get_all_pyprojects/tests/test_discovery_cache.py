@@ -0,0 +1,109 @@
+import os
+import time
+from typing import TYPE_CHECKING
+
+from uv_upx.services.file_snapshot import write_bytes_atomically
+from uv_upx.services.get_all_pyprojects import discovery_cache
+from uv_upx.services.get_all_pyprojects.discovery_cache import (
+    NAME_OF_DISCOVERY_CACHE_FILE,
+    get_workspace_member_paths_cached,
+)
+from uv_upx.services.normalize_paths import NAME_OF_APP_STATE_DIR
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+
+def make_member(path: pathlib.Path) -> pathlib.Path:
+    path.mkdir(parents=True)
+    pyproject_path = path / "pyproject.toml"
+    pyproject_path.write_text(f'[project]\nname = "{path.name}"\n', encoding="utf-8")
+    return pyproject_path
+
+
+def make_old(root_path: pathlib.Path) -> None:
+    """Move mtimes to the past. Recently changed directories are not cached."""
+    old = time.time() - 100
+    for directory, _, _ in os.walk(root_path):
+        os.utime(directory, (old, old))
+
+
+def fail_on_walk(*_args: object, **_kwargs: object) -> set[pathlib.Path]:
+    msg = "Cache was not used."
+    raise AssertionError(msg)
+
+
+def test_get_workspace_member_paths_cached(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    member_a = make_member(tmp_path / "packages" / "a")
+    make_member(tmp_path / "packages" / "nested" / "deep" / "b")
+    (tmp_path / "packages" / "nested" / "deep" / "b" / "pyproject.toml").unlink()
+    make_old(tmp_path)
+
+    patterns = {"members": ["packages/*", "packages/nested/**"], "exclude": []}
+
+    assert get_workspace_member_paths_cached(tmp_path, **patterns) == {member_a}
+
+    with monkeypatch.context() as patch:
+        patch.setattr(discovery_cache, "get_workspace_member_paths", fail_on_walk)
+        assert get_workspace_member_paths_cached(tmp_path, **patterns) == {member_a}
+
+    # New member deep inside the tree invalidates the cache.
+    member_b = tmp_path / "packages" / "nested" / "deep" / "b" / "pyproject.toml"
+    member_b.write_text('[project]\nname = "b"\n', encoding="utf-8")
+    assert get_workspace_member_paths_cached(tmp_path, **patterns) == {member_a, member_b}
+
+    # Changed workspace config invalidates the cache.
+    make_old(tmp_path)
+    assert get_workspace_member_paths_cached(tmp_path, members=["packages/*"], exclude=["packages/a"]) == set()
+
+
+def test_get_workspace_member_paths_cached_i_after_upgrade_writes(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root_pyproject_path = tmp_path / "pyproject.toml"
+    root_pyproject_path.write_text('[project]\nname = "root"\n', encoding="utf-8")
+    member_a = make_member(tmp_path / "a")
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "left-pad").mkdir(parents=True)
+    make_old(tmp_path)
+
+    patterns = {"members": ["*", "**"], "exclude": []}
+
+    # Note: `**` matches the root too.
+    assert get_workspace_member_paths_cached(tmp_path, **patterns) == {root_pyproject_path, member_a}
+
+    # Note: Like an upgrade. Atomic writes in directories with projects, the journal, a sync of the environment.
+    write_bytes_atomically(root_pyproject_path, root_pyproject_path.read_bytes())
+    write_bytes_atomically(tmp_path / "uv.lock", b"version = 1\n")
+    write_bytes_atomically(member_a, member_a.read_bytes())
+    (tmp_path / NAME_OF_APP_STATE_DIR / "journal.json").write_text("{}", encoding="utf-8")
+    (tmp_path / NAME_OF_APP_STATE_DIR / "journal.json").unlink()
+    (tmp_path / ".venv" / "lib" / "site-packages").mkdir()
+    (tmp_path / "node_modules" / "left-pad" / "pyproject.toml").write_text("", encoding="utf-8")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(discovery_cache, "get_workspace_member_paths", fail_on_walk)
+        assert get_workspace_member_paths_cached(tmp_path, **patterns) == {root_pyproject_path, member_a}
+
+    # A removed member still invalidates the cache.
+    member_a.unlink()
+    assert get_workspace_member_paths_cached(tmp_path, **patterns) == {root_pyproject_path}
+
+
+def test_get_workspace_member_paths_cached_i_skipped_directories_are_not_stored(tmp_path: pathlib.Path) -> None:
+    make_member(tmp_path / "packages" / "a")
+    (tmp_path / "packages" / "a" / "node_modules" / "left-pad").mkdir(parents=True)
+    (tmp_path / "packages" / ".cache").mkdir()
+    make_old(tmp_path)
+
+    get_workspace_member_paths_cached(tmp_path, members=["packages/**"], exclude=[])
+
+    cache = discovery_cache.read_discovery_cache(tmp_path / NAME_OF_APP_STATE_DIR / NAME_OF_DISCOVERY_CACHE_FILE)
+    assert cache is not None
+    assert sorted([*cache.directories, *cache.projects_directories]) == ["packages", "packages/a"]
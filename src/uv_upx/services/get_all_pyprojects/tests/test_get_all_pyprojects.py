@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.get_all_pyprojects.get_pyproject_paths_by_globs import get_pyproject_paths_by_globs
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def workspace_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "pyproject.toml").write_text(
+        """[project]
+name = "root"
+
+[tool.uv.workspace]
+members = ["packages/*"]
+exclude = ["packages/seeds"]
+""",
+        encoding="utf-8",
+    )
+    for name in ["c", "a", "seeds", "b"]:
+        member_path = tmp_path / "packages" / name
+        member_path.mkdir(parents=True)
+        (member_path / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n', encoding="utf-8")
+    (tmp_path / "packages" / "not-a-member").mkdir()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("jobs", "executor_kind"),
+    [
+        (1, ExecutorKind.THREAD),
+        (4, ExecutorKind.THREAD),
+        (2, ExecutorKind.PROCESS),
+    ],
+)
+def test_get_all_pyprojects_by_project_root_path(
+    workspace_path: pathlib.Path,
+    jobs: int,
+    executor_kind: ExecutorKind,
+) -> None:
+    result = get_all_pyprojects_by_project_root_path(
+        workspace_path,
+        jobs=jobs,
+        executor_kind=executor_kind,
+    )
+
+    assert [item.data["project"]["name"] for item in result.items] == ["root", "a", "b", "c"]  # pyright: ignore[reportUnknownMemberType]
+    assert [item.path for item in result.items] == [
+        workspace_path / "pyproject.toml",
+        *(workspace_path / "packages" / name / "pyproject.toml" for name in ["a", "b", "c"]),
+    ]
+
+
+def test_get_pyproject_paths_by_globs_i_skipped_directories(tmp_path: pathlib.Path) -> None:
+    for relative_path in ["packages/a", "packages/.cache/b", "packages/node_modules/c", ".tools/d"]:
+        (tmp_path / relative_path).mkdir(parents=True)
+        (tmp_path / relative_path / "pyproject.toml").write_text("", encoding="utf-8")
+
+    # Note: Wildcards don't match them. But named explicitly, they are matched.
+    assert get_pyproject_paths_by_globs(tmp_path, ["packages/*", "packages/**", ".tools/*"]) == {
+        tmp_path / "packages" / "a" / "pyproject.toml",
+        tmp_path / ".tools" / "d" / "pyproject.toml",
+    }
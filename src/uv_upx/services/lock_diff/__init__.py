@@ -0,0 +1,11 @@
+from .compute_lock_diff import compute_lock_diff
+from .models import LockDiff, LockDiffEntry, LockDiffKind
+from .render_lock_diff import render_lock_diff
+
+__all__ = [
+    "LockDiff",
+    "LockDiffEntry",
+    "LockDiffKind",
+    "compute_lock_diff",
+    "render_lock_diff",
+]
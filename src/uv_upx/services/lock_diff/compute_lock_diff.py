@@ -0,0 +1,87 @@
+from typing import Final
+
+from uv_upx.services.dependencies_from_project.uv_lock_reader import iter_uv_lock_packages
+from uv_upx.services.lock_diff.models import LockDiff, LockDiffEntry, LockDiffKind, LockedVersions
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.versions import InvalidVersionError, VersionKey, parse_version
+
+type LockIndex = dict[PackageName, LockedVersions]
+
+type VersionSortKey = tuple[VersionKey | tuple[()], str]
+
+KINDS_I_ORDER: Final[dict[LockDiffKind, int]] = {kind: index for index, kind in enumerate(LockDiffKind)}
+
+
+def index_uv_lock_packages(content: str) -> LockIndex:
+    """Map each package name to all its locked versions. Single pass."""
+    index: dict[PackageName, list[str | None]] = {}
+    for name, version in iter_uv_lock_packages(content):
+        index.setdefault(PackageName(name), []).append(version)
+    return {name: tuple(versions) for name, versions in index.items()}
+
+
+def compute_lock_diff(
+    content_before: str,
+    content_after: str,
+) -> LockDiff:
+    """Compare two uv.lock contents. Linear in the number of packages, except the final sort."""
+    index_before = index_uv_lock_packages(content_before)
+    index_after = index_uv_lock_packages(content_after)
+
+    entries: list[LockDiffEntry] = []
+    for name, versions_after in index_after.items():
+        versions_before = index_before.get(name)
+        if versions_before is None:
+            entries.append(LockDiffEntry(name=name, kind=LockDiffKind.ADDED, versions_after=versions_after))
+            continue
+
+        kind = get_change_kind(versions_before, versions_after)
+        if kind is not None:
+            entries.append(
+                LockDiffEntry(name=name, kind=kind, versions_before=versions_before, versions_after=versions_after),
+            )
+
+    entries.extend(
+        LockDiffEntry(name=name, kind=LockDiffKind.REMOVED, versions_before=versions_before)
+        for name, versions_before in index_before.items()
+        if name not in index_after
+    )
+
+    entries.sort(key=lambda entry: (KINDS_I_ORDER[entry.kind], entry.name))
+    return LockDiff(entries=entries)
+
+
+def get_change_kind(
+    versions_before: LockedVersions,
+    versions_after: LockedVersions,
+) -> LockDiffKind | None:
+    """Kind of change of the locked versions. None if they are the same."""
+    if versions_before == versions_after:
+        # Note: Fast path. Most packages are not changed.
+        return None
+
+    keys_before = sorted(map(get_version_sort_key, versions_before))
+    keys_after = sorted(map(get_version_sort_key, versions_after))
+    if keys_before == keys_after:
+        return None
+
+    highest_before = keys_before[-1]
+    highest_after = keys_after[-1]
+    if highest_after > highest_before:
+        return LockDiffKind.UPGRADED
+    if highest_after < highest_before:
+        return LockDiffKind.DOWNGRADED
+    return LockDiffKind.CHANGED
+
+
+def get_version_sort_key(version: str | None) -> VersionSortKey:
+    """Order versions by PEP 440. So, `1.0` is the same as `1.0.0`, and `1.0rc1` is before `1.0`.
+
+    Missing and invalid versions are before all valid ones. Ordered as strings.
+    """
+    if version is None:
+        return (), ""
+    try:
+        return parse_version(version).key, ""
+    except InvalidVersionError:
+        return (), version
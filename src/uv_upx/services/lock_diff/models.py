@@ -0,0 +1,53 @@
+import enum
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.package_name import PackageName
+
+
+@enum.unique
+class LockDiffKind(enum.StrEnum):
+    """Kinds of changes. In order of reporting."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    UPGRADED = "upgraded"
+    DOWNGRADED = "downgraded"
+    CHANGED = "changed"
+    """Several versions of the package are locked. And the set was changed, but the highest one is the same."""
+
+
+type LockedVersions = tuple[str | None, ...]
+"""All locked versions of the package. A package can be locked with different versions for different markers.
+
+Version can be None. For example, for dynamic versions of workspace members.
+"""
+
+
+class LockDiffEntry(BaseModel):
+    name: PackageName
+    kind: LockDiffKind
+
+    versions_before: LockedVersions = ()
+    versions_after: LockedVersions = ()
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+
+class LockDiff(BaseModel):
+    """Changes of locked packages. Transitive ones included."""
+
+    entries: list[LockDiffEntry]
+    """Sorted by the kind, then by the name."""
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+    def get_counts(self) -> dict[LockDiffKind, int]:
+        counts = dict.fromkeys(LockDiffKind, 0)
+        for entry in self.entries:
+            counts[entry.kind] += 1
+        return counts
@@ -0,0 +1,60 @@
+import json
+from typing import TYPE_CHECKING
+
+from uv_upx.services.lock_diff.models import LockDiffKind
+from uv_upx.services.lock_diff_format import LockDiffFormat
+
+if TYPE_CHECKING:
+    from uv_upx.services.lock_diff.models import LockDiff, LockedVersions
+
+
+def render_lock_diff(
+    lock_diff: LockDiff,
+    *,
+    lock_diff_format: LockDiffFormat = LockDiffFormat.HUMAN,
+) -> str:
+    match lock_diff_format:
+        case LockDiffFormat.HUMAN:
+            return "\n".join(render_lock_diff_human(lock_diff))
+        case LockDiffFormat.JSON:
+            return render_lock_diff_json(lock_diff)
+
+
+def render_lock_diff_human(lock_diff: LockDiff) -> list[str]:
+    """Lines grouped by the kind of change. With counts in the header."""
+    if not lock_diff.entries:
+        return ["uv.lock: no version changes"]
+
+    counts = lock_diff.get_counts()
+    summary = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count)
+    lines = [f"uv.lock: {summary}"]
+
+    last_kind: LockDiffKind | None = None
+    for entry in lock_diff.entries:
+        if entry.kind is not last_kind:
+            lines.append(f"  {entry.kind}:")
+            last_kind = entry.kind
+
+        match entry.kind:
+            case LockDiffKind.ADDED:
+                versions = format_versions(entry.versions_after)
+            case LockDiffKind.REMOVED:
+                versions = format_versions(entry.versions_before)
+            case _:
+                versions = f"{format_versions(entry.versions_before)} -> {format_versions(entry.versions_after)}"
+
+        lines.append(f"    {entry.name} {versions}")
+
+    return lines
+
+
+def render_lock_diff_json(lock_diff: LockDiff) -> str:
+    data = {
+        "counts": lock_diff.get_counts(),
+        "entries": lock_diff.model_dump(mode="json")["entries"],
+    }
+    return json.dumps(data, indent=2)
+
+
+def format_versions(versions: LockedVersions) -> str:
+    return ", ".join(version or "(dynamic)" for version in versions)
@@ -0,0 +1,177 @@
+import json
+import re
+
+import pytest
+
+from uv_upx.services.lock_diff import LockDiffKind, compute_lock_diff, render_lock_diff
+from uv_upx.services.lock_diff.compute_lock_diff import get_version_sort_key
+from uv_upx.services.lock_diff_format import LockDiffFormat
+from uv_upx.tests.synthetic import make_uv_lock_content
+
+UV_LOCK_BEFORE = """version = 1
+
+[[package]]
+name = "removed-package"
+version = "1.0.0"
+
+[[package]]
+name = "upgraded"
+version = "1.9.0"
+
+[[package]]
+name = "downgraded"
+version = "2.0.0"
+
+[[package]]
+name = "same"
+version = "1.0"
+
+[[package]]
+name = "forked"
+version = "1.0.0"
+
+[[package]]
+name = "forked"
+version = "2.0.0"
+
+[[package]]
+name = "member"
+source = { editable = "." }
+"""
+
+UV_LOCK_AFTER = """version = 1
+
+[[package]]
+name = "upgraded"
+version = "1.10.0"
+
+[[package]]
+name = "downgraded"
+version = "1.5.0"
+
+[[package]]
+name = "same"
+version = "1.0.0"
+
+[[package]]
+name = "forked"
+version = "1.1.0"
+
+[[package]]
+name = "forked"
+version = "2.0.0"
+
+[[package]]
+name = "member"
+source = { editable = "." }
+
+[[package]]
+name = "added"
+version = "0.1.0"
+"""
+
+
+def test_compute_lock_diff_i_categories() -> None:
+    lock_diff = compute_lock_diff(UV_LOCK_BEFORE, UV_LOCK_AFTER)
+
+    assert [(entry.kind, entry.name) for entry in lock_diff.entries] == [
+        (LockDiffKind.ADDED, "added"),
+        (LockDiffKind.REMOVED, "removed-package"),
+        (LockDiffKind.UPGRADED, "upgraded"),
+        (LockDiffKind.DOWNGRADED, "downgraded"),
+        (LockDiffKind.CHANGED, "forked"),
+    ]
+    assert lock_diff.entries[2].versions_before == ("1.9.0",)
+    assert lock_diff.entries[2].versions_after == ("1.10.0",)
+
+
+def test_compute_lock_diff_i_same_lock() -> None:
+    assert not compute_lock_diff(UV_LOCK_BEFORE, UV_LOCK_BEFORE).entries
+
+
+def test_render_lock_diff_i_human() -> None:
+    lock_diff = compute_lock_diff(UV_LOCK_BEFORE, UV_LOCK_AFTER)
+
+    assert render_lock_diff(lock_diff).splitlines() == [
+        "uv.lock: 1 added, 1 removed, 1 upgraded, 1 downgraded, 1 changed",
+        "  added:",
+        "    added 0.1.0",
+        "  removed:",
+        "    removed-package 1.0.0",
+        "  upgraded:",
+        "    upgraded 1.9.0 -> 1.10.0",
+        "  downgraded:",
+        "    downgraded 2.0.0 -> 1.5.0",
+        "  changed:",
+        "    forked 1.0.0, 2.0.0 -> 1.1.0, 2.0.0",
+    ]
+    assert render_lock_diff(compute_lock_diff(UV_LOCK_BEFORE, UV_LOCK_BEFORE)) == "uv.lock: no version changes"
+
+
+def test_render_lock_diff_i_json() -> None:
+    lock_diff = compute_lock_diff(UV_LOCK_BEFORE, UV_LOCK_AFTER)
+
+    data = json.loads(render_lock_diff(lock_diff, lock_diff_format=LockDiffFormat.JSON))
+
+    assert data["counts"] == {"added": 1, "removed": 1, "upgraded": 1, "downgraded": 1, "changed": 1}
+    assert data["entries"][0] == {
+        "name": "added",
+        "kind": "added",
+        "versions_before": [],
+        "versions_after": ["0.1.0"],
+    }
+
+
+def test_compute_lock_diff_i_many_packages() -> None:
+    packages_count = 2_000
+    content_before = make_uv_lock_content(packages_count)
+    content_after = re.sub(
+        r'^version = "(\d+)\.',
+        lambda match: f'version = "{int(match[1]) + 1}.',
+        content_before,
+        flags=re.MULTILINE,
+    )
+
+    lock_diff = compute_lock_diff(content_before, content_after)
+
+    assert lock_diff.get_counts()[LockDiffKind.UPGRADED] == packages_count
+
+
+def test_get_version_sort_key() -> None:
+    assert get_version_sort_key("1.10.0") > get_version_sort_key("1.9.0")
+    assert get_version_sort_key("1.0") == get_version_sort_key("1.0.0")
+    assert get_version_sort_key(None) < get_version_sort_key("0.1")
+    assert get_version_sort_key("1.0rc1") < get_version_sort_key("1.0") < get_version_sort_key("1.0.post1")
+    assert get_version_sort_key("not-a-version") < get_version_sort_key("0.1")
+
+
+def make_uv_lock_i_single_package(version: str) -> str:
+    return f'version = 1\n\n[[package]]\nname = "foo"\nversion = "{version}"\n'
+
+
+# Note: As strings, most of these are ordered the other way.
+@pytest.mark.parametrize(
+    ("version_before", "version_after", "kind"),
+    [
+        ("1.0rc1", "1.0", LockDiffKind.UPGRADED),
+        ("1.0", "1.0.post1", LockDiffKind.UPGRADED),
+        ("1.0.dev1", "1.0a1", LockDiffKind.UPGRADED),
+        ("1.0", "1.0+local", LockDiffKind.UPGRADED),
+        ("1.0.post1", "1.0", LockDiffKind.DOWNGRADED),
+        ("2.0", "2.0rc1", LockDiffKind.DOWNGRADED),
+    ],
+)
+def test_compute_lock_diff_i_pep_440_ordering(version_before: str, version_after: str, kind: LockDiffKind) -> None:
+    lock_diff = compute_lock_diff(
+        make_uv_lock_i_single_package(version_before),
+        make_uv_lock_i_single_package(version_after),
+    )
+    assert [entry.kind for entry in lock_diff.entries] == [kind]
+
+
+def test_compute_lock_diff_i_same_version_in_other_spelling() -> None:
+    lock_diff = compute_lock_diff(
+        make_uv_lock_i_single_package("1.0"),
+        make_uv_lock_i_single_package("1.0.0"),
+    )
+    assert lock_diff.entries == []
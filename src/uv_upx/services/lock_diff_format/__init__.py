@@ -0,0 +1,5 @@
+from .lock_diff_format_enum import LockDiffFormat
+
+__all__ = [
+    "LockDiffFormat",
+]
@@ -0,0 +1,14 @@
+import enum
+
+
+@enum.unique
+class LockDiffFormat(enum.StrEnum):
+    HUMAN = "human"
+    """Lines grouped by the kind of change. For reviewers."""
+
+    JSON = "json"
+    """JSON document. For automation."""
+
+    @staticmethod
+    def get_default() -> LockDiffFormat:
+        return LockDiffFormat.HUMAN
@@ -2,10 +2,14 @@ import pathlib
 from typing import Final
 
 __all__ = [
+    "NAMES_I_SKIPPED_DIRECTORIES",
+    "NAME_OF_APP_STATE_DIR",
     "NAME_OF_PYPROJECT_FILE",
     "NAME_OF_UV_LOCK_FILE",
     "get_and_check_path_to_pyproject",
     "get_and_check_path_to_uv_lock",
+    "get_path_to_app_state_dir",
+    "is_skipped_directory",
     "normalize_and_check_path_to_project_root",
 ]
 
@@ -13,6 +17,22 @@ __all__ = [
 NAME_OF_PYPROJECT_FILE: Final[str] = "pyproject.toml"
 NAME_OF_UV_LOCK_FILE: Final[str] = "uv.lock"
 
+NAME_OF_APP_STATE_DIR: Final[str] = ".uv-upx"
+"""Directory for the tool's own files in the project root. Like caches."""
+
+NAMES_I_SKIPPED_DIRECTORIES: Final[frozenset[str]] = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+    },
+)
+"""Never hold uv projects. Hidden directories, like `.git`, `.venv` or `.uv-upx`, are skipped too."""
+
+
+def is_skipped_directory(name: str) -> bool:
+    """Tell if the directory can't hold uv projects. So, it isn't searched for them."""
+    return (name.startswith(".") and name not in {".", ".."}) or name in NAMES_I_SKIPPED_DIRECTORIES
+
 
 def normalize_and_check_path_to_project_root(path: pathlib.Path | None) -> pathlib.Path:
     if path is None:
@@ -39,6 +59,20 @@ def get_and_check_path_to_pyproject(path: pathlib.Path) -> pathlib.Path:
     return path
 
 
+def get_path_to_app_state_dir(path: pathlib.Path) -> pathlib.Path:
+    """Get (and create, if needed) the directory for the tool's own files.
+
+    It is ignored by git. Like `.pytest_cache` or `.ruff_cache`.
+    """
+    path = path / NAME_OF_APP_STATE_DIR
+
+    if not path.exists():
+        path.mkdir()
+        (path / ".gitignore").write_text("# Automatically created by uv-upx.\n*\n", encoding="utf-8")
+
+    return path
+
+
 def get_and_check_path_to_uv_lock(path: pathlib.Path) -> pathlib.Path:
     path = path / NAME_OF_UV_LOCK_FILE
 
@@ -0,0 +1,8 @@
+from .find_available_changes import find_available_changes
+from .run_check import render_check_report, run_check
+
+__all__ = [
+    "find_available_changes",
+    "render_check_report",
+    "run_check",
+]
@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from uv_upx.services.dependency_up.handle_groups import iter_dependencies_to_handle
+from uv_upx.services.dependency_up.update_dependency import update_dependency_v2
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+if TYPE_CHECKING:
+    from uv_upx.services.dependencies_from_project import DependenciesRegistry
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
+
+
+def find_available_changes(
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    dependencies_registry: DependenciesRegistry,
+    #
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
+    #
+    package_filter: PackageFilter | None = None,
+) -> ChangesList:
+    """Changes, which a run would make. Nothing is written. The snapshot is not changed."""
+    changes: ChangesList = []
+
+    for py_project in workspace_snapshot.collected_top_level_dependencies.parsed_pyprojects:
+        for group in py_project.dependency_groups_parsed:
+            location = group.get_location(py_project.path)
+            for _, dependency in iter_dependencies_to_handle(group, package_filter=package_filter):
+                change_or_none = update_dependency_v2(
+                    dependencies_registry=dependencies_registry,
+                    parsed=dependency.parsed,
+                    #
+                    profile=profile,
+                    #
+                    location=location,
+                )
+                if change_or_none is not None:
+                    changes.append(change_or_none)
+
+    return changes
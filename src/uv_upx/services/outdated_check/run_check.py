@@ -0,0 +1,112 @@
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.normalize_paths import get_and_check_path_to_uv_lock
+from uv_upx.services.outdated_check.find_available_changes import find_available_changes
+from uv_upx.services.overlay import open_overlay
+from uv_upx.services.timings import set_timings_count, timed
+from uv_upx.services.updater.upgrade_workspace import upgrade_uv_lock
+from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.package_filter import PackageFilter
+
+
+@timed("run_check")
+def run_check(  # noqa: PLR0913
+    *,
+    project_root_path: pathlib.Path,
+    #
+    preserve_original_package_names: bool = False,
+    #
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
+    #
+    jobs: int = 1,
+    executor_kind: ExecutorKind = ExecutorKind.THREAD,
+    #
+    use_discovery_cache: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
+) -> ChangesList:
+    """Find available upgrades of top-level dependencies.
+
+    uv.lock is upgraded in a scratch overlay. The real tree and the environment are never touched.
+    """
+    logger = logging.getLogger(__name__)
+
+    uv_lock_snapshot = FileSnapshot.from_path(get_and_check_path_to_uv_lock(project_root_path))
+
+    workspace_snapshot = build_workspace_snapshot(
+        project_root_path,
+        #
+        preserve_original_package_names=preserve_original_package_names,
+        #
+        jobs=jobs,
+        executor_kind=executor_kind,
+        #
+        use_discovery_cache=use_discovery_cache,
+    )
+
+    with open_overlay(
+        workspace_snapshot=workspace_snapshot,
+        uv_lock_snapshot=uv_lock_snapshot,
+        #
+        preserve_original_package_names=preserve_original_package_names,
+    ) as overlay:
+        dependencies_registry = upgrade_uv_lock(
+            workspace_snapshot=overlay.workspace_snapshot,
+            uv_lock_snapshot=overlay.uv_lock_snapshot,
+            #
+            profile=profile,
+            #
+            package_filter=package_filter,
+        )
+
+    # Note: Compare with the original constraints. Not with the overlay. It can be unpinned by the profile.
+    with timed("find_available_changes"):
+        changes = find_available_changes(
+            workspace_snapshot=workspace_snapshot,
+            dependencies_registry=dependencies_registry,
+            #
+            profile=profile,
+            #
+            package_filter=package_filter,
+        )
+    set_timings_count("changes", len(changes))
+
+    if not changes:
+        logger.info("All top-level dependencies are up to date.")
+
+    return changes
+
+
+def render_check_report(
+    changes: ChangesList,
+    *,
+    project_root_path: pathlib.Path,
+) -> list[str]:
+    """Compact report. A line per change. Grouped by file and dependency group."""
+    lines: list[str] = [f"{len(changes)} top-level dependencies can be upgraded:"]
+
+    last_title: str | None = None
+    for change in changes:
+        location = change.location
+        if location is not None:
+            title = location.path.relative_to(project_root_path).as_posix()
+            title += f" {location.section}"
+            if location.group_name is not None:
+                title += f"[{location.group_name}]"
+
+            if title != last_title:
+                lines.append(f"  {title}")
+                last_title = title
+
+        lines.append(f"    {change}")
+
+    return lines
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING
+
+from uv_upx.services.dependencies_from_project import DependenciesRegistry, Version
+from uv_upx.services.dependency_up import DependencyLocation
+from uv_upx.services.outdated_check import find_available_changes, render_check_report
+from uv_upx.services.package_filter import PackageFilter
+from uv_upx.services.package_name import PackageName
+from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+
+if TYPE_CHECKING:
+    import pathlib
+
+PY_PROJECT = """[project]
+name = "root"
+version = "0.1.0"
+dependencies = ["foo>=1.0.0", "bar==2.0.0"]
+
+[dependency-groups]
+dev = ["baz>=3.0.0"]
+"""
+
+DEPENDENCIES_REGISTRY = DependenciesRegistry(
+    root={
+        PackageName("foo"): Version("1.1.0"),
+        PackageName("bar"): Version("2.1.0"),
+        PackageName("baz"): Version("3.0.0"),
+    },
+)
+
+
+def test_find_available_changes_i_nothing_is_written(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text(PY_PROJECT, encoding="utf-8")
+    workspace_snapshot = build_workspace_snapshot(tmp_path)
+
+    changes = find_available_changes(
+        workspace_snapshot=workspace_snapshot,
+        dependencies_registry=DEPENDENCIES_REGISTRY,
+    )
+
+    assert [str(change) for change in changes] == ["foo: >=1.0.0 -> >=1.1.0"]
+    assert changes[0].location == DependencyLocation(path=path, section="project.dependencies")
+    assert path.read_text(encoding="utf-8") == PY_PROJECT
+
+    # Note: The snapshot keeps the original constraints. So, the check can be repeated.
+    changes_again = find_available_changes(
+        workspace_snapshot=workspace_snapshot,
+        dependencies_registry=DEPENDENCIES_REGISTRY,
+    )
+    assert changes_again == changes
+
+
+def test_find_available_changes_i_with_pinned_and_filter(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(PY_PROJECT, encoding="utf-8")
+    workspace_snapshot = build_workspace_snapshot(tmp_path)
+
+    changes = find_available_changes(
+        workspace_snapshot=workspace_snapshot,
+        dependencies_registry=DEPENDENCIES_REGISTRY,
+        #
+        profile=UpgradeProfile.WITH_PINNED,
+        #
+        package_filter=PackageFilter.from_patterns(include=["bar"], exclude=None),
+    )
+
+    assert [str(change) for change in changes] == ["bar: ==2.0.0 -> ==2.1.0"]
+
+
+def test_render_check_report(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(PY_PROJECT.replace("baz>=3.0.0", "baz>=2.0.0"), encoding="utf-8")
+    workspace_snapshot = build_workspace_snapshot(tmp_path)
+
+    changes = find_available_changes(
+        workspace_snapshot=workspace_snapshot,
+        dependencies_registry=DEPENDENCIES_REGISTRY,
+    )
+
+    assert render_check_report(changes, project_root_path=tmp_path) == [
+        "2 top-level dependencies can be upgraded:",
+        "  pyproject.toml project.dependencies",
+        "    foo: >=1.0.0 -> >=1.1.0",
+        "  pyproject.toml dependency-groups[dev]",
+        "    baz: >=2.0.0 -> >=3.0.0",
+    ]
@@ -0,0 +1,5 @@
+from .output_format_enum import OutputFormat
+
+__all__ = [
+    "OutputFormat",
+]
@@ -0,0 +1,17 @@
+import enum
+
+
+@enum.unique
+class OutputFormat(enum.StrEnum):
+    TEXT = "text"
+    """Only logs. For humans."""
+
+    JSON = "json"
+    """A single JSON document with all changes and the summary. Written at the end."""
+
+    NDJSON = "ndjson"
+    """A JSON record per line. Written as soon as a change is computed. The summary record is the last one."""
+
+    @staticmethod
+    def get_default() -> OutputFormat:
+        return OutputFormat.TEXT
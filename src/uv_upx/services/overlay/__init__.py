@@ -0,0 +1,8 @@
+from .create_overlay import create_overlay
+from .open_overlay import Overlay, open_overlay
+
+__all__ = [
+    "Overlay",
+    "create_overlay",
+    "open_overlay",
+]
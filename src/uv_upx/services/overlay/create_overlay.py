@@ -0,0 +1,49 @@
+import shutil
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.services.normalize_paths import NAME_OF_UV_LOCK_FILE
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.file_snapshot import FileSnapshot
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
+
+NAMES_I_OVERLAY_EXTRA_FILES: Final[tuple[str, ...]] = (
+    ".python-version",
+    "uv.toml",
+)
+"""Files of the project root, which affect the resolution. Copied as is, if present."""
+
+
+def create_overlay(
+    overlay_root_path: pathlib.Path,
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+) -> pathlib.Path:
+    """Copy the workspace manifests and the lock into the scratch directory. With the same layout.
+
+    Only files needed by `uv lock` are copied. Sources and the environment are not.
+    So, it is cheap. And nothing in the real tree can be changed by working in the overlay.
+
+    Limitation: members with dynamic metadata and path sources outside the workspace need their sources.
+    So, `uv lock` can fail in the overlay for them.
+
+    Returns:
+        Path to uv.lock in the overlay.
+    """
+    project_root_path = workspace_snapshot.project_root_path
+
+    snapshots = [uv_lock_snapshot, *(py_project.snapshot for py_project in workspace_snapshot.py_projects.items)]
+    for snapshot in snapshots:
+        overlay_path = overlay_root_path / snapshot.path.relative_to(project_root_path)
+        overlay_path.parent.mkdir(parents=True, exist_ok=True)
+        overlay_path.write_bytes(snapshot.content)
+
+    for name in NAMES_I_OVERLAY_EXTRA_FILES:
+        path = project_root_path / name
+        if path.is_file():
+            shutil.copyfile(path, overlay_root_path / name)
+
+    return overlay_root_path / NAME_OF_UV_LOCK_FILE
@@ -0,0 +1,51 @@
+import contextlib
+import pathlib
+import tempfile
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.overlay.create_overlay import create_overlay
+from uv_upx.services.workspace_snapshot import WorkspaceSnapshot, build_workspace_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Overlay(BaseModel):
+    """Scratch copy of the workspace. Removed on exit from `open_overlay`."""
+
+    workspace_snapshot: WorkspaceSnapshot
+    uv_lock_snapshot: FileSnapshot
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+
+@contextlib.contextmanager
+def open_overlay(
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    preserve_original_package_names: bool = False,
+) -> Iterator[Overlay]:
+    """Create the overlay in a temporary directory and parse it."""
+    with tempfile.TemporaryDirectory(prefix="uv-upx-overlay-") as overlay_root:
+        overlay_root_path = pathlib.Path(overlay_root)
+        overlay_uv_lock_path = create_overlay(
+            overlay_root_path,
+            workspace_snapshot=workspace_snapshot,
+            uv_lock_snapshot=uv_lock_snapshot,
+        )
+
+        yield Overlay(
+            workspace_snapshot=build_workspace_snapshot(
+                overlay_root_path,
+                #
+                preserve_original_package_names=preserve_original_package_names,
+            ),
+            uv_lock_snapshot=FileSnapshot.from_path(overlay_uv_lock_path),
+        )
@@ -0,0 +1,70 @@
+import pathlib
+
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.overlay import create_overlay
+from uv_upx.services.updater.run_dry_run import render_unified_diff
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+
+ROOT_PY_PROJECT = """[project]
+name = "root"
+version = "0.1.0"
+dependencies = ["foo>=1.0.0"]
+
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+
+MEMBER_PY_PROJECT = """[project]
+name = "member"
+version = "0.1.0"
+dependencies = ["bar>=2.0.0"]
+"""
+
+UV_LOCK = """version = 1
+
+[[package]]
+name = "foo"
+version = "1.0.0"
+"""
+
+
+def test_create_overlay_i_same_layout(tmp_path: pathlib.Path) -> None:
+    project_root_path = tmp_path / "project"
+    (project_root_path / "packages" / "member" / "src").mkdir(parents=True)
+    (project_root_path / "pyproject.toml").write_text(ROOT_PY_PROJECT, encoding="utf-8")
+    (project_root_path / "packages" / "member" / "pyproject.toml").write_text(MEMBER_PY_PROJECT, encoding="utf-8")
+    (project_root_path / "packages" / "member" / "src" / "module.py").write_text("", encoding="utf-8")
+    (project_root_path / "uv.lock").write_text(UV_LOCK, encoding="utf-8")
+    (project_root_path / ".python-version").write_text("3.14\n", encoding="utf-8")
+
+    workspace_snapshot = build_workspace_snapshot(project_root_path)
+    uv_lock_snapshot = FileSnapshot.from_path(project_root_path / "uv.lock")
+
+    overlay_root_path = tmp_path / "overlay"
+    overlay_uv_lock_path = create_overlay(
+        overlay_root_path,
+        workspace_snapshot=workspace_snapshot,
+        uv_lock_snapshot=uv_lock_snapshot,
+    )
+
+    assert overlay_uv_lock_path == overlay_root_path / "uv.lock"
+    assert overlay_uv_lock_path.read_text(encoding="utf-8") == UV_LOCK
+    assert (overlay_root_path / "pyproject.toml").read_text(encoding="utf-8") == ROOT_PY_PROJECT
+    assert (overlay_root_path / "packages" / "member" / "pyproject.toml").read_text(
+        encoding="utf-8",
+    ) == MEMBER_PY_PROJECT
+    assert (overlay_root_path / ".python-version").read_text(encoding="utf-8") == "3.14\n"
+    # Sources are not needed for the resolution.
+    assert not (overlay_root_path / "packages" / "member" / "src").exists()
+
+
+def test_render_unified_diff(tmp_path: pathlib.Path) -> None:
+    before = MEMBER_PY_PROJECT
+    after = MEMBER_PY_PROJECT.replace("bar>=2.0.0", "bar>=2.1.0")
+
+    diff = render_unified_diff(before, after, relative_path=pathlib.Path("pyproject.toml"))
+
+    assert diff.splitlines()[:2] == ["--- a/pyproject.toml", "+++ b/pyproject.toml"]
+    assert '-dependencies = ["bar>=2.0.0"]\n' in diff
+    assert '+dependencies = ["bar>=2.1.0"]\n' in diff
+    assert not render_unified_diff(before, before, relative_path=tmp_path)
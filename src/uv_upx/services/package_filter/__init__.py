@@ -0,0 +1,5 @@
+from .models import PackageFilter
+
+__all__ = [
+    "PackageFilter",
+]
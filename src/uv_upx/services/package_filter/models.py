@@ -0,0 +1,48 @@
+import fnmatch
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.package_name import PackageName, normalize_package_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type PackagePattern = str
+"""Normalized package name or glob. Like `django` or `my-company-*`."""
+
+
+class PackageFilter(BaseModel):
+    """Which packages to upgrade. Names and globs are matched against normalized names."""
+
+    include: tuple[PackagePattern, ...] = ()
+    """Empty means all packages."""
+
+    exclude: tuple[PackagePattern, ...] = ()
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+    @classmethod
+    def from_patterns(
+        cls,
+        *,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> PackageFilter | None:
+        """Build a filter from raw CLI values. None if there is nothing to filter."""
+        include_normalized = tuple(normalize_package_name(pattern) for pattern in include or ())
+        exclude_normalized = tuple(normalize_package_name(pattern) for pattern in exclude or ())
+        if not include_normalized and not exclude_normalized:
+            return None
+        return cls(include=include_normalized, exclude=exclude_normalized)
+
+    def matches(self, package_name: PackageName) -> bool:
+        if self.include and not any(fnmatch.fnmatchcase(package_name, pattern) for pattern in self.include):
+            return False
+        return not any(fnmatch.fnmatchcase(package_name, pattern) for pattern in self.exclude)
+
+    def select(self, package_names: Iterable[PackageName]) -> list[PackageName]:
+        """Expand the patterns against known package names. Like ones from uv.lock."""
+        return sorted({package_name for package_name in package_names if self.matches(package_name)})
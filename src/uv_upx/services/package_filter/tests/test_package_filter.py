@@ -0,0 +1,31 @@
+import pytest
+
+from uv_upx.services.package_filter import PackageFilter
+from uv_upx.services.package_name import PackageName
+
+PACKAGE_NAMES = [PackageName(name) for name in ["django", "django-stubs", "my-company-core", "my-company-web", "six"]]
+
+
+@pytest.mark.parametrize(
+    ("include", "exclude", "expected"),
+    [
+        (["Django"], None, ["django"]),
+        (["django*"], None, ["django", "django-stubs"]),
+        (["My_Company.*", "six"], None, ["my-company-core", "my-company-web", "six"]),
+        (None, ["my-company-*"], ["django", "django-stubs", "six"]),
+        (["django*"], ["*-stubs"], ["django"]),
+        (["missing"], None, []),
+    ],
+)
+def test_package_filter_select(
+    include: list[str] | None,
+    exclude: list[str] | None,
+    expected: list[str],
+) -> None:
+    package_filter = PackageFilter.from_patterns(include=include, exclude=exclude)
+    assert package_filter is not None
+    assert package_filter.select(reversed(PACKAGE_NAMES)) == expected
+
+
+def test_package_filter_from_patterns_i_empty() -> None:
+    assert PackageFilter.from_patterns(include=[], exclude=None) is None
@@ -1,12 +1,19 @@
+import functools
 import re
 from re import Pattern
-from typing import Annotated, Final
+from typing import TYPE_CHECKING, Any, Final, Self
 
-from pydantic import AfterValidator, ConfigDict, RootModel
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
 
 PATTERN_I_NORMALIZED_I_TO_REPLACE: Final[Pattern[str]] = re.compile(r"[-_.]+")
 CHAR_I_TO_USE: Final[str] = "-"
 
+PACKAGE_NAME_CACHE_MAX_SIZE: Final[int] = 16_384
+"""Max number of distinct raw names to keep interned. Enough for big uv.lock files. Bounded for long-lived processes."""
+
 
 def normalize_package_name(package_name: str) -> str:
     """Normalize the package name according to PEP 503.
@@ -18,12 +25,46 @@ def normalize_package_name(package_name: str) -> str:
     return PATTERN_I_NORMALIZED_I_TO_REPLACE.sub(CHAR_I_TO_USE, package_name).lower()
 
 
-class PackageName(RootModel[str]):
-    root: Annotated[str, AfterValidator(normalize_package_name)]
+class PackageName(str):
+    """Normalized package name.
+
+    Interned with a bounded cache. So, the same raw name gives the same object, while it is in the cache.
+    And each distinct raw name is normalized only once.
+
+    It is a plain `str` for hashing and comparison. So, it is cheap to use as a dict key.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: str) -> Self:
+        if isinstance(value, PackageName):
+            return value  # pyright: ignore[reportReturnType]
+
+        return intern_package_name(value)  # pyright: ignore[reportReturnType]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({super().__repr__()})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source_type: Any,  # noqa: ANN401
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        _ = source_type, handler
+        return core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.str_schema(),
+            serialization=core_schema.plain_serializer_function_ser_schema(str),
+        )
+
+
+@functools.lru_cache(maxsize=PACKAGE_NAME_CACHE_MAX_SIZE)
+def intern_package_name(value: str) -> PackageName:
+    """Raw name -> normalized name. Cached."""
+    return str.__new__(PackageName, normalize_package_name(value))
 
-    def __str__(self) -> str:
-        return self.root
 
-    model_config = ConfigDict(
-        frozen=True,
-    )
+def get_package_name_cache_info() -> functools._CacheInfo:  # pyright: ignore[reportPrivateUsage]
+    """Get stats of the intern cache. Hits, misses, size."""
+    return intern_package_name.cache_info()
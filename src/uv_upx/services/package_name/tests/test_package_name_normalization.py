@@ -1,6 +1,14 @@
+import pickle
+
 import pytest
+from pydantic import TypeAdapter
 
-from uv_upx.services.package_name import normalize_package_name
+from uv_upx.services.package_name import PackageName, normalize_package_name
+from uv_upx.services.package_name.normalize_package_name import (
+    PACKAGE_NAME_CACHE_MAX_SIZE,
+    get_package_name_cache_info,
+    intern_package_name,
+)
 
 
 @pytest.mark.parametrize(
@@ -23,3 +31,35 @@ def test_package_name_normalization(
 ) -> None:
     result = normalize_package_name(package_name)
     assert result == expected
+
+
+def test_package_name_is_interned() -> None:
+    first = PackageName("Interned_Name")
+    second = PackageName("interned.name")
+
+    assert first == "interned-name"
+    assert first is PackageName("Interned_Name")
+    assert PackageName(first) is first
+    assert second == first
+    assert hash(second) == hash("interned-name")
+
+
+def test_package_name_pydantic_and_pickle() -> None:
+    adapter = TypeAdapter(dict[PackageName, str])
+    result = adapter.validate_python({"Foo_Bar": "1.0"})
+
+    key = next(iter(result))
+    assert type(key) is PackageName
+    assert key == "foo-bar"
+    assert adapter.dump_json(result) == b'{"foo-bar":"1.0"}'
+
+    assert pickle.loads(pickle.dumps(key)) == key  # noqa: S301
+
+
+def test_package_name_cache_is_bounded() -> None:
+    intern_package_name.cache_clear()
+
+    for index in range(PACKAGE_NAME_CACHE_MAX_SIZE + 1):
+        PackageName(f"package_{index}")
+
+    assert get_package_name_cache_info().currsize == PACKAGE_NAME_CACHE_MAX_SIZE
@@ -1,21 +1,25 @@
 import copy
+import dataclasses
 from typing import TYPE_CHECKING
 
 from uv_upx.services.dependency_up.constants.operators import (
     VERSION_OPERATOR_I_GREATER_OR_EQUAL,
     VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE,
 )
-from uv_upx.services.toml import toml_save
+from uv_upx.services.parse_v2.save_py_project import save_py_project
 
 if TYPE_CHECKING:
-    from uv_upx.services.parse_v2.collect_dependencies import CollectedTopLevelDependencies
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
 
 
 def change_pinned_constraints(
-    collected_top_level_dependencies: CollectedTopLevelDependencies,
+    workspace_snapshot: WorkspaceSnapshot,
     #
+    package_filter: PackageFilter | None = None,
 ) -> None:
-    copied_dependencies = copy.deepcopy(collected_top_level_dependencies)
+    # Note: Work on a copy. The snapshot must keep the original constraints for the later phases.
+    copied_dependencies = copy.deepcopy(workspace_snapshot.collected_top_level_dependencies)
 
     for py_project in copied_dependencies.parsed_pyprojects:
         is_have_changes_for_file = False
@@ -23,16 +27,24 @@ def change_pinned_constraints(
         for group in py_project.dependency_groups_parsed:
             for dependency in group.parsed_dependencies:
                 dependency_parsed = dependency.parsed
-
-                is_have_changes_for_dependency = False
-                for version_constraint in dependency_parsed.version_constraints:
-                    if version_constraint.operator in VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE:
-                        version_constraint.operator = VERSION_OPERATOR_I_GREATER_OR_EQUAL
-                        is_have_changes_for_dependency = True
-
-                if is_have_changes_for_dependency:
-                    group.dependencies[dependency.index_in_group] = dependency_parsed.get_full_spec()
+                if package_filter is not None and not package_filter.matches(dependency_parsed.package_name):
+                    # Note: Won't be upgraded. So, must stay pinned.
+                    continue
+
+                version_constraints = tuple(
+                    dataclasses.replace(version_constraint, operator=VERSION_OPERATOR_I_GREATER_OR_EQUAL)
+                    if version_constraint.operator in VERSION_OPERATORS_I_PINNED_ALLOWED_TO_CHANGE
+                    else version_constraint
+                    for version_constraint in dependency_parsed.version_constraints
+                )
+
+                if version_constraints != dependency_parsed.version_constraints:
+                    dependency_changed = dataclasses.replace(
+                        dependency_parsed,
+                        version_constraints=version_constraints,
+                    )
+                    group.dependencies[dependency.index_in_group] = dependency_changed.get_full_spec()
                     is_have_changes_for_file = True
 
         if is_have_changes_for_file:
-            toml_save(py_project.path, py_project.data)
+            save_py_project(py_project)
@@ -9,10 +9,13 @@ from uv_upx.services.collect_dependencies.models import (
     DependencyItemParsed,
 )
 from uv_upx.services.dependency_up.parse_dependency import parse_dependency
-from uv_upx.services.get_all_pyprojects import PyProjectWrapper, get_all_pyprojects_by_project_root_path
+from uv_upx.services.get_all_pyprojects import PyProjectWrapper
+from uv_upx.services.toml import ArrayItemsSpans, TomlLocateError, locate_array_items, toml_item_as_string
 
 if TYPE_CHECKING:
-    import pathlib
+    from uv_upx.services.dependency_up.models.dependency_parsed import DependencyString
+    from uv_upx.services.get_all_pyprojects import PyProjectsRegistry
+    from uv_upx.services.toml import TextSpan
 
 
 class PyProjectWrapperExtra(PyProjectWrapper):
@@ -27,30 +30,32 @@ class CollectedTopLevelDependencies(BaseModel):
 
 def collect_top_level_dependencies(
     *,
-    project_root_path: pathlib.Path,
+    py_projects: PyProjectsRegistry,
     #
     preserve_original_package_names: bool = False,
     #
     verbose: bool = False,
 ) -> CollectedTopLevelDependencies:
-    """Collect top-level dependencies from all pyproject.toml files in the project."""
+    """Collect top-level dependencies from already loaded pyproject.toml files."""
     logger = logging.getLogger(__name__)
 
-    if verbose:
-        logger.info(f"Collect dependencies from project at: {project_root_path.as_uri()}")
-
-    py_projects = get_all_pyprojects_by_project_root_path(project_root_path)
-
     parsed_pyprojects: list[PyProjectWrapperExtra] = []
     for py_project in py_projects.items:
         dependency_groups_parsed: list[DependencyGroupParsed] = []
 
+        text = py_project.snapshot.get_text()
+        spans_by_key = locate_array_items_or_empty(text)
+
         for group in collect_from_py_project(py_project.data):
             # Note: With this we can show the string representation of dependencies. With comments.
             # print(group.dependencies.as_string())
 
             parsed_dependencies: list[DependencyItemParsed] = []
 
+            spans = spans_by_key.get(group.get_key_path())
+            if spans is not None and len(spans) != len(group.dependencies):
+                spans = None
+
             for index, dependency in enumerate(group.dependencies):
                 if not isinstance(dependency, str):
                     if verbose:
@@ -67,6 +72,7 @@ def collect_top_level_dependencies(
                     DependencyItemParsed(
                         parsed=parsed,
                         index_in_group=index,
+                        literal_span=get_literal_span(text, spans, index, dependency),
                     ),
                 )
 
@@ -88,6 +94,7 @@ def collect_top_level_dependencies(
         py_project_extra = PyProjectWrapperExtra(
             path=py_project.path,
             data=py_project.data,
+            snapshot=py_project.snapshot,
             #
             dependency_groups_parsed=dependency_groups_parsed,
         )
@@ -98,6 +105,32 @@ def collect_top_level_dependencies(
     )
 
 
+def get_literal_span(
+    text: str,
+    spans: list[TextSpan] | None,
+    index: int,
+    dependency: DependencyString,
+) -> TextSpan | None:
+    if spans is None:
+        return None
+
+    start, end = spans[index]
+    # Note: Check, just in case. Use the span only if it points exactly to this literal.
+    if text[start:end] != toml_item_as_string(dependency):
+        return None
+    return start, end
+
+
+def locate_array_items_or_empty(text: str) -> ArrayItemsSpans:
+    """Locate arrays for in-place edits. Empty if not possible. Then the whole document is re-serialized."""
+    logger = logging.getLogger(__name__)
+    try:
+        return locate_array_items(text)
+    except TomlLocateError as e:
+        logger.debug(f"Can't locate dependencies in the text: {e}")
+        return {}
+
+
 # for index, _dependency in enumerate(deps_sequence_from_config):
 #     if changes_or_none is not None:
 #         deps_sequence_from_config[index] = changes_or_none.to_item.get_full_spec()
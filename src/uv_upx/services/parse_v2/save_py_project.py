@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING
+
+from uv_upx.services.file_snapshot import write_bytes_atomically
+from uv_upx.services.toml import TextSpan, splice_text, toml_dumps, toml_item_as_string
+
+if TYPE_CHECKING:
+    from uv_upx.services.parse_v2.collect_dependencies import PyProjectWrapperExtra
+
+
+def render_py_project(
+    py_project: PyProjectWrapperExtra,
+) -> str:
+    """Render the current state of dependencies into the original text.
+
+    Only changed string literals are replaced. The rest of the file is kept byte-to-byte.
+    """
+    text = py_project.snapshot.get_text()
+
+    replacements: list[tuple[TextSpan, str]] = []
+    for group in py_project.dependency_groups_parsed:
+        for dependency in group.parsed_dependencies:
+            literal = toml_item_as_string(group.dependencies[dependency.index_in_group])
+
+            if dependency.literal_span is None:
+                # Position is unknown. Fallback to the full serialization.
+                return toml_dumps(py_project.data)
+
+            start, end = dependency.literal_span
+            if text[start:end] != literal:
+                replacements.append((dependency.literal_span, literal))
+
+    return splice_text(text, replacements)
+
+
+type IsWritten = bool
+
+
+def save_py_project(
+    py_project: PyProjectWrapperExtra,
+) -> IsWritten:
+    """Write the current state of dependencies. Skip the write if the file already has the same content."""
+    content = render_py_project(py_project).encode("utf-8")
+
+    try:
+        if py_project.path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_bytes_atomically(py_project.path, content)
+    return True
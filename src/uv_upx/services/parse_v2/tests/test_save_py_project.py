@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+
+from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.parse_v2.collect_dependencies import collect_top_level_dependencies
+from uv_upx.services.parse_v2.save_py_project import render_py_project, save_py_project
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.parse_v2.collect_dependencies import PyProjectWrapperExtra
+
+PYPROJECT_TOML_CONTENTS = """[project]
+name = "foo"
+dependencies = [
+    # Better classes and data validation
+    "pydantic>=2.12.5",
+    'tomlkit >= 0.13.3',  # keep the style of untouched items
+]
+
+[dependency-groups]
+dev = ["pytest>=9.0.2"]
+"""
+
+
+def load_py_project(tmp_path: pathlib.Path) -> PyProjectWrapperExtra:
+    (tmp_path / "pyproject.toml").write_bytes(PYPROJECT_TOML_CONTENTS.encode())
+    collected = collect_top_level_dependencies(
+        py_projects=get_all_pyprojects_by_project_root_path(tmp_path),
+    )
+    return collected.parsed_pyprojects[0]
+
+
+def test_render_py_project_i_only_changed_literals(tmp_path: pathlib.Path) -> None:
+    py_project = load_py_project(tmp_path)
+    group = py_project.dependency_groups_parsed[0]
+    group.dependencies[0] = 'pydantic>=2.13; python_version >= "3.14"'
+
+    assert render_py_project(py_project) == PYPROJECT_TOML_CONTENTS.replace(
+        '"pydantic>=2.12.5"',
+        '"pydantic>=2.13; python_version >= \\"3.14\\""',
+    )
+
+
+def test_save_py_project_i_skip_identical(tmp_path: pathlib.Path) -> None:
+    py_project = load_py_project(tmp_path)
+    mtime_before = py_project.path.stat().st_mtime_ns
+
+    assert not save_py_project(py_project)
+    assert py_project.path.stat().st_mtime_ns == mtime_before
+
+    py_project.dependency_groups_parsed[1].dependencies[0] = "pytest>=9.1"
+    assert save_py_project(py_project)
+    assert py_project.path.read_text(encoding="utf-8").endswith('dev = ["pytest>=9.1"]\n')
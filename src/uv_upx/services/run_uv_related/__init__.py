@@ -1,10 +1,14 @@
-from uv_upx.services.run_uv_related.exceptions import UnresolvedDependencyError
+from uv_upx.services.run_uv_related.exceptions import UnresolvedDependencyError, UvCommandTimeoutError
+from uv_upx.services.run_uv_related.run_uv_command import run_uv_command, terminate_running_uv_commands
 from uv_upx.services.run_uv_related.run_uv_lock import run_uv_lock
 from uv_upx.services.run_uv_related.run_uv_sync import UvSyncMode, run_uv_sync
 
 __all__ = [
     "UnresolvedDependencyError",
+    "UvCommandTimeoutError",
     "UvSyncMode",
+    "run_uv_command",
     "run_uv_lock",
     "run_uv_sync",
+    "terminate_running_uv_commands",
 ]
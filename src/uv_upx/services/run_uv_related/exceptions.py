@@ -1,2 +1,9 @@
 class UnresolvedDependencyError(Exception):
     pass
+
+
+class UvCommandTimeoutError(TimeoutError):
+    """uv command didn't finish in time. It is stopped.
+
+    Not an `UnresolvedDependencyError`. So, it is not bisected, only rolled back.
+    """
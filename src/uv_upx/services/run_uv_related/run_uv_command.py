@@ -0,0 +1,130 @@
+import contextlib
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.services.run_uv_related.exceptions import UvCommandTimeoutError
+from uv_upx.services.time_limits import UvCommandKind, get_uv_command_timeout
+from uv_upx.services.timings import timed
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+SECONDS_I_TERMINATION_GRACE: Final[float] = 5.0
+"""Time for uv to stop after SIGTERM. Then it is killed."""
+
+RUNNING_PROCESSES: Final[set[subprocess.Popen[bytes]]] = set()
+"""Started, but not finished yet. From all threads."""
+
+RUNNING_PROCESSES_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def run_uv_command(
+    command: list[str],
+    *,
+    workdir: pathlib.Path,
+    #
+    kind: UvCommandKind | None = None,
+) -> None:
+    """Run the uv command. The single place for all uv subprocess calls.
+
+    Timed as a phase, named by the command.
+
+    uv runs in its own process group. With the timeout for its kind, by the active time limits.
+    On timeout or interruption (like Ctrl-C or SIGTERM), the whole group is terminated.
+    So, sdist builds, started by uv, are stopped too.
+
+    Raises:
+        subprocess.CalledProcessError: if the command fails.
+        UvCommandTimeoutError: if the command doesn't finish in time.
+    """
+    command_title = shlex.join(command)
+
+    timeout_seconds = get_uv_command_timeout(kind)
+    if timeout_seconds is not None and timeout_seconds <= 0:
+        msg = f"No time left to run '{command_title}'."
+        raise UvCommandTimeoutError(msg)
+
+    with timed(command_title), start_process_group(command, workdir=workdir) as process:
+        try:
+            return_code = process.wait(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            msg = f"'{command_title}' didn't finish in {timeout_seconds:g} seconds."
+            raise UvCommandTimeoutError(msg) from None
+
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, command)
+
+
+@contextlib.contextmanager
+def start_process_group(
+    command: list[str],
+    *,
+    workdir: pathlib.Path,
+) -> Iterator[subprocess.Popen[bytes]]:
+    """Start the command in a new process group. If it is still running on exit, terminate the group."""
+    # Note: A new session. So, Ctrl-C in the terminal doesn't reach uv directly. We stop it ourselves.
+    process = subprocess.Popen(  # noqa: S603
+        command,
+        cwd=workdir,
+        start_new_session=True,
+    )
+    with RUNNING_PROCESSES_LOCK:
+        RUNNING_PROCESSES.add(process)
+
+    try:
+        yield process
+    finally:
+        try:
+            if process.poll() is None:
+                terminate_process_group(process)
+        finally:
+            with RUNNING_PROCESSES_LOCK:
+                RUNNING_PROCESSES.discard(process)
+
+
+def terminate_process_group(process: subprocess.Popen[bytes]) -> None:
+    """Ask the group to stop. Kill it, if it doesn't stop in time. Wait for it."""
+    signal_process_group(process, force=False)
+    try:
+        process.wait(timeout=SECONDS_I_TERMINATION_GRACE)
+    except subprocess.TimeoutExpired:
+        signal_process_group(process, force=True)
+        process.wait()
+
+
+def terminate_running_uv_commands() -> None:
+    """Ask all running uv commands to stop. Don't wait. Threads, running them, wait and clean up.
+
+    For commands in background threads. Interruptions reach only the main thread.
+    """
+    with RUNNING_PROCESSES_LOCK:
+        processes = list(RUNNING_PROCESSES)
+
+    for process in processes:
+        signal_process_group(process, force=False)
+
+
+def signal_process_group(
+    process: subprocess.Popen[bytes],
+    *,
+    force: bool,
+) -> None:
+    if process.poll() is not None:
+        return
+
+    if sys.platform == "win32":
+        # Note: No process groups. Only uv itself is stopped.
+        if force:
+            process.kill()
+        else:
+            process.terminate()
+        return
+
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
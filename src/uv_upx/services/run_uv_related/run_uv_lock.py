@@ -2,26 +2,41 @@ import subprocess
 from typing import TYPE_CHECKING
 
 from uv_upx.services.run_uv_related.exceptions import UnresolvedDependencyError
+from uv_upx.services.run_uv_related.run_uv_command import run_uv_command
+from uv_upx.services.time_limits import UvCommandKind
 
 if TYPE_CHECKING:
     import pathlib
 
+    from uv_upx.services.package_name import PackageName
+
 
 def run_uv_lock(
     workdir: pathlib.Path,
     *,
     upgrade: bool = False,
+    upgrade_packages: list[PackageName] | None = None,
 ) -> None:
+    """Run `uv lock`.
+
+    Args:
+        workdir: Project root.
+        upgrade: Upgrade all packages.
+        upgrade_packages: Upgrade only these packages. Faster than upgrading all.
+    """
     # uv lock --upgrade
     command = ["uv", "lock"]
     if upgrade:
         command.append("--upgrade")
+    for package_name in upgrade_packages or ():
+        command.extend(["--upgrade-package", package_name])
     try:
-        subprocess.run(  # noqa: S603
+        run_uv_command(
             # uv lock --upgrade
             command,
-            check=True,
-            cwd=workdir,
+            workdir=workdir,
+            #
+            kind=UvCommandKind.LOCK,
         )
     except subprocess.CalledProcessError as e:
         msg = "Failed to resolve dependencies with 'uv lock'. Please check your dependency specifications."
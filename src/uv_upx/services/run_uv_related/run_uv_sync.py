@@ -3,6 +3,8 @@ import subprocess
 from typing import TYPE_CHECKING
 
 from uv_upx.services.run_uv_related import UnresolvedDependencyError
+from uv_upx.services.run_uv_related.run_uv_command import run_uv_command
+from uv_upx.services.time_limits import UvCommandKind
 
 if TYPE_CHECKING:
     import pathlib
@@ -34,10 +36,11 @@ def run_uv_sync(
             pass
 
     try:
-        subprocess.run(  # noqa: S603
+        run_uv_command(
             command,
-            check=True,
-            cwd=workdir,
+            workdir=workdir,
+            #
+            kind=UvCommandKind.SYNC,
         )
     except subprocess.CalledProcessError as e:
         msg = "Failed to sync dependencies with 'uv sync'. Please check your dependency specifications."
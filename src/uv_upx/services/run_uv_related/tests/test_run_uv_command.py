@@ -0,0 +1,76 @@
+import subprocess
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from uv_upx.services.run_uv_related import UvCommandTimeoutError, run_uv_command, terminate_running_uv_commands
+from uv_upx.services.run_uv_related.run_uv_command import RUNNING_PROCESSES
+from uv_upx.services.time_limits import UvCommandKind, apply_time_limits
+
+if TYPE_CHECKING:
+    import pathlib
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Process groups are POSIX only.")
+
+SECONDS_I_TIMEOUT: Final[float] = 0.5
+SECONDS_I_ENOUGH_TO_STOP: Final[float] = 10.0
+
+COMMAND_I_HANGING: Final[list[str]] = [
+    sys.executable,
+    "-c",
+    # Note: Like uv with a stuck sdist build. The child is in the same process group.
+    (
+        "import subprocess, sys, time; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+        "time.sleep(60)"
+    ),
+]
+
+
+def test_run_uv_command_fails(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(subprocess.CalledProcessError):
+        run_uv_command([sys.executable, "-c", "raise SystemExit(2)"], workdir=tmp_path)
+
+    assert not RUNNING_PROCESSES
+
+
+def test_run_uv_command_timeout(tmp_path: pathlib.Path) -> None:
+    started_at = time.monotonic()
+    with (
+        apply_time_limits(lock_timeout_seconds=SECONDS_I_TIMEOUT),
+        pytest.raises(UvCommandTimeoutError),
+    ):
+        run_uv_command(COMMAND_I_HANGING, workdir=tmp_path, kind=UvCommandKind.LOCK)
+
+    assert time.monotonic() - started_at < SECONDS_I_ENOUGH_TO_STOP
+    assert not RUNNING_PROCESSES
+
+
+def test_run_uv_command_no_time_left(tmp_path: pathlib.Path) -> None:
+    with apply_time_limits(max_duration_seconds=0), pytest.raises(UvCommandTimeoutError, match="No time left"):
+        run_uv_command([sys.executable, "-c", "pass"], workdir=tmp_path)
+
+
+def test_terminate_running_uv_commands(tmp_path: pathlib.Path) -> None:
+    errors: list[BaseException] = []
+
+    def run_in_background() -> None:
+        try:
+            run_uv_command(COMMAND_I_HANGING, workdir=tmp_path)
+        except subprocess.CalledProcessError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run_in_background)
+    thread.start()
+    while not RUNNING_PROCESSES:
+        time.sleep(0.01)
+
+    terminate_running_uv_commands()
+    thread.join(SECONDS_I_ENOUGH_TO_STOP)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    assert not RUNNING_PROCESSES
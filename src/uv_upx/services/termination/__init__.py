@@ -0,0 +1,7 @@
+from .handle_termination import TerminatedError, defer_interruptions, handle_termination
+
+__all__ = [
+    "TerminatedError",
+    "defer_interruptions",
+    "handle_termination",
+]
@@ -0,0 +1,82 @@
+import contextlib
+import signal
+import threading
+from typing import TYPE_CHECKING, Final, NoReturn
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import FrameType
+
+SIGNALS_I_INTERRUPTING: Final[tuple[signal.Signals, ...]] = (
+    signal.SIGINT,
+    signal.SIGTERM,
+)
+
+
+class TerminatedError(BaseException):
+    """SIGTERM is received. Like `KeyboardInterrupt` for SIGINT.
+
+    Not an `Exception`. So, generic error handlers don't swallow it.
+    """
+
+
+def is_main_thread() -> bool:
+    # Note: Signal handlers can be set only in the main thread.
+    return threading.current_thread() is threading.main_thread()
+
+
+def raise_terminated_error(
+    signum: int,  # noqa: ARG001
+    frame: FrameType | None,  # noqa: ARG001
+) -> NoReturn:
+    msg = "Terminated by SIGTERM."
+    raise TerminatedError(msg)
+
+
+@contextlib.contextmanager
+def handle_termination() -> Iterator[None]:
+    """Raise `TerminatedError` on SIGTERM inside the block. So, cleanup and rollback run, as for Ctrl-C.
+
+    Does nothing outside the main thread.
+    """
+    if not is_main_thread():
+        yield
+        return
+
+    previous_handler = signal.signal(signal.SIGTERM, raise_terminated_error)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+
+
+@contextlib.contextmanager
+def defer_interruptions() -> Iterator[None]:
+    """Don't let SIGINT or SIGTERM interrupt the block. Like a rollback. Raise after it, if any was received.
+
+    Does nothing outside the main thread.
+    """
+    if not is_main_thread():
+        yield
+        return
+
+    received: list[int] = []
+
+    def remember_signal(
+        signum: int,
+        frame: FrameType | None,  # noqa: ARG001
+    ) -> None:
+        received.append(signum)
+
+    previous_handlers = {signum: signal.signal(signum, remember_signal) for signum in SIGNALS_I_INTERRUPTING}
+    try:
+        yield
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    if signal.SIGINT in received:
+        raise KeyboardInterrupt
+    if received:
+        msg = "Terminated by SIGTERM."
+        raise TerminatedError(msg)
@@ -0,0 +1,41 @@
+import os
+import signal
+import sys
+
+import pytest
+
+from uv_upx.services.termination import TerminatedError, defer_interruptions, handle_termination
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals.")
+
+
+def test_handle_termination() -> None:
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    with pytest.raises(TerminatedError), handle_termination():
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+def test_defer_interruptions() -> None:
+    steps: list[str] = []
+
+    def roll_back() -> None:
+        with handle_termination(), defer_interruptions():
+            os.kill(os.getpid(), signal.SIGTERM)
+            steps.append("rolled back")
+
+    with pytest.raises(TerminatedError):
+        roll_back()
+
+    assert steps == ["rolled back"]
+
+
+def test_defer_interruptions_keyboard_interrupt() -> None:
+    def roll_back() -> None:
+        with defer_interruptions():
+            os.kill(os.getpid(), signal.SIGINT)
+
+    with pytest.raises(KeyboardInterrupt):
+        roll_back()
@@ -0,0 +1,9 @@
+from .models import TimeLimits, UvCommandKind
+from .time_limits import apply_time_limits, get_uv_command_timeout
+
+__all__ = [
+    "TimeLimits",
+    "UvCommandKind",
+    "apply_time_limits",
+    "get_uv_command_timeout",
+]
@@ -0,0 +1,38 @@
+import dataclasses
+import enum
+import time
+
+
+@enum.unique
+class UvCommandKind(enum.StrEnum):
+    LOCK = "lock"
+    SYNC = "sync"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TimeLimits:
+    lock_timeout_seconds: float | None = None
+    """For each `uv lock`."""
+
+    sync_timeout_seconds: float | None = None
+    """For each `uv sync`."""
+
+    deadline: float | None = None
+    """By `time.monotonic()`. For the whole run."""
+
+    def get_timeout(self, kind: UvCommandKind | None = None) -> float | None:
+        """Seconds left for the uv command. None means no limit. Zero or less means no time left."""
+        timeout: float | None
+        match kind:
+            case UvCommandKind.LOCK:
+                timeout = self.lock_timeout_seconds
+            case UvCommandKind.SYNC:
+                timeout = self.sync_timeout_seconds
+            case None:
+                timeout = None
+
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        return timeout
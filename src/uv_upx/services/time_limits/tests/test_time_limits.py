@@ -0,0 +1,37 @@
+import time
+from typing import Final
+
+from uv_upx.services.time_limits import TimeLimits, UvCommandKind, apply_time_limits, get_uv_command_timeout
+
+SECONDS_I_MAX_DURATION: Final[float] = 10.0
+
+
+def test_get_timeout_by_kind() -> None:
+    time_limits = TimeLimits(lock_timeout_seconds=60, sync_timeout_seconds=600)
+
+    assert time_limits.get_timeout(UvCommandKind.LOCK) == time_limits.lock_timeout_seconds
+    assert time_limits.get_timeout(UvCommandKind.SYNC) == time_limits.sync_timeout_seconds
+    assert time_limits.get_timeout() is None
+
+
+def test_get_timeout_is_limited_by_deadline() -> None:
+    time_limits = TimeLimits(lock_timeout_seconds=60, deadline=time.monotonic() + SECONDS_I_MAX_DURATION)
+
+    lock_timeout = time_limits.get_timeout(UvCommandKind.LOCK)
+    sync_timeout = time_limits.get_timeout(UvCommandKind.SYNC)
+
+    assert lock_timeout is not None
+    assert sync_timeout is not None
+    assert 0 < lock_timeout <= SECONDS_I_MAX_DURATION
+    assert 0 < sync_timeout <= SECONDS_I_MAX_DURATION
+
+
+def test_apply_time_limits() -> None:
+    assert get_uv_command_timeout(UvCommandKind.LOCK) is None
+
+    with apply_time_limits(lock_timeout_seconds=60, max_duration_seconds=0):
+        timeout = get_uv_command_timeout(UvCommandKind.LOCK)
+        assert timeout is not None
+        assert timeout <= 0
+
+    assert get_uv_command_timeout(UvCommandKind.LOCK) is None
@@ -0,0 +1,40 @@
+import contextlib
+import contextvars
+import time
+from typing import TYPE_CHECKING
+
+from uv_upx.services.time_limits.models import TimeLimits, UvCommandKind
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+CURRENT_TIME_LIMITS: contextvars.ContextVar[TimeLimits] = contextvars.ContextVar(
+    "CURRENT_TIME_LIMITS",
+    default=TimeLimits(),  # noqa: B039
+)
+
+
+@contextlib.contextmanager
+def apply_time_limits(
+    *,
+    lock_timeout_seconds: float | None = None,
+    sync_timeout_seconds: float | None = None,
+    #
+    max_duration_seconds: float | None = None,
+) -> Iterator[TimeLimits]:
+    """Limit durations of all uv commands inside. The max duration is counted from here."""
+    time_limits = TimeLimits(
+        lock_timeout_seconds=lock_timeout_seconds,
+        sync_timeout_seconds=sync_timeout_seconds,
+        deadline=None if max_duration_seconds is None else time.monotonic() + max_duration_seconds,
+    )
+    token = CURRENT_TIME_LIMITS.set(time_limits)
+    try:
+        yield time_limits
+    finally:
+        CURRENT_TIME_LIMITS.reset(token)
+
+
+def get_uv_command_timeout(kind: UvCommandKind | None = None) -> float | None:
+    """Seconds left for the uv command by the active limits. None means no limit."""
+    return CURRENT_TIME_LIMITS.get().get_timeout(kind)
@@ -0,0 +1,23 @@
+from .export import (
+    render_timings_json,
+    render_timings_openmetrics,
+    render_timings_table,
+    report_timings,
+    write_timings_file,
+)
+from .models import PhaseTiming, TimingsReport
+from .recorder import TimingsRecorder, record_timings, set_timings_count, timed
+
+__all__ = [
+    "PhaseTiming",
+    "TimingsRecorder",
+    "TimingsReport",
+    "record_timings",
+    "render_timings_json",
+    "render_timings_openmetrics",
+    "render_timings_table",
+    "report_timings",
+    "set_timings_count",
+    "timed",
+    "write_timings_file",
+]
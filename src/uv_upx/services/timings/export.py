@@ -0,0 +1,121 @@
+import logging
+import re
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.services.timings_format import TimingsFormat
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.timings.models import PhasePath, TimingsReport
+
+METRIC_PREFIX: Final[str] = "uv_upx"
+PHASE_PATH_SEPARATOR: Final[str] = "/"
+
+PATTERN_I_METRIC_NAME_I_TO_REPLACE: Final[re.Pattern[str]] = re.compile(r"[^a-zA-Z0-9_]+")
+
+
+def render_timings_table(report: TimingsReport) -> str:
+    """Human-readable phase breakdown. Indented by nesting."""
+    total_seconds = report.total_seconds or 1.0
+    name_width = max((len(phase.name) + 2 * phase.depth for phase in report.phases), default=0)
+
+    lines: list[str] = ["Timings:"]
+    for phase in report.phases:
+        name = f"{'  ' * phase.depth}{phase.name}"
+        percent = 100 * phase.duration_seconds / total_seconds
+        lines.append(f"  {name:<{name_width}}  {phase.duration_seconds:9.3f}s  {percent:5.1f}%")
+    lines.append(f"  {'total':<{name_width}}  {report.total_seconds:9.3f}s")
+
+    if report.counters:
+        lines.append("Counts:")
+        lines.extend(f"  {name}: {value}" for name, value in report.counters.items())
+
+    return "\n".join(lines)
+
+
+def render_timings_json(report: TimingsReport) -> str:
+    return report.model_dump_json(indent=2)
+
+
+def render_timings_openmetrics(report: TimingsReport) -> str:
+    """OpenMetrics text format.
+
+    https://github.com/prometheus/OpenMetrics/blob/main/specification/OpenMetrics.md
+
+    Durations of phases with the same path are summed. Because labels must be unique.
+    """
+    durations: dict[PhasePath, float] = {}
+    for phase in report.phases:
+        durations[phase.path] = durations.get(phase.path, 0.0) + phase.duration_seconds
+
+    metric_name = f"{METRIC_PREFIX}_phase_duration_seconds"
+    lines: list[str] = [
+        f"# TYPE {metric_name} gauge",
+        f"# UNIT {metric_name} seconds",
+        f"# HELP {metric_name} Duration of the phase.",
+    ]
+    lines.extend(
+        f'{metric_name}{{phase="{escape_label_value(PHASE_PATH_SEPARATOR.join(path))}"}} {duration}'
+        for path, duration in durations.items()
+    )
+
+    metric_name = f"{METRIC_PREFIX}_total_duration_seconds"
+    lines.extend(
+        [
+            f"# TYPE {metric_name} gauge",
+            f"# UNIT {metric_name} seconds",
+            f"# HELP {metric_name} Duration of the whole run.",
+            f"{metric_name} {report.total_seconds}",
+        ],
+    )
+
+    for name, value in report.counters.items():
+        metric_name = f"{METRIC_PREFIX}_{PATTERN_I_METRIC_NAME_I_TO_REPLACE.sub('_', name)}"
+        lines.extend(
+            [
+                f"# TYPE {metric_name} gauge",
+                f"{metric_name} {value}",
+            ],
+        )
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_timings_file(
+    report: TimingsReport,
+    path: pathlib.Path,
+    *,
+    timings_format: TimingsFormat = TimingsFormat.JSON,
+) -> None:
+    match timings_format:
+        case TimingsFormat.JSON:
+            content = render_timings_json(report)
+        case TimingsFormat.OPENMETRICS:
+            content = render_timings_openmetrics(report)
+
+    path.write_text(content, encoding="utf-8")
+
+
+def report_timings(
+    report: TimingsReport,
+    *,
+    show: bool = True,
+    #
+    path: pathlib.Path | None = None,
+    timings_format: TimingsFormat = TimingsFormat.JSON,
+) -> None:
+    """Show the phase breakdown and/or write the report into the file."""
+    logger = logging.getLogger(__name__)
+
+    if show:
+        logger.info(render_timings_table(report))
+
+    if path is not None:
+        write_timings_file(report, path, timings_format=timings_format)
+        logger.info(f"Saved timings to {path.as_uri()}")
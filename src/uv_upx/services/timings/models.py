@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+type PhasePath = tuple[str, ...]
+"""Names of the phase and all its parents. Like `("run_updater", "update_lock_file")`."""
+
+
+class PhaseTiming(BaseModel):
+    path: PhasePath
+
+    started_at_seconds: float
+    """Offset from the start of the recording."""
+
+    duration_seconds: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.path[-1]
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+class TimingsReport(BaseModel):
+    phases: list[PhaseTiming] = Field(default_factory=list)
+    """Phases in the start order. Parents before children."""
+
+    counters: dict[str, int] = Field(default_factory=dict)
+    """Like files, dependencies and changes counts."""
+
+    total_seconds: float = 0.0
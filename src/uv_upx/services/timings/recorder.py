@@ -0,0 +1,92 @@
+import contextlib
+import contextvars
+import time
+from typing import TYPE_CHECKING
+
+from uv_upx.services.timings.models import PhaseTiming, TimingsReport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from uv_upx.services.timings.models import PhasePath
+
+
+CURRENT_PHASE_PATH: contextvars.ContextVar[PhasePath] = contextvars.ContextVar(
+    "CURRENT_PHASE_PATH",
+    default=(),
+)
+"""Path of the current phase. Per context. So, phases in a background thread, run in a copied context, nest right."""
+
+
+class TimingsRecorder:
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.report = TimingsReport()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        path = (*CURRENT_PHASE_PATH.get(), name)
+        token = CURRENT_PHASE_PATH.set(path)
+
+        started_at = time.perf_counter()
+        # Note: Add on enter. So, parents are before children.
+        phase_timing = PhaseTiming(path=path, started_at_seconds=started_at - self.started_at)
+        self.report.phases.append(phase_timing)
+        try:
+            yield
+        finally:
+            phase_timing.duration_seconds = time.perf_counter() - started_at
+            CURRENT_PHASE_PATH.reset(token)
+
+    def set_count(self, name: str, value: int) -> None:
+        self.report.counters[name] = value
+
+    def finish(self) -> TimingsReport:
+        self.report.total_seconds = time.perf_counter() - self.started_at
+        return self.report
+
+
+CURRENT_TIMINGS_RECORDER: contextvars.ContextVar[TimingsRecorder | None] = contextvars.ContextVar(
+    "CURRENT_TIMINGS_RECORDER",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def record_timings(*, enabled: bool = True) -> Iterator[TimingsRecorder | None]:
+    """Record timings of all `timed` phases inside. Yield None if disabled."""
+    if not enabled:
+        yield None
+        return
+
+    recorder = TimingsRecorder()
+    token = CURRENT_TIMINGS_RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        CURRENT_TIMINGS_RECORDER.reset(token)
+        recorder.finish()
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Time the phase. Nested phases are recorded as children.
+
+    Can be used as a decorator.
+
+    Does nothing if there is no active recording.
+    """
+    recorder = CURRENT_TIMINGS_RECORDER.get()
+    if recorder is None:
+        yield
+        return
+
+    with recorder.phase(name):
+        yield
+
+
+def set_timings_count(name: str, value: int) -> None:
+    """Save a counter into the active recording. Does nothing if there is no active recording."""
+    recorder = CURRENT_TIMINGS_RECORDER.get()
+    if recorder is not None:
+        recorder.set_count(name, value)
@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+from uv_upx.services.timings import (
+    TimingsReport,
+    record_timings,
+    render_timings_openmetrics,
+    render_timings_table,
+    set_timings_count,
+    timed,
+    write_timings_file,
+)
+from uv_upx.services.timings_format import TimingsFormat
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@timed("decorated")
+def decorated_phase() -> None:
+    with timed("inner"):
+        pass
+
+
+def test_record_timings_nested() -> None:
+    with record_timings() as recorder:
+        with timed("outer"):
+            decorated_phase()
+            decorated_phase()
+        set_timings_count("changes", 3)
+
+    assert recorder is not None
+    report = recorder.report
+
+    assert [phase.path for phase in report.phases] == [
+        ("outer",),
+        ("outer", "decorated"),
+        ("outer", "decorated", "inner"),
+        ("outer", "decorated"),
+        ("outer", "decorated", "inner"),
+    ]
+    assert report.counters == {"changes": 3}
+    assert report.total_seconds >= report.phases[0].duration_seconds >= report.phases[1].duration_seconds
+
+
+def test_record_timings_disabled() -> None:
+    with record_timings(enabled=False) as recorder:
+        decorated_phase()
+        set_timings_count("changes", 3)
+
+    assert recorder is None
+
+
+def test_render_timings() -> None:
+    with record_timings() as recorder:
+        with timed("uv lock --upgrade"):
+            pass
+        with timed("uv lock --upgrade"):
+            pass
+        set_timings_count("py_project_files", 2)
+
+    assert recorder is not None
+    report = recorder.report
+
+    assert "uv lock --upgrade" in render_timings_table(report)
+
+    metrics = render_timings_openmetrics(report).splitlines()
+    assert metrics[-1] == "# EOF"
+    # Note: Same phases are summed. Labels must be unique.
+    assert sum(line.startswith('uv_upx_phase_duration_seconds{phase="uv lock --upgrade"}') for line in metrics) == 1
+    assert "uv_upx_py_project_files 2" in metrics
+
+
+def test_write_timings_file_json(tmp_path: pathlib.Path) -> None:
+    with record_timings() as recorder, timed("phase"):
+        pass
+
+    assert recorder is not None
+    path = tmp_path / "timings.json"
+    write_timings_file(recorder.report, path, timings_format=TimingsFormat.JSON)
+
+    assert TimingsReport.model_validate_json(path.read_text(encoding="utf-8")) == recorder.report
@@ -0,0 +1,5 @@
+from .timings_format_enum import TimingsFormat
+
+__all__ = [
+    "TimingsFormat",
+]
@@ -0,0 +1,14 @@
+import enum
+
+
+@enum.unique
+class TimingsFormat(enum.StrEnum):
+    JSON = "json"
+    """JSON document. The whole report."""
+
+    OPENMETRICS = "openmetrics"
+    """OpenMetrics text exposition format. Gauges. For dashboards."""
+
+    @staticmethod
+    def get_default() -> TimingsFormat:
+        return TimingsFormat.JSON
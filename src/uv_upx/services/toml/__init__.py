@@ -1,7 +1,22 @@
-from uv_upx.services.toml.functions import toml_dumps, toml_load, toml_parse, toml_save
+from uv_upx.services.toml.functions import toml_dumps, toml_item_as_string, toml_load, toml_parse, toml_save
+from uv_upx.services.toml.locate_array_items import (
+    ArrayItemsSpans,
+    TextSpan,
+    TomlKeyPath,
+    TomlLocateError,
+    locate_array_items,
+)
+from uv_upx.services.toml.splice_text import splice_text
 
 __all__ = [
+    "ArrayItemsSpans",
+    "TextSpan",
+    "TomlKeyPath",
+    "TomlLocateError",
+    "locate_array_items",
+    "splice_text",
     "toml_dumps",
+    "toml_item_as_string",
     "toml_load",
     "toml_parse",
     "toml_save",
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 import tomlkit
 from tomlkit import TOMLDocument
+from tomlkit.items import Item
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -24,3 +25,10 @@ def toml_dumps(data: TOMLDocument) -> str:
 def toml_save(path: Path, data: TOMLDocument) -> None:
     text = toml_dumps(data)
     path.write_text(text, encoding="utf-8")
+
+
+def toml_item_as_string(value: object) -> str:
+    """Get the TOML representation of a single value. As tomlkit would write it."""
+    if isinstance(value, Item):
+        return value.as_string()
+    return tomlkit.item(value).as_string()
@@ -0,0 +1,228 @@
+import json
+from typing import Final
+
+type TomlKeyPath = tuple[str, ...]
+"""Full path of a key. Like `("project", "optional-dependencies", "dev")`."""
+
+type TextSpan = tuple[int, int]
+"""Start (inclusive) and end (exclusive) offsets in the source text."""
+
+type ArrayItemsSpans = dict[TomlKeyPath, list[TextSpan]]
+
+CHARS_I_INLINE_WHITESPACE: Final[str] = " \t"
+CHARS_I_NEWLINE: Final[str] = "\r\n"
+CHARS_I_BARE_VALUE_END: Final[str] = ",]}#\r\n"
+
+
+class TomlLocateError(ValueError):
+    pass
+
+
+def locate_array_items(text: str) -> ArrayItemsSpans:
+    """Find the text spans of each item of each array in the TOML document.
+
+    Only arrays assigned directly to a key are collected. Not nested ones.
+    Arrays inside arrays of tables (`[[...]]`) are skipped.
+
+    Index in the list matches the index in the parsed array.
+    So, with tomlkit, `text[start:end] == array[index].as_string()`.
+
+    Raises:
+        TomlLocateError: if the text is not a TOML document supported by this simple scanner.
+    """
+    return _ArrayItemsLocator(text).run()
+
+
+class _ArrayItemsLocator:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+        self.length = len(text)
+
+        self.table: TomlKeyPath | None = ()
+        """Current table. None for arrays of tables."""
+
+        self.result: ArrayItemsSpans = {}
+
+    def run(self) -> ArrayItemsSpans:
+        while True:
+            self.skip_trivia()
+            if self.pos >= self.length:
+                return self.result
+
+            if self.text[self.pos] == "[":
+                self.read_table_header()
+            else:
+                self.read_key_value()
+
+    def fail(self, message: str) -> TomlLocateError:
+        return TomlLocateError(f"{message} at position {self.pos}")
+
+    def peek(self) -> str:
+        if self.pos >= self.length:
+            msg = "Unexpected end of document"
+            raise self.fail(msg)
+        return self.text[self.pos]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            msg = f"Expected '{char}'"
+            raise self.fail(msg)
+        self.pos += 1
+
+    def skip_trivia(self, *, newlines: bool = True) -> None:
+        """Skip whitespaces and comments."""
+        while self.pos < self.length:
+            char = self.text[self.pos]
+            if char in CHARS_I_INLINE_WHITESPACE or (newlines and char in CHARS_I_NEWLINE):
+                self.pos += 1
+            elif char == "#":
+                end = self.text.find("\n", self.pos)
+                self.pos = self.length if end == -1 else end
+            else:
+                return
+
+    def read_table_header(self) -> None:
+        is_array_of_tables = self.text.startswith("[[", self.pos)
+        self.pos += 2 if is_array_of_tables else 1
+
+        key = self.read_key()
+
+        self.expect("]")
+        if is_array_of_tables:
+            self.expect("]")
+
+        self.table = None if is_array_of_tables else key
+
+    def read_key(self) -> TomlKeyPath:
+        parts: list[str] = []
+        while True:
+            self.skip_trivia(newlines=False)
+            char = self.peek()
+            if char == '"':
+                start = self.pos
+                self.skip_basic_string()
+                parts.append(json.loads(self.text[start : self.pos]))
+            elif char == "'":
+                start = self.pos + 1
+                self.skip_literal_string()
+                parts.append(self.text[start : self.pos - 1])
+            else:
+                start = self.pos
+                while self.pos < self.length and (self.text[self.pos].isalnum() or self.text[self.pos] in "-_"):
+                    self.pos += 1
+                if start == self.pos:
+                    msg = "Expected a key"
+                    raise self.fail(msg)
+                parts.append(self.text[start : self.pos])
+
+            self.skip_trivia(newlines=False)
+            if self.pos < self.length and self.text[self.pos] == ".":
+                self.pos += 1
+                continue
+            return tuple(parts)
+
+    def read_key_value(self) -> None:
+        key = self.read_key()
+        self.expect("=")
+        self.skip_trivia(newlines=False)
+
+        if self.table is not None and self.peek() == "[":
+            self.result[(*self.table, *key)] = self.read_array_items()
+        else:
+            self.skip_value()
+
+    def read_array_items(self) -> list[TextSpan]:
+        self.expect("[")
+        spans: list[TextSpan] = []
+        while True:
+            self.skip_trivia()
+            if self.peek() == "]":
+                self.pos += 1
+                return spans
+
+            start = self.pos
+            end = self.skip_value()
+            spans.append((start, end))
+
+            self.skip_trivia()
+            if self.peek() == ",":
+                self.pos += 1
+            elif self.peek() != "]":
+                msg = "Expected ',' or ']'"
+                raise self.fail(msg)
+
+    def skip_value(self) -> int:
+        """Skip a value. Return its end offset."""
+        char = self.peek()
+        if char == '"':
+            self.skip_basic_string()
+        elif char == "'":
+            self.skip_literal_string()
+        elif char == "[":
+            self.read_array_items()
+        elif char == "{":
+            self.skip_inline_table()
+        else:
+            start = self.pos
+            while self.pos < self.length and self.text[self.pos] not in CHARS_I_BARE_VALUE_END:
+                self.pos += 1
+            end = self.pos
+            while end > start and self.text[end - 1] in CHARS_I_INLINE_WHITESPACE:
+                end -= 1
+            if start == end:
+                msg = "Expected a value"
+                raise self.fail(msg)
+            return end
+        return self.pos
+
+    def skip_inline_table(self) -> None:
+        self.expect("{")
+        while True:
+            self.skip_trivia()
+            if self.peek() == "}":
+                self.pos += 1
+                return
+
+            self.read_key()
+            self.expect("=")
+            self.skip_trivia(newlines=False)
+            self.skip_value()
+
+            self.skip_trivia()
+            if self.peek() == ",":
+                self.pos += 1
+
+    def skip_basic_string(self) -> None:
+        delimiter = '"""' if self.text.startswith('"""', self.pos) else '"'
+        self.pos += len(delimiter)
+        while True:
+            char = self.peek()
+            if char == "\\":
+                self.pos += 2
+            elif self.text.startswith(delimiter, self.pos):
+                self.pos += len(delimiter)
+                self.skip_extra_quotes(delimiter)
+                return
+            elif char in CHARS_I_NEWLINE and len(delimiter) == 1:
+                msg = "Unterminated string"
+                raise self.fail(msg)
+            else:
+                self.pos += 1
+
+    def skip_literal_string(self) -> None:
+        delimiter = "'''" if self.text.startswith("'''", self.pos) else "'"
+        end = self.text.find(delimiter, self.pos + len(delimiter))
+        if end == -1:
+            msg = "Unterminated string"
+            raise self.fail(msg)
+        self.pos = end + len(delimiter)
+        self.skip_extra_quotes(delimiter)
+
+    def skip_extra_quotes(self, delimiter: str) -> None:
+        # Multi-line strings can end with up to two extra quotes. Like `""""`.
+        if len(delimiter) == 1:
+            return
+        for _ in range(2):
+            if self.pos < self.length and self.text[self.pos] == delimiter[0]:
+                self.pos += 1
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from uv_upx.services.toml.locate_array_items import TextSpan
+
+
+def splice_text(
+    text: str,
+    replacements: Iterable[tuple[TextSpan, str]],
+) -> str:
+    """Replace parts of the text. Spans must not overlap."""
+    parts: list[str] = []
+    position = 0
+    for (start, end), replacement in sorted(replacements):
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+
+    if not parts:
+        return text
+
+    parts.append(text[position:])
+    return "".join(parts)
@@ -0,0 +1,63 @@
+import pytest
+
+from uv_upx.services.toml import TomlLocateError, locate_array_items, toml_item_as_string, toml_parse
+
+DOCUMENT = '''# Comment with "quotes" and [brackets]
+title = """
+dependencies = ["not", "an", "array"]
+"""
+
+[project]
+name = 'foo' # dependencies = ["fake"]
+dependencies = [
+    # Comment, with comma
+    "pydantic>=2.12.5",  # inline comment
+    'typer[all] >= 0.20; python_version >= "3.14"',
+    "escaped\\"quote",
+    { include-group = "dev" },
+]
+optional-dependencies.cli = ["rich>=13"]
+
+[[tool.some.entries]]
+items = ["skipped"]
+
+[ "dependency-groups" ]
+dev = [
+    "pytest>=9.0.2", """multi
+line""", ['nested'], 1.5 ,
+]
+'''
+
+
+def test_locate_array_items() -> None:
+    result = locate_array_items(DOCUMENT)
+    data = toml_parse(DOCUMENT)
+
+    assert set(result) == {
+        ("project", "dependencies"),
+        ("project", "optional-dependencies", "cli"),
+        ("dependency-groups", "dev"),
+    }
+
+    for key_path, spans in result.items():
+        array = data
+        for key in key_path:
+            array = array[key]  # pyright: ignore[reportUnknownVariableType]
+
+        assert [DOCUMENT[start:end] for start, end in spans] == [
+            toml_item_as_string(item)  # pyright: ignore[reportUnknownArgumentType]
+            for item in array  # pyright: ignore[reportUnknownVariableType]
+        ]
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        'dependencies = ["unterminated]\n',
+        "dependencies = [\n",
+        "= 1\n",
+    ],
+)
+def test_locate_array_items_i_invalid(document: str) -> None:
+    with pytest.raises(TomlLocateError):
+        locate_array_items(document)
@@ -0,0 +1,5 @@
+from .update_outcome_enum import UpdateOutcome
+
+__all__ = [
+    "UpdateOutcome",
+]
@@ -0,0 +1,19 @@
+import enum
+
+
+@enum.unique
+class UpdateOutcome(enum.StrEnum):
+    UPDATED = "updated"
+    """Changes were written. uv.lock was updated."""
+
+    NO_CHANGES = "no_changes"
+    """Nothing to change in pyproject.toml files. uv.lock was restored."""
+
+    DRY_RUN = "dry_run"
+    """Changes were only shown."""
+
+    DRY_RUN_FAILED = "dry_run_failed"
+    """Dry run failed. Like unresolvable upgrades. Nothing was written."""
+
+    ROLLED_BACK = "rolled_back"
+    """Something failed. Files were restored."""
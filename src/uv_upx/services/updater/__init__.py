@@ -1,5 +1,10 @@
+from uv_upx.services.updater.journal import UnfinishedRunError
+from uv_upx.services.updater.resume_or_abort import abort_updater, resume_updater
 from uv_upx.services.updater.run_updater import run_updater
 
 __all__ = [
+    "UnfinishedRunError",
+    "abort_updater",
+    "resume_updater",
     "run_updater",
 ]
@@ -1,34 +1,40 @@
 import logging
 from typing import TYPE_CHECKING
 
-from uv_upx.services.normalize_paths import get_and_check_path_to_uv_lock
+from uv_upx.services.fingerprints import is_sync_needed, save_sync_state
 from uv_upx.services.run_uv_related import UvSyncMode, run_uv_lock, run_uv_sync
-from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.timings import timed
+from uv_upx.services.updater.journal import snapshot_environment_before_sync
 
 if TYPE_CHECKING:
     import pathlib
 
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.file_snapshot import FileSnapshot
 
+
+@timed("finalize_updating")
 def finalize_updating(
     project_root_path: pathlib.Path,
     *,
-    dry_run: bool = False,
+    uv_lock_snapshot: FileSnapshot,
+    changes: ChangesList,
     #
     no_sync: bool = False,
     #
-    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
-    #
     interactive: bool = False,
 ) -> None:
     logger = logging.getLogger(__name__)
 
-    if dry_run:
-        logger.info("Dry run. No changes were made.")
-        return
-
-    if profile == UpgradeProfile.WITH_PINNED or interactive:
-        uv_lock_path = get_and_check_path_to_uv_lock(project_root_path)
-        uv_lock_path.unlink(missing_ok=True)
+    # Note: With the `with_pinned` profile, pins are put back to the versions from the current lock.
+    #   So, the current lock stays valid as a starting point. No need to resolve from scratch.
+    if interactive:
+        # Note: The current lock has all packages upgraded. But only accepted changes must be applied.
+        relock_with_accepted_changes(
+            project_root_path,
+            uv_lock_snapshot=uv_lock_snapshot,
+            changes=changes,
+        )
 
     if no_sync:
         run_uv_lock(
@@ -38,8 +44,40 @@ def finalize_updating(
         logger.info("Updated uv.lock successfully.")
     else:
         # Because we want to re-check that all is ok.
+        # Note: Same as plain "uv sync". But we can check the new uv.lock before syncing.
+        run_uv_lock(
+            workdir=project_root_path,
+        )
+        if not is_sync_needed(project_root_path):
+            logger.info("Updated uv.lock successfully. Environment is already in sync with it. Skip syncing.")
+            return
+
+        snapshot_environment_before_sync(project_root_path)
         run_uv_sync(
             workdir=project_root_path,
-            uv_sync_mode=UvSyncMode.DEFAULT,
+            uv_sync_mode=UvSyncMode.FROZEN,
         )
+        save_sync_state(project_root_path)
         logger.info("Synced dependencies successfully with updating uv.lock.")
+
+
+def relock_with_accepted_changes(
+    project_root_path: pathlib.Path,
+    *,
+    uv_lock_snapshot: FileSnapshot,
+    changes: ChangesList,
+) -> None:
+    """Lock again from the original uv.lock. Upgrade only packages with accepted changes.
+
+    So, other packages keep their locked versions. And it is an incremental resolution, not a cold one.
+    """
+    logger = logging.getLogger(__name__)
+
+    uv_lock_snapshot.restore()
+
+    upgrade_packages = sorted({change.to_item.package_name for change in changes})
+    logger.info(f"Re-locking from the original uv.lock. Upgrade only: {', '.join(upgrade_packages)}")
+    run_uv_lock(
+        workdir=project_root_path,
+        upgrade_packages=upgrade_packages,
+    )
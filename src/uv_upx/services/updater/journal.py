@@ -0,0 +1,160 @@
+import enum
+import logging
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.dependency_up import ChangesList
+from uv_upx.services.environment_snapshot import take_environment_snapshot
+from uv_upx.services.file_snapshot import FileSnapshot, write_bytes_atomically
+from uv_upx.services.fingerprints import compute_environment_fingerprint
+from uv_upx.services.normalize_paths import NAME_OF_APP_STATE_DIR, get_path_to_app_state_dir
+from uv_upx.services.termination import defer_interruptions
+from uv_upx.services.time_limits import apply_time_limits
+from uv_upx.services.updater.rollback_updater import RollbackData, rollback_updater
+
+if TYPE_CHECKING:
+    import pathlib
+
+NAME_OF_JOURNAL_FILE: Final[str] = "journal.json"
+
+
+class UnfinishedRunError(RuntimeError):
+    """A previous run was killed in the middle. Its journal is left."""
+
+
+@enum.unique
+class JournalPhase(enum.StrEnum):
+    STARTED = "started"
+    """Original files are recorded. uv.lock can be upgraded in the background. pyproject.toml files are not changed."""
+
+    APPLIED = "applied"
+    """Changes are written into pyproject.toml files. Locking and syncing are next."""
+
+    ROLLING_BACK = "rolling_back"
+
+
+class Journal(BaseModel):
+    """Write-ahead record of the run. Enough to finish or to revert it, if the process is killed.
+
+    Written before each step, which changes files. Removed, when the run is finished.
+    """
+
+    phase: JournalPhase
+
+    rollback_data: RollbackData
+
+    changes: ChangesList = []
+    """Computed changes. Known since the `applied` phase."""
+
+    no_sync: bool = False
+    interactive: bool = False
+
+    venv_snapshot: bool = False
+    """Snapshot the environment right before the first sync. Cleared, once it is taken."""
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
+
+    @property
+    def project_root_path(self) -> pathlib.Path:
+        return self.rollback_data.uv_lock.path.parent
+
+
+def get_path_to_journal(project_root_path: pathlib.Path) -> pathlib.Path:
+    # Note: Without creating the directory. So, checks and dry runs write nothing.
+    return project_root_path / NAME_OF_APP_STATE_DIR / NAME_OF_JOURNAL_FILE
+
+
+def read_journal(project_root_path: pathlib.Path) -> Journal | None:
+    try:
+        content = get_path_to_journal(project_root_path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+    return Journal.model_validate_json(content)
+
+
+def write_journal(journal: Journal) -> Journal:
+    path = get_path_to_app_state_dir(journal.project_root_path) / NAME_OF_JOURNAL_FILE
+    write_bytes_atomically(path, journal.model_dump_json().encode("utf-8"))
+    return journal
+
+
+def check_no_unfinished_run(project_root_path: pathlib.Path) -> None:
+    """Refuse to start over a killed run. Its files can be half-upgraded.
+
+    Raises:
+        UnfinishedRunError: if the journal of a killed run is left.
+    """
+    if get_path_to_journal(project_root_path).exists():
+        msg = (
+            f"A previous run in {project_root_path} was interrupted. "
+            "Finish it with 'uv-upx resume' or revert it with 'uv-upx abort'."
+        )
+        raise UnfinishedRunError(msg)
+
+
+def start_journal(
+    project_root_path: pathlib.Path,
+    *,
+    uv_lock_snapshot: FileSnapshot,
+) -> Journal:
+    """Record only uv.lock. Before it is upgraded in the background, while pyproject.toml files are parsed.
+
+    They are recorded after parsing. Before any changes.
+    """
+    return write_journal(
+        Journal(
+            phase=JournalPhase.STARTED,
+            rollback_data=RollbackData(
+                uv_lock=uv_lock_snapshot,
+                py_projects=[],
+                environment=compute_environment_fingerprint(project_root_path),
+            ),
+        ),
+    )
+
+
+def snapshot_environment_before_sync(project_root_path: pathlib.Path) -> None:
+    """Take the environment snapshot, if the journal asks for it. Then record it. So, rollback and abort find it.
+
+    Called right before each sync. Only the first call takes it.
+    So, runs without changes, or which fail before syncing, don't snapshot at all.
+    """
+    journal = read_journal(project_root_path)
+    if journal is None or not journal.venv_snapshot:
+        return
+
+    # Note: Cleared, even if it can't be taken. Then rollback syncs instead.
+    rollback_data = journal.rollback_data.model_copy(
+        update={"environment_snapshot": take_environment_snapshot(project_root_path)},
+    )
+    write_journal(journal.model_copy(update={"rollback_data": rollback_data, "venv_snapshot": False}))
+
+
+def finish_journal(journal: Journal) -> None:
+    """Remove the journal. And the environment snapshot, which is not needed anymore."""
+    if journal.rollback_data.environment_snapshot is not None:
+        journal.rollback_data.environment_snapshot.discard()
+
+    get_path_to_journal(journal.project_root_path).unlink(missing_ok=True)
+    logging.getLogger(__name__).debug("Removed the journal.")
+
+
+def roll_back_journal(journal: Journal) -> None:
+    """Revert the run by its journal. Then finish the journal. Not interrupted, even by a repeated Ctrl-C.
+
+    Time limits of the run are lifted. The rollback sync runs even after `--max-duration` is over.
+
+    If it fails, the journal is kept. So, the rollback can be retried.
+    """
+    with defer_interruptions(), apply_time_limits():
+        journal = write_journal(journal.model_copy(update={"phase": JournalPhase.ROLLING_BACK}))
+        rollback_updater(
+            rollback_data=journal.rollback_data,
+            #
+            no_sync=journal.no_sync,
+        )
+        finish_journal(journal)
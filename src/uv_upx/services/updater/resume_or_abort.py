@@ -0,0 +1,77 @@
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.timings import timed
+from uv_upx.services.update_outcome import UpdateOutcome
+from uv_upx.services.updater.finalize_updating import finalize_updating
+from uv_upx.services.updater.journal import JournalPhase, finish_journal, read_journal, roll_back_journal
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.updater.journal import Journal
+
+
+@timed("resume_updater")
+def resume_updater(project_root_path: pathlib.Path) -> UpdateOutcome:
+    """Finish the killed run by its journal. Without parsing and resolving from scratch.
+
+    If changes were applied to pyproject.toml files, lock and sync them. uv starts from the current uv.lock.
+    Otherwise, or if it fails, revert the run.
+
+    If it is interrupted, the journal is kept. So, it can be resumed or aborted again.
+
+    Raises:
+        FileNotFoundError: if there is no unfinished run.
+    """
+    logger = logging.getLogger(__name__)
+
+    journal = read_unfinished_journal(project_root_path)
+    if journal.phase is not JournalPhase.APPLIED:
+        logger.info(f"The run was interrupted in the '{journal.phase}' phase. Nothing to finish. Rolling back.")
+        roll_back_journal(journal)
+        return UpdateOutcome.ROLLED_BACK
+
+    logger.info(f"Resuming the run with {len(journal.changes)} changes.")
+    try:
+        finalize_updating(
+            project_root_path,
+            uv_lock_snapshot=journal.rollback_data.uv_lock,
+            changes=journal.changes,
+            #
+            no_sync=journal.no_sync,
+            #
+            interactive=journal.interactive,
+        )
+    except Exception as e:  # noqa: BLE001
+        msg = f"Failed to resume: '{type(e)}:{e}' Rolling back to previous state."
+        logger.error(msg)  # noqa: TRY400
+        # Note: Re-read. The environment snapshot can be recorded right before the sync.
+        roll_back_journal(read_unfinished_journal(project_root_path))
+        return UpdateOutcome.ROLLED_BACK
+
+    finish_journal(read_unfinished_journal(project_root_path))
+    logger.info("Finished the run.")
+    return UpdateOutcome.UPDATED
+
+
+@timed("abort_updater")
+def abort_updater(project_root_path: pathlib.Path) -> None:
+    """Revert the killed run by its journal. Restore files and the environment.
+
+    Raises:
+        FileNotFoundError: if there is no unfinished run.
+    """
+    logger = logging.getLogger(__name__)
+
+    journal = read_unfinished_journal(project_root_path)
+    logger.info(f"Rolling back the run, interrupted in the '{journal.phase}' phase.")
+    roll_back_journal(journal)
+
+
+def read_unfinished_journal(project_root_path: pathlib.Path) -> Journal:
+    journal = read_journal(project_root_path)
+    if journal is None:
+        msg = f"No interrupted run in {project_root_path}. Nothing to resume or abort."
+        raise FileNotFoundError(msg)
+    return journal
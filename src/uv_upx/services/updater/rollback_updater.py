@@ -1,48 +1,56 @@
-import copy
 import logging
-import pathlib
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict
-from tomlkit import TOMLDocument
+from pydantic import BaseModel
 
-from uv_upx.services.get_all_pyprojects import PyProjectsRegistry
+from uv_upx.services.environment_snapshot import EnvironmentSnapshot
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.fingerprints import (
+    Fingerprint,
+    compute_environment_fingerprint,
+    is_sync_needed,
+    save_sync_state,
+)
 from uv_upx.services.run_uv_related import UvSyncMode, run_uv_sync
-from uv_upx.services.toml import toml_save
+from uv_upx.services.timings import timed
 
+if TYPE_CHECKING:
+    import pathlib
 
-class UvLockWrapper(BaseModel):
-    path: pathlib.Path
-    data: TOMLDocument
-
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
 
 
 class RollbackData(BaseModel):
-    uv_lock: UvLockWrapper
+    uv_lock: FileSnapshot
+
+    py_projects: list[FileSnapshot]
 
-    py_projects: PyProjectsRegistry
+    environment: Fingerprint
+    """Fingerprint of the installed packages. Same after the run means the environment wasn't touched."""
+
+    environment_snapshot: EnvironmentSnapshot | None = None
+    """Hardlink copy of the environment. If enabled. Restored instead of syncing."""
 
     @classmethod
     def from_parts(
         cls,
         *,
-        uv_lock_path: pathlib.Path,
-        uv_lock_data: TOMLDocument,
+        uv_lock: FileSnapshot,
         #
-        py_projects: PyProjectsRegistry,
+        workspace_snapshot: WorkspaceSnapshot,
     ) -> RollbackData:
-        uv_lock_wrapper = UvLockWrapper(
-            path=uv_lock_path,
-            data=copy.deepcopy(uv_lock_data),
-        )
+        # Note: Snapshots are immutable. So, no need to copy them.
         return cls(
-            uv_lock=uv_lock_wrapper,
-            py_projects=copy.deepcopy(py_projects),
+            uv_lock=uv_lock,
+            py_projects=[py_project.snapshot for py_project in workspace_snapshot.py_projects.items],
+            environment=compute_environment_fingerprint(workspace_snapshot.project_root_path),
         )
 
+    def get_files(self) -> list[FileSnapshot]:
+        return [self.uv_lock, *self.py_projects]
+
 
+@timed("rollback_updater")
 def rollback_updater(
     *,
     rollback_data: RollbackData,
@@ -51,14 +59,64 @@ def rollback_updater(
 ) -> None:
     logger = logging.getLogger(__name__)
 
-    toml_save(rollback_data.uv_lock.path, rollback_data.uv_lock.data)
-    for py_project in rollback_data.py_projects.items:
-        toml_save(py_project.path, py_project.data)
+    # Rewrite only changed files. Untouched files keep their mtime.
+    restored_files = [file for file in rollback_data.get_files() if file.restore()]
+    logger.info(f"Restored {len(restored_files)} changed files.")
 
     if not no_sync:
-        run_uv_sync(
-            workdir=rollback_data.uv_lock.path.parent,
-            uv_sync_mode=UvSyncMode.FROZEN,
+        sync_after_rollback(
+            project_root_path=rollback_data.uv_lock.path.parent,
+            environment=rollback_data.environment,
+            #
+            environment_snapshot=rollback_data.environment_snapshot,
         )
 
     logger.info("Rollback completed.")
+
+
+def sync_after_rollback(
+    *,
+    project_root_path: pathlib.Path,
+    environment: Fingerprint,
+    #
+    environment_snapshot: EnvironmentSnapshot | None = None,
+) -> None:
+    """Sync the environment with the restored uv.lock. Skip it, if it would be a no-op.
+
+    If there is the environment snapshot, swap it back first. Then the sync is a no-op, usually.
+    """
+    logger = logging.getLogger(__name__)
+
+    if compute_environment_fingerprint(project_root_path) == environment:
+        # Dry run, no changes or a failure before syncing. Nothing to restore in the environment.
+        logger.info("Environment was not changed. Skip syncing.")
+        return
+
+    if environment_snapshot is not None and restore_environment_snapshot(environment_snapshot):
+        if compute_environment_fingerprint(project_root_path) == environment:
+            logger.info("Restored the environment from the snapshot. Skip syncing.")
+            return
+
+        logger.info("Restored the environment from the snapshot. Syncing to check it.")
+
+    if not is_sync_needed(project_root_path):
+        logger.info("Environment is already in sync with the restored uv.lock. Skip syncing.")
+        return
+
+    run_uv_sync(
+        workdir=project_root_path,
+        uv_sync_mode=UvSyncMode.FROZEN,
+    )
+    save_sync_state(project_root_path)
+
+
+@timed("restore_environment_snapshot")
+def restore_environment_snapshot(environment_snapshot: EnvironmentSnapshot) -> bool:
+    """Swap the snapshot back. If it fails (like a file in use on Windows), the caller syncs instead."""
+    logger = logging.getLogger(__name__)
+
+    try:
+        return environment_snapshot.restore()
+    except OSError as e:
+        logger.warning(f"Failed to restore the environment from the snapshot: {e}. Syncing instead.")
+        return False
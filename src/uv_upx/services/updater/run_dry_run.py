@@ -0,0 +1,121 @@
+import difflib
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.changes_report import is_reporting_changes
+from uv_upx.services.lock_diff import compute_lock_diff, render_lock_diff
+from uv_upx.services.lock_diff_format import LockDiffFormat
+from uv_upx.services.overlay import open_overlay
+from uv_upx.services.timings import timed
+from uv_upx.services.updater.finalize_updating import finalize_updating
+from uv_upx.services.updater.upgrade_workspace import upgrade_workspace
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.file_snapshot import FileSnapshot
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
+
+
+@timed("run_dry_run")
+def run_dry_run(  # noqa: PLR0913
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    verbose: bool = False,
+    #
+    preserve_original_package_names: bool = False,
+    #
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
+    #
+    interactive: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
+    #
+    lock_diff_format: LockDiffFormat = LockDiffFormat.HUMAN,
+) -> ChangesList:
+    """Run the upgrade in a scratch overlay. Print diffs of pyproject.toml files and changes of uv.lock.
+
+    The real tree and the environment are never touched.
+    """
+    logger = logging.getLogger(__name__)
+
+    with open_overlay(
+        workspace_snapshot=workspace_snapshot,
+        uv_lock_snapshot=uv_lock_snapshot,
+        #
+        preserve_original_package_names=preserve_original_package_names,
+    ) as overlay:
+        overlay_root_path = overlay.workspace_snapshot.project_root_path
+
+        changes = upgrade_workspace(
+            workspace_snapshot=overlay.workspace_snapshot,
+            uv_lock_snapshot=overlay.uv_lock_snapshot,
+            #
+            verbose=verbose,
+            #
+            profile=profile,
+            #
+            interactive=interactive,
+            #
+            package_filter=package_filter,
+        )
+        if not changes:
+            logger.info("Dry run. No important changes detected.")
+            return changes
+
+        # Note: Same as in a real run. So, the lock summary matches it.
+        finalize_updating(
+            overlay_root_path,
+            uv_lock_snapshot=overlay.uv_lock_snapshot,
+            changes=changes,
+            #
+            no_sync=True,
+            #
+            interactive=interactive,
+        )
+
+        if is_reporting_changes():
+            # Note: Don't mix diffs into the machine-readable output.
+            logger.info("Dry run. Diffs are not shown with the machine-readable output format.")
+            return changes
+
+        for py_project in workspace_snapshot.py_projects.items:
+            relative_path = py_project.path.relative_to(workspace_snapshot.project_root_path)
+            diff = render_unified_diff(
+                py_project.snapshot.get_text(),
+                (overlay_root_path / relative_path).read_text(encoding="utf-8"),
+                relative_path=relative_path,
+            )
+            if diff:
+                print(diff, end="")
+
+        lock_diff = compute_lock_diff(
+            uv_lock_snapshot.get_text(),
+            overlay.uv_lock_snapshot.path.read_text(encoding="utf-8"),
+        )
+        print(render_lock_diff(lock_diff, lock_diff_format=lock_diff_format))
+
+    logger.info("Dry run. No changes were made.")
+    return changes
+
+
+def render_unified_diff(
+    text_before: str,
+    text_after: str,
+    *,
+    relative_path: pathlib.Path,
+) -> str:
+    """Unified diff in the git style. Can be applied with `git apply`."""
+    return "".join(
+        difflib.unified_diff(
+            text_before.splitlines(keepends=True),
+            text_after.splitlines(keepends=True),
+            fromfile=f"a/{relative_path.as_posix()}",
+            tofile=f"b/{relative_path.as_posix()}",
+        ),
+    )
@@ -1,22 +1,43 @@
 import logging
 from typing import TYPE_CHECKING
 
-from uv_upx.services.dependencies_from_project import get_dependencies_from_project
-from uv_upx.services.dependency_up.handle_groups import handle_py_projects_v2
-from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.bisect_changes import run_bisect
+from uv_upx.services.changes_report import is_reporting_changes, report_lock_diff
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.lock_diff import compute_lock_diff, render_lock_diff
+from uv_upx.services.lock_diff_format import LockDiffFormat
 from uv_upx.services.normalize_paths import get_and_check_path_to_uv_lock
-from uv_upx.services.parse_v2.change_pinned_constraints import change_pinned_constraints
-from uv_upx.services.parse_v2.collect_dependencies import collect_top_level_dependencies
-from uv_upx.services.toml import toml_load
+from uv_upx.services.run_uv_related import UnresolvedDependencyError
+from uv_upx.services.termination import TerminatedError
+from uv_upx.services.timings import timed
+from uv_upx.services.update_outcome import UpdateOutcome
 from uv_upx.services.updater.finalize_updating import finalize_updating
-from uv_upx.services.updater.rollback_updater import RollbackData, rollback_updater
-from uv_upx.services.updater.update_lock_file import update_lock_file
+from uv_upx.services.updater.journal import (
+    Journal,
+    JournalPhase,
+    check_no_unfinished_run,
+    finish_journal,
+    read_journal,
+    roll_back_journal,
+    write_journal,
+)
+from uv_upx.services.updater.rollback_updater import RollbackData
+from uv_upx.services.updater.run_dry_run import run_dry_run
+from uv_upx.services.updater.start_lock_upgrade import start_lock_upgrade
+from uv_upx.services.updater.upgrade_workspace import upgrade_workspace
 from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
 
 if TYPE_CHECKING:
     import pathlib
 
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
 
+
+@timed("run_updater")
 def run_updater(  # noqa: PLR0913
     *,
     project_root_path: pathlib.Path,
@@ -27,98 +48,299 @@ def run_updater(  # noqa: PLR0913
     preserve_original_package_names: bool = False,
     #
     no_sync: bool = False,
+    venv_snapshot: bool = False,
     #
     interactive: bool = False,
     #
     profile: UpgradeProfile = UpgradeProfile.DEFAULT,
-) -> None:
-    """Orchestrates dependency updates with rollback on failure."""
-    logger = logging.getLogger(__name__)
+    #
+    jobs: int = 1,
+    executor_kind: ExecutorKind = ExecutorKind.THREAD,
+    #
+    use_discovery_cache: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
+    #
+    bisect: bool = False,
+    #
+    lock_diff_format: LockDiffFormat | None = None,
+) -> UpdateOutcome:
+    """Orchestrates dependency updates with rollback on failure.
 
-    uv_lock_path = get_and_check_path_to_uv_lock(project_root_path)
-    uv_lock_data = toml_load(uv_lock_path)
+    Dry run works in a scratch overlay. So, it doesn't need a rollback.
 
-    py_projects = get_all_pyprojects_by_project_root_path(project_root_path)
-    if verbose:
-        logger.info(f"Found {len(py_projects.items)} pyproject.toml files in the workspace.")
-        for py_project in py_projects.items:
-            logger.info(f"  {py_project.path.as_uri()}")
+    uv.lock is upgraded while pyproject.toml files are parsed. If pyproject.toml files are not changed before it.
 
-    rollback_data = RollbackData.from_parts(
-        uv_lock_path=uv_lock_path,
-        uv_lock_data=uv_lock_data,
-        #
-        py_projects=py_projects,
-    )
+    Interruptions, like Ctrl-C or SIGTERM, are rolled back too. Then raised again.
 
-    is_rollback_needed = dry_run
-    rollback_message = "Rolling back to previous state because dry run is enabled."
+    With `venv_snapshot`, the environment is snapshotted with hardlinks. Rollback swaps it back, instead of syncing.
 
-    collected_top_level_dependencies = collect_top_level_dependencies(
-        project_root_path=project_root_path,
-        #
-        preserve_original_package_names=preserve_original_package_names,
-    )
+    Each step is recorded in the journal before it changes files. If the process is killed,
+    the run can be finished or reverted with `resume_updater` or `abort_updater`.
 
-    if profile is UpgradeProfile.WITH_PINNED:
-        change_pinned_constraints(
-            collected_top_level_dependencies=collected_top_level_dependencies,
-        )
+    Raises:
+        UnfinishedRunError: if a previous run was killed. Until it is resumed or aborted.
+    """
+    logger = logging.getLogger(__name__)
 
-    try:
-        update_lock_file(
+    check_no_unfinished_run(project_root_path)
+    uv_lock_snapshot = FileSnapshot.from_path(get_and_check_path_to_uv_lock(project_root_path))
+
+    with start_lock_upgrade(
+        project_root_path,
+        uv_lock_snapshot=uv_lock_snapshot,
+        #
+        package_filter=package_filter,
+        #
+        # Note: Dry run works in an overlay. And `with_pinned` unpins constraints before the resolution.
+        enabled=not dry_run and profile is not UpgradeProfile.WITH_PINNED,
+    ) as lock_upgrade:
+        workspace_snapshot = build_workspace_snapshot(
             project_root_path,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            verbose=verbose,
+            #
+            jobs=jobs,
+            executor_kind=executor_kind,
+            #
+            use_discovery_cache=use_discovery_cache,
         )
 
-        dependencies_registry = get_dependencies_from_project(workdir=project_root_path)
+    if dry_run:
+        try:
+            run_dry_run(
+                workspace_snapshot=workspace_snapshot,
+                uv_lock_snapshot=uv_lock_snapshot,
+                #
+                verbose=verbose,
+                #
+                preserve_original_package_names=preserve_original_package_names,
+                #
+                profile=profile,
+                #
+                interactive=interactive,
+                #
+                package_filter=package_filter,
+                #
+                lock_diff_format=lock_diff_format or LockDiffFormat.get_default(),
+            )
+        except Exception as e:  # noqa: BLE001
+            # Note: Nothing to roll back. The overlay is removed on exit.
+            logger.error(f"Dry run failed: '{type(e)}:{e}' No changes were made.")  # noqa: TRY400
+            return UpdateOutcome.DRY_RUN_FAILED
+        return UpdateOutcome.DRY_RUN
+
+    outcome = UpdateOutcome.UPDATED
+    is_rollback_needed = False
+    rollback_message = ""
+    interruption: KeyboardInterrupt | TerminatedError | None = None
+    journal: Journal | None = None
 
-        if handle_py_projects_v2(
-            collected_top_level_dependencies=collected_top_level_dependencies,
-            dependencies_registry=dependencies_registry,
+    try:
+        # Note: Guarded too. uv.lock can be upgraded in the background already. Its journal is on disk.
+        journal = write_started_journal(
+            workspace_snapshot=workspace_snapshot,
+            uv_lock_snapshot=uv_lock_snapshot,
+            #
+            no_sync=no_sync,
+            venv_snapshot=venv_snapshot,
+            #
+            interactive=interactive,
+        )
+
+        changes = upgrade_workspace(
+            workspace_snapshot=workspace_snapshot,
+            uv_lock_snapshot=uv_lock_snapshot,
             #
             verbose=verbose,
             #
             profile=profile,
             #
             interactive=interactive,
-        ):
+            #
+            package_filter=package_filter,
+            #
+            lock_upgrade=lock_upgrade,
+        )
+
+        if changes:
             logger.info("Updated pyproject.toml files successfully.")
+            journal = write_journal(journal.model_copy(update={"phase": JournalPhase.APPLIED, "changes": changes}))
 
-            finalize_updating(
-                project_root_path,
-                dry_run=dry_run,
+            finalize_or_bisect(
+                rollback_data=journal.rollback_data,
+                changes=changes,
                 #
-                no_sync=no_sync,
+                preserve_original_package_names=preserve_original_package_names,
                 #
-                profile=profile,
+                no_sync=no_sync,
                 #
                 interactive=interactive,
+                #
+                bisect=bisect,
             )
 
+            show_lock_diff(rollback_data=journal.rollback_data, lock_diff_format=lock_diff_format)
+
         else:
             msg = "No important changes detected. Rolling back to previous state."
             logger.info(msg)
+            outcome = UpdateOutcome.NO_CHANGES
             is_rollback_needed = True
             rollback_message = msg
 
     except Exception as e:  # noqa: BLE001
         msg = f"Failed to update dependencies: '{type(e)}:{e}' Rolling back to previous state."
         logger.error(msg)  # noqa: TRY400
+        outcome = UpdateOutcome.ROLLED_BACK
         is_rollback_needed = True
         rollback_message = msg
 
-    if dry_run:
-        rollback_message = "Dry run enabled, rolling back to previous state."
+    except (KeyboardInterrupt, TerminatedError) as e:
+        msg = "Interrupted. Rolling back to previous state."
+        logger.error(msg)  # noqa: TRY400
+        outcome = UpdateOutcome.ROLLED_BACK
         is_rollback_needed = True
+        rollback_message = msg
+        interruption = e
+
+    if is_rollback_needed:
+        run_rollback(
+            project_root_path,
+            rollback_message=rollback_message,
+        )
+    # Note: Re-read. The environment snapshot is recorded lazily, right before the first sync.
+    elif (journal := read_journal(project_root_path)) is not None:
+        finish_journal(journal)
+
+    if interruption is not None:
+        raise interruption
+
+    return outcome
+
+
+def write_started_journal(
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    no_sync: bool,
+    venv_snapshot: bool,
+    #
+    interactive: bool,
+) -> Journal:
+    """Record all files before any changes. In place of the journal of the background uv.lock upgrade."""
+    rollback_data = RollbackData.from_parts(
+        uv_lock=uv_lock_snapshot,
+        #
+        workspace_snapshot=workspace_snapshot,
+    )
+    return write_journal(
+        Journal(
+            phase=JournalPhase.STARTED,
+            rollback_data=rollback_data,
+            #
+            no_sync=no_sync,
+            interactive=interactive,
+            #
+            # Note: Taken lazily. Right before the first sync.
+            venv_snapshot=venv_snapshot and not no_sync,
+        ),
+    )
+
+
+def show_lock_diff(
+    *,
+    rollback_data: RollbackData,
+    lock_diff_format: LockDiffFormat | None,
+) -> None:
+    if lock_diff_format is None:
+        return
+
+    # Note: Rollback data holds uv.lock from before the run.
+    lock_diff = compute_lock_diff(
+        rollback_data.uv_lock.get_text(),
+        rollback_data.uv_lock.path.read_text(encoding="utf-8"),
+    )
+    if is_reporting_changes():
+        # Note: Don't mix the report into the machine-readable output. It is a record there.
+        report_lock_diff(lock_diff)
+        return
+
+    print(render_lock_diff(lock_diff, lock_diff_format=lock_diff_format))
+
+
+def run_rollback(
+    project_root_path: pathlib.Path,
+    *,
+    rollback_message: str,
+) -> None:
+    """Roll back by the journal on disk. Then finish the journal.
+
+    It is the last recorded step. Even if the run failed before its own journal was written.
+    Like the journal of the background uv.lock upgrade.
+
+    A failure is logged, not raised. The journal is kept. So, the rollback can be retried with `abort_updater`.
+    """
+    logger = logging.getLogger(__name__)
 
     try:
-        if is_rollback_needed:
-            rollback_updater(
-                rollback_data=rollback_data,
-                #
-                no_sync=no_sync,
-            )
-            logger.info(rollback_message)
+        journal = read_journal(project_root_path)
+        if journal is not None:
+            roll_back_journal(journal)
+        logger.info(rollback_message)
     except Exception as e:  # noqa: BLE001
-        msg = f"Failed to rollback: '{e}'"
+        msg = f"Failed to rollback: '{e}'. Retry with 'uv-upx abort'."
         logger.error(msg)  # noqa: TRY400
+
+
+def finalize_or_bisect(  # noqa: PLR0913
+    *,
+    rollback_data: RollbackData,
+    changes: ChangesList,
+    #
+    preserve_original_package_names: bool = False,
+    #
+    no_sync: bool = False,
+    #
+    interactive: bool = False,
+    #
+    bisect: bool = False,
+) -> None:
+    """Lock and sync the changes. If it fails, find the working part of them with bisecting, if enabled.
+
+    Raises:
+        UnresolvedDependencyError: if the changes (or all their parts, with bisecting) fail to lock or sync.
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        finalize_updating(
+            rollback_data.uv_lock.path.parent,
+            uv_lock_snapshot=rollback_data.uv_lock,
+            changes=changes,
+            #
+            no_sync=no_sync,
+            #
+            interactive=interactive,
+        )
+    except UnresolvedDependencyError:
+        if not bisect:
+            raise
+
+        logger.warning("Upgraded dependencies failed to lock or sync. Bisecting to keep compatible changes.")
+        bisect_result = run_bisect(
+            rollback_data=rollback_data,
+            changes=changes,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            no_sync=no_sync,
+        )
+        if not bisect_result.accepted:
+            msg = "No compatible changes found by bisecting."
+            raise UnresolvedDependencyError(msg) from None
+
+        logger.info(f"Applied {len(bisect_result.accepted)} of {len(changes)} changes.")
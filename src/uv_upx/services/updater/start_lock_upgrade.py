@@ -0,0 +1,99 @@
+import contextlib
+import contextvars
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.services.run_uv_related import terminate_running_uv_commands
+from uv_upx.services.termination import defer_interruptions
+from uv_upx.services.timings import timed
+from uv_upx.services.updater.journal import finish_journal, start_journal
+from uv_upx.services.updater.update_lock_file import update_lock_file
+from uv_upx.services.updater.upgrade_workspace import select_upgrade_packages
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+    from uv_upx.services.file_snapshot import FileSnapshot
+    from uv_upx.services.package_filter import PackageFilter
+
+SECONDS_I_STOP_POLL: Final[float] = 0.1
+"""How often to stop uv again while waiting for it. It can be started right after the previous attempt."""
+
+
+@contextlib.contextmanager
+def start_lock_upgrade(
+    project_root_path: pathlib.Path,
+    *,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    package_filter: PackageFilter | None = None,
+    #
+    enabled: bool = True,
+) -> Iterator[Future[None] | None]:
+    """Start upgrading uv.lock in a background thread. Yield its future. Or None, if disabled.
+
+    uv resolves (mostly waiting for the network) while pyproject.toml files are parsed.
+    It reads only pyproject.toml files, which are not changed before the resolution.
+    So, it doesn't depend on the parsing.
+
+    On exit, wait for uv. If the block failed (or was interrupted), uv is stopped and uv.lock is restored.
+    Because nobody would roll it back.
+
+    uv.lock is recorded in the journal before it is changed. So, a killed run can be aborted.
+    """
+    if not enabled:
+        yield None
+        return
+
+    logger = logging.getLogger(__name__)
+
+    upgrade_packages = select_upgrade_packages(
+        uv_lock_snapshot=uv_lock_snapshot,
+        #
+        package_filter=package_filter,
+    )
+
+    journal = start_journal(project_root_path, uv_lock_snapshot=uv_lock_snapshot)
+
+    # Note: Copy the context. So, timings of uv are recorded.
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="uv-lock") as executor:
+        future = executor.submit(
+            context.run,
+            update_lock_file,
+            project_root_path,
+            upgrade_packages=upgrade_packages,
+        )
+        try:
+            yield future
+
+            with timed("wait_for_lock_upgrade"):
+                # Note: Don't raise here. The caller gets the error from the future.
+                future.exception()
+        except BaseException:
+            # Note: Also on an interruption while waiting. uv is in its own session, Ctrl-C doesn't reach it.
+            with defer_interruptions():
+                if stop_lock_upgrade(future) and uv_lock_snapshot.restore():
+                    logger.info("Restored uv.lock, upgraded in the background.")
+                finish_journal(journal)
+            raise
+
+
+def stop_lock_upgrade(future: Future[None]) -> bool:
+    """The result is not needed anymore. Stop uv and wait for it.
+
+    Returns:
+        True if uv could have changed uv.lock. False if it was not started.
+    """
+    if future.cancel():
+        return False
+
+    while True:
+        terminate_running_uv_commands()
+        try:
+            future.exception(timeout=SECONDS_I_STOP_POLL)
+        except TimeoutError:
+            continue
+        return True
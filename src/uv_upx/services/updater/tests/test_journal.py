@@ -0,0 +1,211 @@
+import subprocess
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+import uv_upx.services.updater.resume_or_abort as resume_or_abort_module
+import uv_upx.services.updater.rollback_updater as rollback_updater_module
+from uv_upx.services.dependency_up.models.changes_list import ChangesItem, DependencyLocation
+from uv_upx.services.dependency_up.parse_dependency import parse_dependency
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.fingerprints import compute_environment_fingerprint
+from uv_upx.services.normalize_paths import NAME_OF_APP_STATE_DIR
+from uv_upx.services.time_limits import UvCommandKind, apply_time_limits, get_uv_command_timeout
+from uv_upx.services.update_outcome import UpdateOutcome
+from uv_upx.services.updater import UnfinishedRunError, abort_updater, resume_updater, run_updater
+from uv_upx.services.updater.journal import (
+    Journal,
+    JournalPhase,
+    check_no_unfinished_run,
+    get_path_to_journal,
+    read_journal,
+    roll_back_journal,
+    snapshot_environment_before_sync,
+    write_journal,
+)
+from uv_upx.services.updater.rollback_updater import RollbackData
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.dependency_up import ChangesList
+
+PYPROJECT_I_OLD: Final[bytes] = b'[project]\r\nname = "foo"\r\ndependencies = ["bla>=1.0"]\r\n'
+PYPROJECT_I_NEW: Final[bytes] = b'[project]\r\nname = "foo"\r\ndependencies = ["bla>=2.0"]\r\n'
+UV_LOCK_I_OLD: Final[bytes] = b'version = 1\n\n[[package]]\nname = "bla"\nversion = "1.0"\n'
+UV_LOCK_I_NEW: Final[bytes] = b'version = 1\n\n[[package]]\nname = "bla"\nversion = "2.0"\n'
+
+
+class FakeFinalizeUpdating:
+    def __init__(self, *, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls: list[ChangesList] = []
+
+    def __call__(
+        self,
+        project_root_path: pathlib.Path,
+        *,
+        changes: ChangesList,
+        **_kwargs: object,
+    ) -> None:
+        self.calls.append(changes)
+        if self.error is not None:
+            raise self.error
+        (project_root_path / "uv.lock").write_bytes(UV_LOCK_I_NEW)
+
+
+def start_run(
+    project_root_path: pathlib.Path,
+    *,
+    phase: JournalPhase,
+) -> Journal:
+    """Like a run, killed in the phase. Files are changed after the journal is written."""
+    (project_root_path / "pyproject.toml").write_bytes(PYPROJECT_I_OLD)
+    (project_root_path / "uv.lock").write_bytes(UV_LOCK_I_OLD)
+
+    changes = [
+        ChangesItem(
+            from_item=parse_dependency("bla>=1.0"),
+            to_item=parse_dependency("bla>=2.0"),
+            location=DependencyLocation(path=project_root_path / "pyproject.toml", section="project.dependencies"),
+        ),
+    ]
+    journal = write_journal(
+        Journal(
+            phase=phase,
+            rollback_data=RollbackData(
+                uv_lock=FileSnapshot.from_path(project_root_path / "uv.lock"),
+                py_projects=[FileSnapshot.from_path(project_root_path / "pyproject.toml")],
+                environment="missing",
+            ),
+            changes=changes if phase is JournalPhase.APPLIED else [],
+            #
+            no_sync=True,
+        ),
+    )
+
+    (project_root_path / "uv.lock").write_bytes(UV_LOCK_I_NEW)
+    if phase is JournalPhase.APPLIED:
+        (project_root_path / "pyproject.toml").write_bytes(PYPROJECT_I_NEW)
+
+    return journal
+
+
+def test_journal_round_trip(tmp_path: pathlib.Path) -> None:
+    journal = start_run(tmp_path, phase=JournalPhase.APPLIED)
+
+    assert read_journal(tmp_path) == journal
+
+
+def test_journal_is_not_read_without_a_run(tmp_path: pathlib.Path) -> None:
+    assert read_journal(tmp_path) is None
+    check_no_unfinished_run(tmp_path)
+
+    # Note: Checks write nothing. Like for dry runs.
+    assert not (tmp_path / NAME_OF_APP_STATE_DIR).exists()
+
+
+def test_run_updater_refuses_to_start_over_a_killed_run(tmp_path: pathlib.Path) -> None:
+    start_run(tmp_path, phase=JournalPhase.STARTED)
+
+    with pytest.raises(UnfinishedRunError, match="uv-upx resume"):
+        run_updater(project_root_path=tmp_path, dry_run=True)
+
+
+def test_abort_updater(tmp_path: pathlib.Path) -> None:
+    start_run(tmp_path, phase=JournalPhase.APPLIED)
+
+    abort_updater(tmp_path)
+
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT_I_OLD
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK_I_OLD
+    assert not get_path_to_journal(tmp_path).exists()
+
+
+def test_snapshot_environment_before_sync(tmp_path: pathlib.Path) -> None:
+    journal = start_run(tmp_path, phase=JournalPhase.APPLIED)
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "pyvenv.cfg").write_bytes(b"old")
+    rollback_data = journal.rollback_data.model_copy(update={"environment": compute_environment_fingerprint(tmp_path)})
+    write_journal(journal.model_copy(update={"rollback_data": rollback_data, "no_sync": False, "venv_snapshot": True}))
+
+    snapshot_environment_before_sync(tmp_path)
+    # Note: Like a sync. uv replaces files, instead of rewriting them.
+    (tmp_path / ".venv" / "pyvenv.cfg").unlink()
+    (tmp_path / ".venv" / "pyvenv.cfg").write_bytes(b"newer")
+    # Note: Like the next sync of bisecting. The snapshot is taken only once.
+    snapshot_environment_before_sync(tmp_path)
+
+    journal = read_journal(tmp_path)
+    assert journal is not None
+    assert not journal.venv_snapshot
+    assert journal.rollback_data.environment_snapshot is not None
+
+    abort_updater(tmp_path)
+
+    assert (tmp_path / ".venv" / "pyvenv.cfg").read_bytes() == b"old"
+    assert not journal.rollback_data.environment_snapshot.snapshot_path.exists()
+
+
+def test_abort_updater_without_a_run(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(FileNotFoundError, match="No interrupted run"):
+        abort_updater(tmp_path)
+
+
+def test_resume_updater_finishes_applied_changes(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    journal = start_run(tmp_path, phase=JournalPhase.APPLIED)
+    fake_finalize_updating = FakeFinalizeUpdating()
+    monkeypatch.setattr(resume_or_abort_module, "finalize_updating", fake_finalize_updating)
+
+    assert resume_updater(tmp_path) is UpdateOutcome.UPDATED
+
+    # Note: No parsing and no resolution from scratch. Changes come from the journal.
+    assert fake_finalize_updating.calls == [journal.changes]
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT_I_NEW
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK_I_NEW
+    assert not get_path_to_journal(tmp_path).exists()
+
+
+def test_resume_updater_rolls_back_on_failure(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    start_run(tmp_path, phase=JournalPhase.APPLIED)
+    error = subprocess.CalledProcessError(1, ["uv", "lock"])
+    monkeypatch.setattr(resume_or_abort_module, "finalize_updating", FakeFinalizeUpdating(error=error))
+
+    assert resume_updater(tmp_path) is UpdateOutcome.ROLLED_BACK
+
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT_I_OLD
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK_I_OLD
+    assert not get_path_to_journal(tmp_path).exists()
+
+
+def test_resume_updater_rolls_back_unapplied_run(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    start_run(tmp_path, phase=JournalPhase.STARTED)
+    fake_finalize_updating = FakeFinalizeUpdating()
+    monkeypatch.setattr(resume_or_abort_module, "finalize_updating", fake_finalize_updating)
+
+    assert resume_updater(tmp_path) is UpdateOutcome.ROLLED_BACK
+
+    assert not fake_finalize_updating.calls
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK_I_OLD
+    assert not get_path_to_journal(tmp_path).exists()
+
+
+def test_roll_back_journal_after_the_deadline(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    journal = write_journal(start_run(tmp_path, phase=JournalPhase.APPLIED).model_copy(update={"no_sync": False}))
+    timeouts: list[float | None] = []
+
+    def fake_sync_after_rollback(**_kwargs: object) -> None:
+        timeouts.append(get_uv_command_timeout(UvCommandKind.SYNC))
+
+    monkeypatch.setattr(rollback_updater_module, "sync_after_rollback", fake_sync_after_rollback)
+
+    with apply_time_limits(sync_timeout_seconds=1.0, max_duration_seconds=0.0):
+        roll_back_journal(journal)
+
+        # Note: Limits of the run are back after the rollback.
+        assert get_uv_command_timeout(UvCommandKind.SYNC) <= 0  # pyright: ignore[reportOptionalOperand]
+
+    # Note: Without limits. Otherwise, the rollback sync fails with "No time left".
+    assert timeouts == [None]
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT_I_OLD
+    assert not get_path_to_journal(tmp_path).exists()
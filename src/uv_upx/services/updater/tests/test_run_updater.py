@@ -0,0 +1,104 @@
+import importlib
+from typing import TYPE_CHECKING, Final
+
+from uv_upx.services.normalize_paths import NAME_OF_APP_STATE_DIR
+from uv_upx.services.run_uv_related import UnresolvedDependencyError
+from uv_upx.services.update_outcome import UpdateOutcome
+from uv_upx.services.updater import journal as journal_module
+from uv_upx.services.updater import run_updater
+from uv_upx.services.updater import start_lock_upgrade as start_lock_upgrade_module
+from uv_upx.services.updater.journal import read_journal
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+    from uv_upx.services.dependency_up import ChangesList
+
+# Note: The package re-exports the function with the same name. So, take the module explicitly.
+run_updater_module = importlib.import_module("uv_upx.services.updater.run_updater")
+
+PYPROJECT: Final[bytes] = b'[project]\nname = "foo"\ndependencies = ["bla>=1.0"]\n'
+UV_LOCK: Final[bytes] = b'version = 1\n\n[[package]]\nname = "bla"\nversion = "2.0"\n'
+UV_LOCK_I_UPGRADED: Final[bytes] = b'version = 1\n\n[[package]]\nname = "bla"\nversion = "3.0"\n'
+
+
+def fail_to_resolve(**_kwargs: object) -> None:
+    msg = "No solution found when resolving dependencies."
+    raise UnresolvedDependencyError(msg)
+
+
+def upgrade_uv_lock(project_root_path: pathlib.Path, **_kwargs: object) -> None:
+    (project_root_path / "uv.lock").write_bytes(UV_LOCK_I_UPGRADED)
+
+
+def keep_uv_lock(*_args: object, **_kwargs: object) -> None:
+    pass
+
+
+def find_no_changes(**_kwargs: object) -> ChangesList:
+    return []
+
+
+def fail_to_snapshot(*_args: object) -> None:
+    msg = "The environment is snapshotted only before a sync."
+    raise AssertionError(msg)
+
+
+def fail_to_write_journal(**_kwargs: object) -> None:
+    msg = "No space left on device."
+    raise OSError(msg)
+
+
+def test_run_updater_i_rolls_back_background_lock_upgrade_on_setup_failure(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "pyproject.toml").write_bytes(PYPROJECT)
+    (tmp_path / "uv.lock").write_bytes(UV_LOCK)
+    monkeypatch.setattr(start_lock_upgrade_module, "update_lock_file", upgrade_uv_lock)
+    monkeypatch.setattr(run_updater_module, "write_started_journal", fail_to_write_journal)
+
+    outcome = run_updater(project_root_path=tmp_path)
+
+    assert outcome is UpdateOutcome.ROLLED_BACK
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK
+    assert read_journal(tmp_path) is None
+
+
+def test_run_updater_i_no_changes_without_environment_snapshot(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "pyproject.toml").write_bytes(PYPROJECT)
+    (tmp_path / "uv.lock").write_bytes(UV_LOCK)
+    (tmp_path / ".venv").mkdir()
+    monkeypatch.setattr(start_lock_upgrade_module, "update_lock_file", keep_uv_lock)
+    monkeypatch.setattr(run_updater_module, "upgrade_workspace", find_no_changes)
+    monkeypatch.setattr(journal_module, "take_environment_snapshot", fail_to_snapshot)
+
+    outcome = run_updater(project_root_path=tmp_path, venv_snapshot=True)
+
+    assert outcome is UpdateOutcome.NO_CHANGES
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK
+    assert read_journal(tmp_path) is None
+
+
+def test_run_updater_i_dry_run_failure_is_an_outcome(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    (tmp_path / "pyproject.toml").write_bytes(PYPROJECT)
+    (tmp_path / "uv.lock").write_bytes(UV_LOCK)
+    monkeypatch.setattr(run_updater_module, "run_dry_run", fail_to_resolve)
+
+    outcome = run_updater(project_root_path=tmp_path, dry_run=True)
+
+    assert outcome is UpdateOutcome.DRY_RUN_FAILED
+    assert "Dry run failed" in caplog.text
+    assert (tmp_path / "pyproject.toml").read_bytes() == PYPROJECT
+    assert (tmp_path / "uv.lock").read_bytes() == UV_LOCK
+    assert not (tmp_path / NAME_OF_APP_STATE_DIR).exists()
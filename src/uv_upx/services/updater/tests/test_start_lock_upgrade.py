@@ -0,0 +1,164 @@
+import os
+import signal
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+import uv_upx.services.updater.start_lock_upgrade as start_lock_upgrade_module
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.timings import record_timings, timed
+from uv_upx.services.updater.journal import read_journal
+from uv_upx.services.updater.start_lock_upgrade import start_lock_upgrade
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from uv_upx.services.package_name import PackageName
+
+UV_LOCK_I_OLD: Final[str] = 'version = 1\n\n[[package]]\nname = "bla"\nversion = "1.0.0"\n'
+UV_LOCK_I_NEW: Final[str] = 'version = 1\n\n[[package]]\nname = "bla"\nversion = "2.0.0"\n'
+
+SECONDS_I_TIMEOUT: Final[float] = 10.0
+SECONDS_I_INTERRUPTION_DELAY: Final[float] = 0.2
+
+
+class FakeUvLock:
+    """Writes the new uv.lock. Only after parsing has started, to prove both run at the same time."""
+
+    def __init__(self) -> None:
+        self.parsing_started = threading.Event()
+
+    def __call__(
+        self,
+        project_root_path: pathlib.Path,
+        *,
+        upgrade_packages: list[PackageName] | None = None,  # noqa: ARG002
+    ) -> None:
+        with timed("update_lock_file"):
+            if not self.parsing_started.wait(SECONDS_I_TIMEOUT):
+                msg = "Parsing didn't start while uv was resolving."
+                raise AssertionError(msg)
+            (project_root_path / "uv.lock").write_text(UV_LOCK_I_NEW, encoding="utf-8")
+
+
+class FakeSlowUvLock:
+    """Writes the new uv.lock, then resolves for long. Until it is stopped."""
+
+    def __init__(self) -> None:
+        self.stopped = threading.Event()
+
+    def __call__(
+        self,
+        project_root_path: pathlib.Path,
+        *,
+        upgrade_packages: list[PackageName] | None = None,  # noqa: ARG002
+    ) -> None:
+        (project_root_path / "uv.lock").write_text(UV_LOCK_I_NEW, encoding="utf-8")
+        self.stopped.wait(SECONDS_I_TIMEOUT)
+
+    def terminate(self) -> None:
+        self.stopped.set()
+
+
+@pytest.fixture
+def fake_uv_lock(monkeypatch: pytest.MonkeyPatch) -> FakeUvLock:
+    fake = FakeUvLock()
+    monkeypatch.setattr(start_lock_upgrade_module, "update_lock_file", fake)
+    return fake
+
+
+@pytest.fixture
+def uv_lock_snapshot(tmp_path: pathlib.Path) -> FileSnapshot:
+    path = tmp_path / "uv.lock"
+    path.write_text(UV_LOCK_I_OLD, encoding="utf-8")
+    return FileSnapshot.from_path(path)
+
+
+def test_start_lock_upgrade_overlaps_with_parsing(
+    tmp_path: pathlib.Path,
+    fake_uv_lock: FakeUvLock,
+    uv_lock_snapshot: FileSnapshot,
+) -> None:
+    with (
+        record_timings() as recorder,
+        timed("run_updater"),
+        start_lock_upgrade(tmp_path, uv_lock_snapshot=uv_lock_snapshot) as lock_upgrade,
+    ):
+        assert lock_upgrade is not None
+        with timed("build_workspace_snapshot"):
+            fake_uv_lock.parsing_started.set()
+
+    assert lock_upgrade.result() is None
+    assert uv_lock_snapshot.path.read_text(encoding="utf-8") == UV_LOCK_I_NEW
+    # Note: The run goes on. Its journal is finished by the caller.
+    journal = read_journal(tmp_path)
+    assert journal is not None
+    assert journal.rollback_data.uv_lock == uv_lock_snapshot
+
+    assert recorder is not None
+    assert sorted(phase.path for phase in recorder.report.phases) == [
+        ("run_updater",),
+        ("run_updater", "build_workspace_snapshot"),
+        ("run_updater", "update_lock_file"),
+        ("run_updater", "wait_for_lock_upgrade"),
+    ]
+
+
+def test_start_lock_upgrade_restores_uv_lock_on_failure(
+    tmp_path: pathlib.Path,
+    fake_uv_lock: FakeUvLock,
+    uv_lock_snapshot: FileSnapshot,
+) -> None:
+    def parse_broken_workspace() -> None:
+        with start_lock_upgrade(tmp_path, uv_lock_snapshot=uv_lock_snapshot):
+            fake_uv_lock.parsing_started.set()
+            msg = "Broken pyproject"
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="Broken pyproject"):
+        parse_broken_workspace()
+
+    assert uv_lock_snapshot.path.read_text(encoding="utf-8") == UV_LOCK_I_OLD
+    # Note: Nothing is left to abort.
+    assert read_journal(tmp_path) is None
+
+
+def test_start_lock_upgrade_disabled(
+    tmp_path: pathlib.Path,
+    fake_uv_lock: FakeUvLock,
+    uv_lock_snapshot: FileSnapshot,
+) -> None:
+    with start_lock_upgrade(tmp_path, uv_lock_snapshot=uv_lock_snapshot, enabled=False) as lock_upgrade:
+        assert lock_upgrade is None
+
+    assert not fake_uv_lock.parsing_started.is_set()
+    assert uv_lock_snapshot.path.read_text(encoding="utf-8") == UV_LOCK_I_OLD
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGINT can't be sent to itself")
+def test_start_lock_upgrade_stops_uv_on_interruption_while_waiting(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    uv_lock_snapshot: FileSnapshot,
+) -> None:
+    fake = FakeSlowUvLock()
+    monkeypatch.setattr(start_lock_upgrade_module, "update_lock_file", fake)
+    monkeypatch.setattr(start_lock_upgrade_module, "terminate_running_uv_commands", fake.terminate)
+
+    # Note: Like Ctrl-C. After parsing, while waiting for uv.
+    timer = threading.Timer(SECONDS_I_INTERRUPTION_DELAY, os.kill, args=(os.getpid(), signal.SIGINT))
+    started_at = time.monotonic()
+    timer.start()
+    try:
+        with pytest.raises(KeyboardInterrupt), start_lock_upgrade(tmp_path, uv_lock_snapshot=uv_lock_snapshot):
+            pass
+    finally:
+        timer.cancel()
+
+    assert time.monotonic() - started_at < SECONDS_I_TIMEOUT / 2
+    assert fake.stopped.is_set()
+    assert uv_lock_snapshot.path.read_text(encoding="utf-8") == UV_LOCK_I_OLD
+    assert read_journal(tmp_path) is None
@@ -1,16 +1,24 @@
 from typing import TYPE_CHECKING
 
 from uv_upx.services.run_uv_related import run_uv_lock
+from uv_upx.services.timings import timed
 
 if TYPE_CHECKING:
     import pathlib
 
+    from uv_upx.services.package_name import PackageName
 
+
+@timed("update_lock_file")
 def update_lock_file(
     project_root_path: pathlib.Path,
+    *,
+    upgrade_packages: list[PackageName] | None = None,
 ) -> None:
+    """Upgrade uv.lock. All packages, or only `upgrade_packages`, if set."""
     # Because we want a fast update. Without triggering build for now.
     run_uv_lock(
         workdir=project_root_path,
-        upgrade=True,
+        upgrade=upgrade_packages is None,
+        upgrade_packages=upgrade_packages,
     )
@@ -0,0 +1,140 @@
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.dependencies_from_project import get_dependencies_from_project
+from uv_upx.services.dependencies_from_project.parse_from_uv_lock_file import parse_from_uv_lock_file
+from uv_upx.services.dependency_up.handle_groups import handle_py_projects_v2
+from uv_upx.services.parse_v2.change_pinned_constraints import change_pinned_constraints
+from uv_upx.services.timings import set_timings_count, timed
+from uv_upx.services.updater.update_lock_file import update_lock_file
+from uv_upx.services.upgrade_profile import UpgradeProfile
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from uv_upx.services.dependencies_from_project import DependenciesRegistry
+    from uv_upx.services.dependency_up import ChangesList
+    from uv_upx.services.file_snapshot import FileSnapshot
+    from uv_upx.services.package_filter import PackageFilter
+    from uv_upx.services.package_name import PackageName
+    from uv_upx.services.workspace_snapshot import WorkspaceSnapshot
+
+
+def upgrade_workspace(  # noqa: PLR0913
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    verbose: bool = False,
+    #
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
+    #
+    interactive: bool = False,
+    #
+    package_filter: PackageFilter | None = None,
+    #
+    lock_upgrade: Future[None] | None = None,
+) -> ChangesList:
+    """Upgrade uv.lock and write the new versions into pyproject.toml files of the workspace.
+
+    Works in the directory of the snapshot. It can be the real project or an overlay.
+
+    If `lock_upgrade` is set, uv.lock is already being upgraded in the background. See `start_lock_upgrade`.
+    """
+    dependencies_registry = upgrade_uv_lock(
+        workspace_snapshot=workspace_snapshot,
+        uv_lock_snapshot=uv_lock_snapshot,
+        #
+        profile=profile,
+        #
+        package_filter=package_filter,
+        #
+        lock_upgrade=lock_upgrade,
+    )
+
+    with timed("handle_py_projects_v2"):
+        changes = handle_py_projects_v2(
+            workspace_snapshot=workspace_snapshot,
+            dependencies_registry=dependencies_registry,
+            #
+            verbose=verbose,
+            #
+            profile=profile,
+            #
+            interactive=interactive,
+            #
+            package_filter=package_filter,
+        )
+    set_timings_count("changes", len(changes))
+
+    return changes
+
+
+def upgrade_uv_lock(
+    *,
+    workspace_snapshot: WorkspaceSnapshot,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    profile: UpgradeProfile = UpgradeProfile.DEFAULT,
+    #
+    package_filter: PackageFilter | None = None,
+    #
+    lock_upgrade: Future[None] | None = None,
+) -> DependenciesRegistry:
+    """Upgrade uv.lock in the directory of the snapshot. Return the new versions from it.
+
+    pyproject.toml files are changed only for the `with_pinned` profile. To unpin constraints before the resolution.
+
+    If `lock_upgrade` is set, uv.lock is already being upgraded in the background. Only its result is waited for.
+    """
+    project_root_path = workspace_snapshot.project_root_path
+
+    if lock_upgrade is not None:
+        lock_upgrade.result()
+    else:
+        upgrade_packages = select_upgrade_packages(
+            uv_lock_snapshot=uv_lock_snapshot,
+            #
+            package_filter=package_filter,
+        )
+
+        if profile is UpgradeProfile.WITH_PINNED:
+            with timed("change_pinned_constraints"):
+                change_pinned_constraints(
+                    workspace_snapshot=workspace_snapshot,
+                    #
+                    package_filter=package_filter,
+                )
+
+        update_lock_file(
+            project_root_path,
+            #
+            upgrade_packages=upgrade_packages,
+        )
+
+    with timed("get_dependencies_from_project"):
+        dependencies_registry = get_dependencies_from_project(workdir=project_root_path)
+    set_timings_count("lock_packages", len(dependencies_registry.root))
+
+    return dependencies_registry
+
+
+def select_upgrade_packages(
+    *,
+    uv_lock_snapshot: FileSnapshot,
+    #
+    package_filter: PackageFilter | None = None,
+) -> list[PackageName] | None:
+    """Packages to upgrade in uv.lock. None means all of them."""
+    if package_filter is None:
+        return None
+
+    logger = logging.getLogger(__name__)
+
+    # Note: uv doesn't support globs. So, expand them against the current lock.
+    upgrade_packages = package_filter.select(parse_from_uv_lock_file(uv_lock_snapshot.get_text()).root)
+    if upgrade_packages:
+        logger.info(f"Upgrade only selected packages: {', '.join(upgrade_packages)}")
+    else:
+        logger.warning("No packages in uv.lock match the selection. Nothing to upgrade.")
+    return upgrade_packages
@@ -0,0 +1,13 @@
+from .compare_versions import bump_compatible_release, is_newer_version, is_same_version
+from .models import ParsedVersion, VersionKey
+from .parse_version import InvalidVersionError, parse_version
+
+__all__ = [
+    "InvalidVersionError",
+    "ParsedVersion",
+    "VersionKey",
+    "bump_compatible_release",
+    "is_newer_version",
+    "is_same_version",
+    "parse_version",
+]
@@ -0,0 +1,60 @@
+from uv_upx.services.versions.parse_version import InvalidVersionError, parse_version
+
+
+def is_same_version(
+    version_a: str,
+    version_b: str,
+) -> bool:
+    """Tell if versions are equal by PEP 440. Like `2.0` and `2.0.0`.
+
+    Invalid versions are compared as strings.
+    """
+    if version_a == version_b:
+        return True
+    try:
+        return parse_version(version_a).key == parse_version(version_b).key
+    except InvalidVersionError:
+        return False
+
+
+def is_newer_version(
+    version: str,
+    than: str,
+) -> bool:
+    """Tell if the version is newer by PEP 440. Like `1.10` than `1.9`.
+
+    Invalid versions are compared as strings. So, any other version is "newer".
+    """
+    try:
+        return parse_version(version).key > parse_version(than).key
+    except InvalidVersionError:
+        return version != than
+
+
+def bump_compatible_release(
+    version: str,
+    version_new: str,
+) -> str | None:
+    """Move the version of the compatible release clause (`~=`) to the new version. Keep the precision.
+
+    Like `~=1.4` with `1.7.2` to `~=1.7`. And `~=1.4.2` with `1.4.5` to `~=1.4.5`.
+
+    Returns:
+        None, if there is nothing to bump. Or the bumped version would exclude the new one. Like `1.7rc1` for `~=1.4`.
+    """
+    try:
+        parsed = parse_version(version)
+        parsed_new = parse_version(version_new)
+    except InvalidVersionError:
+        return None
+
+    precision = len(parsed.release)
+    release = (*parsed_new.release[:precision], *(0,) * (precision - len(parsed_new.release)))
+    bumped = ".".join(map(str, release))
+    if parsed_new.epoch:
+        bumped = f"{parsed_new.epoch}!{bumped}"
+
+    bumped_key = parse_version(bumped).key
+    if bumped_key <= parsed.key or bumped_key > parsed_new.key:
+        return None
+    return bumped
@@ -0,0 +1,87 @@
+import dataclasses
+from typing import Final
+
+type PreReleaseKey = tuple[int, ...]
+"""`(-1,)` for dev-releases without a pre-release. `(0, phase, number)` for pre-releases. `(1,)` otherwise."""
+
+type DevReleaseKey = tuple[int, ...]
+"""`(0, number)` for dev-releases. `(1,)` otherwise. So, dev-releases are before the release."""
+
+type LocalSegmentKey = tuple[int, int, str]
+"""`(1, number, "")` for numeric segments. `(0, 0, text)` for others. Numeric segments are after text ones."""
+
+type VersionKey = tuple[int, tuple[int, ...], PreReleaseKey, int, DevReleaseKey, tuple[LocalSegmentKey, ...]]
+"""Sort key of a version. Equal keys mean equal versions. Like `1.0` and `1.0.0`."""
+
+PRE_RELEASE_PHASES: Final[tuple[str, ...]] = ("a", "b", "rc")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ParsedVersion:
+    """Version, normalized by PEP 440.
+
+    https://peps.python.org/pep-0440/
+    """
+
+    epoch: int
+    release: tuple[int, ...]
+
+    pre: tuple[str, int] | None = None
+    """Phase (`a`, `b` or `rc`) and number."""
+
+    post: int | None = None
+    dev: int | None = None
+
+    local: tuple[str | int, ...] | None = None
+
+    key: VersionKey = dataclasses.field(init=False, repr=False, compare=False)
+    """Computed once. Versions are compared with it."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key", self.compute_key())
+
+    def compute_key(self) -> VersionKey:
+        release = self.release
+        # Note: Trailing zeros don't matter. `1.0` is the same as `1.0.0`.
+        while len(release) > 1 and release[-1] == 0:
+            release = release[:-1]
+
+        pre_key: PreReleaseKey
+        if self.pre is not None:
+            phase, number = self.pre
+            pre_key = (0, PRE_RELEASE_PHASES.index(phase), number)
+        elif self.post is None and self.dev is not None:
+            # Note: `1.0.dev0` is before `1.0a0`.
+            pre_key = (-1,)
+        else:
+            pre_key = (1,)
+
+        post_key = -1 if self.post is None else self.post
+        dev_key: DevReleaseKey = (1,) if self.dev is None else (0, self.dev)
+
+        local_key: tuple[LocalSegmentKey, ...] = ()
+        if self.local is not None:
+            local_key = tuple(
+                (1, segment, "") if isinstance(segment, int) else (0, 0, segment) for segment in self.local
+            )
+
+        return self.epoch, release, pre_key, post_key, dev_key, local_key
+
+    @property
+    def is_prerelease(self) -> bool:
+        return self.pre is not None or self.dev is not None
+
+    def __str__(self) -> str:
+        parts: list[str] = []
+        if self.epoch:
+            parts.append(f"{self.epoch}!")
+        parts.append(".".join(map(str, self.release)))
+        if self.pre is not None:
+            parts.append(f"{self.pre[0]}{self.pre[1]}")
+        if self.post is not None:
+            parts.append(f".post{self.post}")
+        if self.dev is not None:
+            parts.append(f".dev{self.dev}")
+        if self.local is not None:
+            parts.append(f"+{'.'.join(map(str, self.local))}")
+        return "".join(parts)
@@ -0,0 +1,101 @@
+import functools
+import re
+from re import Pattern
+from typing import Final
+
+from uv_upx.services.versions.models import ParsedVersion
+
+PARSE_VERSION_CACHE_MAX_SIZE: Final[int] = 16_384
+"""Max number of distinct version strings to keep parsed. Enough for big uv.lock files."""
+
+# https://peps.python.org/pep-0440/#appendix-b-parsing-version-strings-with-regular-expressions
+PATTERN_I_VERSION: Final[Pattern[str]] = re.compile(
+    r"""^\s*
+v?
+(?:(?P<epoch>[0-9]+)!)?
+(?P<release>[0-9]+(?:\.[0-9]+)*)
+(?P<pre>
+    [-_.]?
+    (?P<pre_phase>alpha|a|beta|b|preview|pre|c|rc)
+    [-_.]?
+    (?P<pre_number>[0-9]+)?
+)?
+(?P<post>
+    (?:-(?P<post_implicit>[0-9]+))
+    |
+    (?:
+        [-_.]?
+        (?:post|rev|r)
+        [-_.]?
+        (?P<post_number>[0-9]+)?
+    )
+)?
+(?P<dev>
+    [-_.]?
+    dev
+    [-_.]?
+    (?P<dev_number>[0-9]+)?
+)?
+(?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+PATTERN_I_LOCAL_SEPARATOR: Final[Pattern[str]] = re.compile(r"[-_.]")
+
+PRE_RELEASE_PHASES_I_ALIASES: Final[dict[str, str]] = {
+    "alpha": "a",
+    "a": "a",
+    "beta": "b",
+    "b": "b",
+    "preview": "rc",
+    "pre": "rc",
+    "c": "rc",
+    "rc": "rc",
+}
+
+
+class InvalidVersionError(ValueError):
+    pass
+
+
+@functools.lru_cache(maxsize=PARSE_VERSION_CACHE_MAX_SIZE)
+def parse_version(version: str) -> ParsedVersion:
+    """Parse and normalize the version by PEP 440. Cached. So, each distinct string is parsed once.
+
+    Raises:
+        InvalidVersionError: if the version is not valid by PEP 440. For example, a wildcard like `1.*`.
+    """
+    match = PATTERN_I_VERSION.match(version)
+    if match is None:
+        msg = f"Invalid version: '{version}'"
+        raise InvalidVersionError(msg)
+
+    pre: tuple[str, int] | None = None
+    if match["pre_phase"] is not None:
+        pre = PRE_RELEASE_PHASES_I_ALIASES[match["pre_phase"].lower()], int(match["pre_number"] or 0)
+
+    post: int | None = None
+    if match["post"] is not None:
+        post = int(match["post_implicit"] or match["post_number"] or 0)
+
+    local: tuple[str | int, ...] | None = None
+    if match["local"] is not None:
+        local = tuple(
+            int(segment) if segment.isdigit() else segment.lower()
+            for segment in PATTERN_I_LOCAL_SEPARATOR.split(match["local"])
+        )
+
+    return ParsedVersion(
+        epoch=int(match["epoch"] or 0),
+        release=tuple(int(part) for part in match["release"].split(".")),
+        pre=pre,
+        post=post,
+        dev=int(match["dev_number"] or 0) if match["dev"] is not None else None,
+        local=local,
+    )
+
+
+def get_parse_version_cache_info() -> functools._CacheInfo:  # pyright: ignore[reportPrivateUsage]
+    """Get stats of the parse cache. Hits, misses, size."""
+    return parse_version.cache_info()
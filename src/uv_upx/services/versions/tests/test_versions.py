@@ -0,0 +1,138 @@
+import pytest
+
+from uv_upx.services.versions import (
+    InvalidVersionError,
+    bump_compatible_release,
+    is_newer_version,
+    is_same_version,
+    parse_version,
+)
+from uv_upx.services.versions.parse_version import get_parse_version_cache_info
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("1.0", "1.0"),
+        ("v1.0", "1.0"),
+        ("1!2.0", "1!2.0"),
+        ("1.0-alpha.1", "1.0a1"),
+        ("1.0preview2", "1.0rc2"),
+        ("1.0c3", "1.0rc3"),
+        ("1.0-1", "1.0.post1"),
+        ("1.0.rev", "1.0.post0"),
+        ("1.0-DEV", "1.0.dev0"),
+        ("1.0+Ubuntu-1", "1.0+ubuntu.1"),
+    ],
+)
+def test_parse_version_normalizes(
+    version: str,
+    expected: str,
+) -> None:
+    assert str(parse_version(version)) == expected
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "",
+        "1.*",
+        "latest",
+        "1.0+",
+    ],
+)
+def test_parse_version_invalid(
+    version: str,
+) -> None:
+    with pytest.raises(InvalidVersionError):
+        parse_version(version)
+
+
+def test_parse_version_ordering() -> None:
+    versions = [
+        "1.0.dev0",
+        "1.0a1.dev1",
+        "1.0a1",
+        "1.0b1",
+        "1.0rc1",
+        "1.0",
+        "1.0+local.1",
+        "1.0+local.2",
+        "1.0.post1.dev0",
+        "1.0.post1",
+        "1.1",
+        "1.10",
+        "1!0.1",
+    ]
+    keys = [parse_version(version).key for version in versions]
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+
+
+def test_parse_version_is_cached() -> None:
+    parse_version.cache_clear()
+
+    first = parse_version("3.14.0")
+    second = parse_version("3.14.0")
+
+    assert first is second
+    cache_info = get_parse_version_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    ("version_a", "version_b", "expected"),
+    [
+        ("2.0", "2.0.0", True),
+        ("2.0", "v2.0", True),
+        ("2.0", "2.0.1", False),
+        ("2.0", "2.0+local", False),
+        ("1.*", "1.*", True),
+        ("1.*", "1.0", False),
+    ],
+)
+def test_is_same_version(
+    version_a: str,
+    version_b: str,
+    expected: bool,  # noqa: FBT001
+) -> None:
+    assert is_same_version(version_a, version_b) is expected
+
+
+@pytest.mark.parametrize(
+    ("version", "than", "expected"),
+    [
+        ("1.10", "1.9", True),
+        ("1.9", "1.10", False),
+        ("2.0.0", "2.0", False),
+        ("2.0rc1", "2.0", False),
+        ("2.0.post1", "2.0", True),
+        ("1.*", "1.0", True),
+    ],
+)
+def test_is_newer_version(
+    version: str,
+    than: str,
+    expected: bool,  # noqa: FBT001
+) -> None:
+    assert is_newer_version(version, than=than) is expected
+
+
+@pytest.mark.parametrize(
+    ("version", "version_new", "expected"),
+    [
+        ("1.4", "1.7.2", "1.7"),
+        ("1.4.2", "1.4.5", "1.4.5"),
+        ("1.4.2", "1.7", "1.7.0"),
+        ("1.4", "1.4.9", None),
+        ("1.4", "1.7rc1", None),
+        ("1.4", "1.3", None),
+        ("1.4", "1.*", None),
+    ],
+)
+def test_bump_compatible_release(
+    version: str,
+    version_new: str,
+    expected: str | None,
+) -> None:
+    assert bump_compatible_release(version, version_new) == expected
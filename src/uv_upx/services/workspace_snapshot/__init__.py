@@ -0,0 +1,7 @@
+from .build_workspace_snapshot import build_workspace_snapshot
+from .models import WorkspaceSnapshot
+
+__all__ = [
+    "WorkspaceSnapshot",
+    "build_workspace_snapshot",
+]
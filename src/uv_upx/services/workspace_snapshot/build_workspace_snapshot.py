@@ -0,0 +1,66 @@
+import logging
+from typing import TYPE_CHECKING
+
+from uv_upx.services.concurrency import ExecutorKind
+from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.parse_v2.collect_dependencies import collect_top_level_dependencies
+from uv_upx.services.timings import set_timings_count, timed
+from uv_upx.services.workspace_snapshot.models import WorkspaceSnapshot
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@timed("build_workspace_snapshot")
+def build_workspace_snapshot(  # noqa: PLR0913
+    project_root_path: pathlib.Path,
+    *,
+    preserve_original_package_names: bool = False,
+    #
+    verbose: bool = False,
+    #
+    jobs: int = 1,
+    executor_kind: ExecutorKind = ExecutorKind.THREAD,
+    #
+    use_discovery_cache: bool = False,
+) -> WorkspaceSnapshot:
+    """Discover, read and parse all pyproject.toml files of the workspace once."""
+    logger = logging.getLogger(__name__)
+
+    with timed("get_all_pyprojects"):
+        py_projects = get_all_pyprojects_by_project_root_path(
+            project_root_path,
+            jobs=jobs,
+            executor_kind=executor_kind,
+            #
+            use_discovery_cache=use_discovery_cache,
+        )
+    set_timings_count("py_project_files", len(py_projects.items))
+
+    if verbose:
+        logger.info(f"Found {len(py_projects.items)} pyproject.toml files in the workspace.")
+        for py_project in py_projects.items:
+            logger.info(f"  {py_project.path.as_uri()}")
+
+    with timed("collect_top_level_dependencies"):
+        collected_top_level_dependencies = collect_top_level_dependencies(
+            py_projects=py_projects,
+            #
+            preserve_original_package_names=preserve_original_package_names,
+            #
+            verbose=verbose,
+        )
+    set_timings_count(
+        "dependencies",
+        sum(
+            len(group.parsed_dependencies)
+            for py_project in collected_top_level_dependencies.parsed_pyprojects
+            for group in py_project.dependency_groups_parsed
+        ),
+    )
+
+    return WorkspaceSnapshot(
+        project_root_path=project_root_path,
+        py_projects=py_projects,
+        collected_top_level_dependencies=collected_top_level_dependencies,
+    )
@@ -0,0 +1,25 @@
+import pathlib
+
+from pydantic import BaseModel, ConfigDict
+
+from uv_upx.services.get_all_pyprojects import PyProjectsRegistry
+from uv_upx.services.parse_v2.collect_dependencies import CollectedTopLevelDependencies
+
+
+class WorkspaceSnapshot(BaseModel):
+    """Workspace state, discovered, read and parsed once per run.
+
+    Shared by every phase instead of re-reading the tree.
+    """
+
+    project_root_path: pathlib.Path
+
+    py_projects: PyProjectsRegistry
+    """All pyproject.toml files of the workspace. Root first."""
+
+    collected_top_level_dependencies: CollectedTopLevelDependencies
+    """Parsed dependency groups. References the same TOML documents as `py_projects`."""
+
+    model_config = ConfigDict(
+        frozen=True,
+    )
@@ -0,0 +1,119 @@
+"""Generators of synthetic workspaces and lock files. For tests and benchmarks."""
+
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import pathlib
+
+DEPENDENCY_TEMPLATES: Final[tuple[str, ...]] = (
+    "{name}>=0.1",
+    "{name}[extra-a,extra-b]>=0.1.0",
+    "{name}>=0.1,<99",
+    "{name}==0.0.1",
+    "{name}~=0.1",
+    "{name}",
+    "{name}>=0.1; python_version >= '3.10'",
+)
+"""Typical dependency strings. All supported by the parser."""
+
+
+def make_package_name(index: int) -> str:
+    """Raw (not normalized) name of the synthetic package. Like in `make_uv_lock_content`."""
+    return f"Package_{index}"
+
+
+def make_dependency_strings(count: int, *, packages_count: int = 100) -> list[str]:
+    """Generate dependency strings. Names repeat every `packages_count` items."""
+    return [
+        DEPENDENCY_TEMPLATES[index % len(DEPENDENCY_TEMPLATES)].format(name=make_package_name(index % packages_count))
+        for index in range(count)
+    ]
+
+
+def make_uv_lock_content(packages_count: int) -> str:
+    """Generate a synthetic uv.lock with wheels and dependencies for each package."""
+    parts: list[str] = [
+        'version = 1\nrevision = 3\nrequires-python = ">=3.14"\n',
+    ]
+    for index in range(packages_count):
+        name = make_package_name(index)
+        version = f"{index % 7}.{index % 13}.{index}"
+        wheels = "".join(
+            f'    {{ url = "https://files.example.org/{name}-{version}-cp3{tag}-none-any.whl", '
+            f'hash = "sha256:{index:064x}", size = {index + tag} }},\n'
+            for tag in range(8)
+        )
+        parts.append(
+            f"\n[[package]]\n"
+            f'name = "{name}"\n'
+            f'version = "{version}"\n'
+            f'source = {{ registry = "https://pypi.org/simple" }}\n'
+            f"dependencies = [\n"
+            f'    {{ name = "package-{(index + 1) % packages_count}" }},\n'
+            f"]\n"
+            f'sdist = {{ url = "https://files.example.org/{name}-{version}.tar.gz", hash = "sha256:{index:064x}" }}\n'
+            f"wheels = [\n{wheels}]\n",
+        )
+    return "".join(parts)
+
+
+def make_py_project_content(
+    name: str,
+    dependencies: list[str],
+    *,
+    workspace_members: list[str] | None = None,
+) -> str:
+    """Generate pyproject.toml with all supported dependency sections. With comments."""
+    third = max(len(dependencies) // 3, 1)
+    main, optional, dev = dependencies[:third], dependencies[third : 2 * third], dependencies[2 * third :]
+
+    def as_array(items: list[str]) -> str:
+        lines = "".join(f'    "{item}", # comment {index}\n' for index, item in enumerate(items))
+        return f"[\n    # leading comment\n{lines}]"
+
+    parts = [
+        f'[project]\nname = "{name}"\nversion = "0.1.0"\nrequires-python = ">=3.14"\n',
+        f"dependencies = {as_array(main)}\n",
+        f"\n[project.optional-dependencies]\nextra = {as_array(optional)}\n",
+        f"\n[dependency-groups]\ndev = {as_array(dev)}\n",
+    ]
+    if workspace_members is not None:
+        members = ", ".join(f'"{member}"' for member in workspace_members)
+        parts.append(f"\n[tool.uv.workspace]\nmembers = [{members}]\n")
+    return "".join(parts)
+
+
+def make_workspace(
+    root_path: pathlib.Path,
+    *,
+    members_count: int,
+    dependencies_per_member: int = 12,
+    packages_count: int = 100,
+) -> pathlib.Path:
+    """Generate a workspace with `members_count` pyproject.toml files (the root included) and uv.lock.
+
+    All dependencies are present in the lock. Most of them have a newer version there.
+    """
+    dependencies = make_dependency_strings(dependencies_per_member * members_count, packages_count=packages_count)
+
+    def get_dependencies(member_index: int) -> list[str]:
+        return dependencies[member_index * dependencies_per_member : (member_index + 1) * dependencies_per_member]
+
+    (root_path / "pyproject.toml").write_text(
+        make_py_project_content(
+            "root",
+            get_dependencies(0),
+            workspace_members=["packages/*"] if members_count > 1 else None,
+        ),
+        encoding="utf-8",
+    )
+    for member_index in range(1, members_count):
+        member_path = root_path / "packages" / f"member-{member_index}"
+        member_path.mkdir(parents=True)
+        (member_path / "pyproject.toml").write_text(
+            make_py_project_content(f"member-{member_index}", get_dependencies(member_index)),
+            encoding="utf-8",
+        )
+
+    (root_path / "uv.lock").write_text(make_uv_lock_content(packages_count), encoding="utf-8")
+    return root_path
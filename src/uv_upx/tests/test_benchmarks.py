@@ -0,0 +1,195 @@
+"""Benchmarks of the hot paths. On synthetic workspaces and lock files.
+
+Run with: poe bench
+"""
+
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from uv_upx.services.collect_dependencies.collect_groups_from_py_project import collect_from_py_project
+from uv_upx.services.dependencies_from_project.parse_from_uv_lock_file import parse_from_uv_lock_file
+from uv_upx.services.dependency_up.handle_groups import handle_py_projects_v2
+from uv_upx.services.dependency_up.parse_dependency import parse_dependency, parse_dependency_i_uncached
+from uv_upx.services.file_snapshot import FileSnapshot
+from uv_upx.services.get_all_pyprojects import get_all_pyprojects_by_project_root_path
+from uv_upx.services.get_all_pyprojects.get_all_pyprojects import load_py_project
+from uv_upx.services.lock_diff import compute_lock_diff
+from uv_upx.services.parse_v2.collect_dependencies import collect_top_level_dependencies
+from uv_upx.services.updater.rollback_updater import RollbackData
+from uv_upx.services.upgrade_profile import UpgradeProfile
+from uv_upx.services.workspace_snapshot import build_workspace_snapshot
+from uv_upx.tests.synthetic import make_dependency_strings, make_uv_lock_content, make_workspace
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+WORKSPACE_MEMBERS_COUNTS = [1, 50, 500]
+UV_LOCK_PACKAGES_COUNTS = [100, 1_000, 10_000]
+
+
+def measure_memory_peak(
+    benchmark: BenchmarkFixture,
+    func: Callable[..., Any],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """Run the function once more under tracemalloc. Save the peak into the benchmark results.
+
+    Separate run. So, tracemalloc overhead does not affect timings.
+    """
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["memory_peak_bytes"] = peak
+
+
+@pytest.fixture(params=WORKSPACE_MEMBERS_COUNTS, ids=lambda count: f"members_{count}")
+def workspace_path(request: pytest.FixtureRequest, tmp_path: pathlib.Path) -> pathlib.Path:
+    return make_workspace(tmp_path, members_count=request.param)
+
+
+@pytest.mark.benchmark(group="parse_dependency")
+@pytest.mark.parametrize(
+    "parser",
+    [
+        pytest.param(parse_dependency, id="cached"),
+        pytest.param(parse_dependency_i_uncached, id="uncached"),
+    ],
+)
+def test_benchmark_parse_dependency(
+    benchmark: BenchmarkFixture,
+    parser: Callable[[str], object],
+) -> None:
+    dependency_strings = make_dependency_strings(10_000, packages_count=500)
+
+    def run() -> None:
+        for dependency_string in dependency_strings:
+            parser(dependency_string)
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    measure_memory_peak(benchmark, run)
+
+
+@pytest.mark.benchmark(group="parse_from_uv_lock_file")
+@pytest.mark.parametrize("packages_count", UV_LOCK_PACKAGES_COUNTS)
+def test_benchmark_parse_from_uv_lock_file_by_size(
+    benchmark: BenchmarkFixture,
+    packages_count: int,
+) -> None:
+    content = make_uv_lock_content(packages_count)
+
+    result = benchmark.pedantic(parse_from_uv_lock_file, args=(content,), rounds=5, iterations=1)
+    measure_memory_peak(benchmark, parse_from_uv_lock_file, content)
+
+    assert len(result.root) == packages_count
+
+
+@pytest.mark.benchmark(group="compute_lock_diff")
+@pytest.mark.parametrize("packages_count", UV_LOCK_PACKAGES_COUNTS)
+def test_benchmark_compute_lock_diff_by_size(
+    benchmark: BenchmarkFixture,
+    packages_count: int,
+) -> None:
+    content_before = make_uv_lock_content(packages_count)
+    # Note: Every package is upgraded. The worst case for the report.
+    content_after = make_uv_lock_content(packages_count).replace('version = "', 'version = "1')
+
+    result = benchmark.pedantic(compute_lock_diff, args=(content_before, content_after), rounds=5, iterations=1)
+    measure_memory_peak(benchmark, compute_lock_diff, content_before, content_after)
+
+    assert len(result.entries) == packages_count
+
+
+@pytest.mark.benchmark(group="collect_from_py_project")
+def test_benchmark_collect_from_py_project(
+    benchmark: BenchmarkFixture,
+    tmp_path: pathlib.Path,
+) -> None:
+    workspace_path = make_workspace(tmp_path, members_count=1, dependencies_per_member=300)
+    py_project = load_py_project(workspace_path / "pyproject.toml")
+
+    def run() -> None:
+        for group in collect_from_py_project(py_project.data):
+            for dependency in group.dependencies:
+                parse_dependency(dependency)
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    measure_memory_peak(benchmark, run)
+
+
+@pytest.mark.benchmark(group="get_all_pyprojects")
+def test_benchmark_get_all_pyprojects(
+    benchmark: BenchmarkFixture,
+    workspace_path: pathlib.Path,
+) -> None:
+    result = benchmark.pedantic(get_all_pyprojects_by_project_root_path, args=(workspace_path,), rounds=3, iterations=1)
+    measure_memory_peak(benchmark, get_all_pyprojects_by_project_root_path, workspace_path)
+
+    assert result.items
+
+
+@pytest.mark.benchmark(group="collect_top_level_dependencies")
+def test_benchmark_collect_top_level_dependencies(
+    benchmark: BenchmarkFixture,
+    workspace_path: pathlib.Path,
+) -> None:
+    py_projects = get_all_pyprojects_by_project_root_path(workspace_path)
+
+    def run() -> None:
+        collect_top_level_dependencies(py_projects=py_projects)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    measure_memory_peak(benchmark, run)
+
+
+@pytest.mark.benchmark(group="handle_py_projects_v2")
+def test_benchmark_handle_py_projects_v2(
+    benchmark: BenchmarkFixture,
+    workspace_path: pathlib.Path,
+) -> None:
+    dependencies_registry = parse_from_uv_lock_file((workspace_path / "uv.lock").read_text(encoding="utf-8"))
+    pristine_snapshot = build_workspace_snapshot(workspace_path)
+
+    def setup() -> tuple[tuple[()], dict[str, Any]]:
+        # Note: Each round writes the files and changes the snapshot. So, start from the original state.
+        for py_project in pristine_snapshot.py_projects.items:
+            py_project.snapshot.restore()
+        workspace_snapshot = build_workspace_snapshot(workspace_path)
+        return (), {
+            "dependencies_registry": dependencies_registry,
+            "workspace_snapshot": workspace_snapshot,
+            "verbose": False,
+            "profile": UpgradeProfile.DEFAULT,
+        }
+
+    result = benchmark.pedantic(handle_py_projects_v2, setup=setup, rounds=3, iterations=1)
+
+    args, kwargs = setup()
+    measure_memory_peak(benchmark, handle_py_projects_v2, *args, **kwargs)
+
+    assert result
+
+
+@pytest.mark.benchmark(group="rollback_data_from_parts")
+def test_benchmark_rollback_data_from_parts(
+    benchmark: BenchmarkFixture,
+    workspace_path: pathlib.Path,
+) -> None:
+    workspace_snapshot = build_workspace_snapshot(workspace_path)
+    uv_lock_snapshot = FileSnapshot.from_path(workspace_path / "uv.lock")
+
+    def run() -> RollbackData:
+        return RollbackData.from_parts(uv_lock=uv_lock_snapshot, workspace_snapshot=workspace_snapshot)
+
+    result = benchmark(run)
+    measure_memory_peak(benchmark, run)
+
+    assert len(result.get_files()) == len(workspace_snapshot.py_projects.items) + 1
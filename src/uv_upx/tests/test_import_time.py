@@ -0,0 +1,64 @@
+"""Startup stays fast. Heavy modules are imported only by the code paths that need them.
+
+For pre-commit hooks and `--version`. Checked by `-X importtime`.
+So, commands in `uv_upx.cli` import services inside their functions (`# noqa: PLC0415`), not at the module level.
+Then `--help` and `--version` don't import them.
+Imported modules are checked, not durations. So, it doesn't depend on the machine.
+"""
+
+import subprocess
+import sys
+from typing import Final
+
+import pytest
+
+MODULES_I_HEAVY: Final[tuple[str, ...]] = (
+    "prompt_toolkit",
+    "pydantic",
+    "tomlkit",
+    "uv_upx.services.updater",
+    "uv_upx.services.outdated_check",
+)
+
+
+def get_imported_modules(*args: str) -> set[str]:
+    """Run Python with `-X importtime`. Collect names of all imported modules."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Note: Lines are like `import time:       174 |      23410 |         typer`.
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def is_imported(module: str, imported_modules: set[str]) -> bool:
+    return any(name == module or name.startswith(f"{module}.") for name in imported_modules)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import uv_upx.main"),
+        ("-m", "uv_upx", "upgrade", "run", "--version"),
+        ("-m", "uv_upx", "--help"),
+    ],
+)
+def test_startup_skips_heavy_modules(
+    args: tuple[str, ...],
+) -> None:
+    imported_modules = get_imported_modules(*args)
+
+    assert "uv_upx.cli.main" in imported_modules
+    assert [module for module in MODULES_I_HEAVY if is_imported(module, imported_modules)] == []
+
+
+def test_interactive_mode_loads_prompt_toolkit_lazily() -> None:
+    imported_modules = get_imported_modules("-c", "import uv_upx.services.dependency_up.handle_groups")
+
+    assert not is_imported("prompt_toolkit", imported_modules)